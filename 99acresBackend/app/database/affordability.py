@@ -0,0 +1,111 @@
+"""Budget search over a price-sorted property catalog.
+
+``/find-properties`` looks for listings priced between 80% and 110% of the
+buyer's budget and ranks them by an affordability score. The index keeps
+the catalog sorted by price once, so a search bisects to the budget window
+instead of scanning every listing. Down payments and scores are computed
+with NumPy over that window only, and just the requested page is picked
+with a heap and copied into response dicts.
+"""
+import heapq
+import threading
+from typing import List, Optional, Sequence
+import numpy as np
+
+BUDGET_FLOOR = 0.8  # allow 20% below budget
+BUDGET_CEILING = 1.1  # allow 10% above budget
+SHORT_SAVINGS_PENALTY = 30  # down payment exceeds savings
+OVER_BUDGET_PENALTY = 20  # price exceeds budget
+
+
+class AffordabilityResult:
+    """One page of ranked matches plus statistics over the whole budget window"""
+
+    def __init__(self, budget_min: float, budget_max: float):
+        self.budget_min = budget_min
+        self.budget_max = budget_max
+        self.properties: List[dict] = []
+        self.total_found = 0
+        self.affordable_count = 0
+        self.average_price = 0
+        self.min_price = None
+        self.max_price = None
+        self.average_down_payment = 0
+        self.recommended_property: Optional[str] = None
+
+
+class AffordabilityIndex:
+    """Price-sorted arrays over a list of property dicts, built on first search"""
+
+    def __init__(self, properties: Sequence[dict], price_field: str = "price"):
+        self.source = properties
+        self.price_field = price_field
+        self._lock = threading.Lock()
+        self._properties: Optional[List[dict]] = None
+        self._prices: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None  # catalog position, the tie-breaker
+
+    def rebuild(self) -> None:
+        """Re-sort after the underlying catalog changed"""
+        with self._lock:
+            positions = sorted(range(len(self.source)), key=lambda i: self.source[i][self.price_field])
+            self._properties = [self.source[i] for i in positions]
+            self._prices = np.array([p[self.price_field] for p in self._properties], dtype=float)
+            self._order = np.array(positions, dtype=int)
+
+    def search(
+        self,
+        total_budget: float,
+        loan_amount: float,
+        savings: float,
+        skip: int = 0,
+        limit: int = 20
+    ) -> AffordabilityResult:
+        """Rank the listings in the budget window, best score first (ties in catalog order)"""
+        if self._prices is None:
+            self.rebuild()
+
+        result = AffordabilityResult(total_budget * BUDGET_FLOOR, total_budget * BUDGET_CEILING)
+        lo = int(np.searchsorted(self._prices, result.budget_min, side="left"))
+        hi = int(np.searchsorted(self._prices, result.budget_max, side="right"))
+        if lo >= hi:
+            return result
+
+        prices = self._prices[lo:hi]
+        down_payments = prices - loan_amount
+        affordable = down_payments <= savings
+        scores = (
+            100
+            - SHORT_SAVINGS_PENALTY * ~affordable
+            - OVER_BUDGET_PENALTY * (prices > total_budget)
+        )
+
+        # Ascending key = best score first, then catalog order
+        keys = list(zip((-scores).tolist(), self._order[lo:hi].tolist()))
+        ranked = heapq.nsmallest(skip + limit, range(len(keys)), key=keys.__getitem__)
+
+        down_rounded = np.round(down_payments)
+        percentages = down_payments / prices * 100
+        for i in ranked[skip:]:
+            listing = self._properties[lo + i]
+            result.properties.append({
+                **listing,
+                "financing_details": {
+                    "property_price": listing[self.price_field],
+                    "loan_amount": loan_amount,
+                    "down_payment_needed": int(down_rounded[i]),
+                    "down_payment_percentage": round(float(percentages[i]), 1),
+                    "affordability_score": int(scores[i]),
+                    "is_affordable": bool(affordable[i]),
+                }
+            })
+
+        best = ranked[0] if ranked else min(range(len(keys)), key=keys.__getitem__)
+        result.recommended_property = self._properties[lo + best].get("title")
+        result.total_found = len(prices)
+        result.affordable_count = int(affordable.sum())
+        result.average_price = round(float(prices.mean()))
+        result.min_price = self._properties[lo][self.price_field]
+        result.max_price = self._properties[hi - 1][self.price_field]
+        result.average_down_payment = round(float(down_rounded.mean()))
+        return result
@@ -0,0 +1,181 @@
+"""Campaign fan-out: recipientList -> chunked send jobs -> email outbox.
+
+``start_campaign_send`` splits a campaign's ``recipientList`` into
+``campaign_jobs`` documents of ``CAMPAIGN_CHUNK_SIZE`` recipients and
+returns immediately. The dispatcher task claims one job at a time, renders
+the campaign's subject and body (compiled once per campaign) for each
+recipient and queues the whole chunk into the outbox with a single
+``insert_many``. A job whose dispatcher died mid-way is claimed again after
+the outbox lease expires. Delivery speed is then governed by the outbox worker's
+``EMAIL_SEND_RATE``; ``emailsSent`` and ``emailsOpened`` are counted
+through the buffered ``$inc`` counters.
+"""
+import asyncio
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from bson import ObjectId
+from pymongo import ReturnDocument
+from app.config import settings
+from app.database import campaign_rollups
+from app.database.email_outbox import CLAIM_LEASE, enqueue_emails
+from app.database.mongodb import get_database
+
+JOBS_COLLECTION = "campaign_jobs"
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class CompiledTemplate:
+    """A ``{{name}}``-style template split once into literal and variable parts"""
+
+    def __init__(self, source: str):
+        # re.split with one group alternates literal, variable, literal, ...
+        self.parts = PLACEHOLDER.split(source or "")
+
+    def render(self, context: Dict[str, str]) -> str:
+        parts = self.parts
+        return "".join(
+            part if i % 2 == 0 else str(context.get(part, ""))
+            for i, part in enumerate(parts)
+        )
+
+
+def _tracking_pixel(campaign_id: ObjectId) -> str:
+    if not settings.CAMPAIGN_TRACKING_URL:
+        return ""
+    url = f"{settings.CAMPAIGN_TRACKING_URL.rstrip('/')}/api/campaigns/{campaign_id}/open.gif"
+    return f'<img src="{url}" width="1" height="1" alt="" style="display:none">'
+
+
+async def start_campaign_send(campaign: dict) -> Tuple[int, int]:
+    """Split the campaign's recipients into send jobs; returns (recipients, jobs)"""
+    db = get_database()
+    # Drop duplicates but keep the order recipients were entered in
+    recipients = list(dict.fromkeys(r.strip() for r in campaign.get("recipientList") or [] if r and r.strip()))
+    if not recipients:
+        return 0, 0
+
+    chunk_size = max(1, settings.CAMPAIGN_CHUNK_SIZE)
+    now = datetime.utcnow()
+    jobs = [
+        {
+            "campaign_id": campaign["_id"],
+            "recipients": recipients[offset:offset + chunk_size],
+            "status": "pending",
+            "created_at": now,
+        }
+        for offset in range(0, len(recipients), chunk_size)
+    ]
+    await db[JOBS_COLLECTION].insert_many(jobs)
+    update = {
+        "status": "active",
+        "dispatch": {"status": "queued", "total": len(recipients), "jobs": len(jobs), "started_at": now},
+        "recipients": len(recipients),
+        "updated_at": now,
+    }
+    # The status change moves the campaign between rollup buckets
+    before = await db.campaigns.find_one_and_update(
+        {"_id": campaign["_id"]},
+        {"$set": update},
+        return_document=ReturnDocument.BEFORE
+    )
+    if before:
+        await campaign_rollups.apply_delta(before.get("owner_id"), before, {**before, **update})
+    return len(recipients), len(jobs)
+
+
+class CampaignDispatcher:
+    """Expands campaign send jobs into outbox messages"""
+
+    def __init__(self):
+        self._templates: Dict[ObjectId, Tuple[CompiledTemplate, CompiledTemplate, str]] = {}
+
+    async def _templates_for(self, campaign_id: ObjectId) -> Optional[Tuple[CompiledTemplate, CompiledTemplate, str]]:
+        if campaign_id not in self._templates:
+            campaign = await get_database().campaigns.find_one(
+                {"_id": campaign_id}, {"subject": 1, "emailContent": 1}
+            )
+            if not campaign:
+                return None
+            self._templates[campaign_id] = (
+                CompiledTemplate(campaign.get("subject") or ""),
+                CompiledTemplate(campaign.get("emailContent") or ""),
+                _tracking_pixel(campaign_id)
+            )
+        return self._templates[campaign_id]
+
+    async def _claim(self) -> Optional[dict]:
+        # A job left "running" by a dispatcher that died is retried once its
+        # lease expires; the outbox's unique index drops recipients it already queued
+        now = datetime.utcnow()
+        return await get_database()[JOBS_COLLECTION].find_one_and_update(
+            {"$or": [
+                {"status": "pending"},
+                {"status": "running", "claimed_at": {"$lt": now - CLAIM_LEASE}},
+            ]},
+            {"$set": {"status": "running", "claimed_at": now}},
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _names(self, recipients: List[str]) -> Dict[str, str]:
+        # One lookup per chunk for registered users' names
+        cursor = get_database().users.find({"email": {"$in": recipients}}, {"email": 1, "full_name": 1})
+        return {doc["email"]: doc.get("full_name") or "" async for doc in cursor}
+
+    async def process_job(self) -> bool:
+        """Expand one job into the outbox; returns False when no job was pending"""
+        db = get_database()
+        job = await self._claim()
+        if job is None:
+            return False
+
+        campaign_id = job["campaign_id"]
+        templates = await self._templates_for(campaign_id)
+        if templates is None:
+            await db[JOBS_COLLECTION].update_one({"_id": job["_id"]}, {"$set": {"status": "cancelled"}})
+            return True
+
+        subject, body, pixel = templates
+        names = await self._names(job["recipients"])
+        messages = []
+        for email in job["recipients"]:
+            context = {"email": email, "name": names.get(email) or email.split("@")[0]}
+            messages.append({
+                "to_email": email,
+                "subject": subject.render(context),
+                "body": body.render(context) + pixel,
+                "metadata": {"campaign_id": campaign_id, "job_id": job["_id"]},
+            })
+        await enqueue_emails(messages)
+
+        await db[JOBS_COLLECTION].update_one(
+            {"_id": job["_id"]},
+            {"$set": {"status": "done", "finished_at": datetime.utcnow()}}
+        )
+        remaining = await db[JOBS_COLLECTION].count_documents(
+            {"campaign_id": campaign_id, "status": {"$in": ["pending", "running"]}}
+        )
+        if remaining == 0:
+            await db.campaigns.update_one(
+                {"_id": campaign_id},
+                {"$set": {"dispatch.status": "enqueued", "dispatch.enqueued_at": datetime.utcnow()}}
+            )
+            self._templates.pop(campaign_id, None)
+        return True
+
+    async def run(self, poll_seconds: float) -> None:
+        """Background loop: expand pending jobs, then poll"""
+        while True:
+            try:
+                processed = await self.process_job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in campaign dispatcher: {e}")
+                processed = False
+            if not processed:
+                await asyncio.sleep(poll_seconds)
+
+
+campaign_dispatcher = CampaignDispatcher()
@@ -0,0 +1,117 @@
+"""Pre-aggregated campaign statistics.
+
+``/api/campaigns/stats`` reads one ``campaign_rollups`` document by ``_id``
+(the owner id, or ``"_all"`` for the admin view) instead of grouping every
+campaign of an owner on each call. The campaign repository applies the
+difference between a campaign's old and new contribution with ``$inc`` on
+create, update and delete, to the owner's rollup and to ``"_all"``.
+``rebuild_campaign_rollups`` recomputes every document from the campaigns
+collection and runs periodically to reconcile any drift (writes made
+outside the repository, a failed delta).
+"""
+import asyncio
+from datetime import datetime
+from typing import Optional
+from pymongo import DeleteMany, ReplaceOne, UpdateOne
+from app.database.counters import _status_key
+from app.database.mongodb import get_database, get_read_database
+
+ROLLUPS_COLLECTION = "campaign_rollups"
+ALL_OWNERS = "_all"
+
+# Rollup field -> campaign field summed into it
+SUMMED_FIELDS = {
+    "total_budget": "budget",
+    "total_spent": "spent",
+    "total_impressions": "impressions",
+    "total_clicks": "clicks",
+    "total_conversions": "conversions",
+    "total_leads": "leads_generated",
+}
+
+
+def contribution(campaign: Optional[dict]) -> dict:
+    """What one campaign document adds to its owner's rollup"""
+    if not campaign:
+        return {}
+    values = {"total_campaigns": 1, f"by_status.{_status_key(campaign.get('status'))}": 1}
+    for field, source in SUMMED_FIELDS.items():
+        values[field] = campaign.get(source) or 0
+    return values
+
+
+async def apply_delta(owner_id: Optional[str], before: Optional[dict], after: Optional[dict]) -> None:
+    """``$inc`` the owner's and the global rollup by ``after - before``"""
+    old, new = contribution(before), contribution(after)
+    delta = {key: new.get(key, 0) - old.get(key, 0) for key in old.keys() | new.keys()}
+    delta = {key: value for key, value in delta.items() if value}
+    if not delta:
+        return
+
+    operations = [UpdateOne({"_id": ALL_OWNERS}, {"$inc": delta}, upsert=True)]
+    if owner_id:
+        operations.append(UpdateOne({"_id": owner_id}, {"$inc": delta}, upsert=True))
+    try:
+        await get_database()[ROLLUPS_COLLECTION].bulk_write(operations, ordered=False)
+    except Exception as e:
+        print(f"Error updating campaign rollups: {e}")
+
+
+async def rebuild_campaign_rollups() -> int:
+    """Recompute every rollup from the campaigns collection; returns the owner count"""
+    db = get_database()
+    sums = {field: {"$sum": {"$ifNull": [f"${source}", 0]}} for field, source in SUMMED_FIELDS.items()}
+    rows = await db.campaigns.aggregate([
+        {"$group": {"_id": {"owner": "$owner_id", "status": "$status"}, "count": {"$sum": 1}, **sums}},
+    ]).to_list(length=None)
+
+    now = datetime.utcnow()
+
+    def empty(owner_id: str) -> dict:
+        return {"_id": owner_id, "total_campaigns": 0, "by_status": {},
+                **{field: 0 for field in SUMMED_FIELDS}, "refreshed_at": now}
+
+    rollups = {ALL_OWNERS: empty(ALL_OWNERS)}
+    for row in rows:
+        owner_id = row["_id"].get("owner")
+        targets = [rollups[ALL_OWNERS]]
+        if owner_id:
+            targets.append(rollups.setdefault(owner_id, empty(owner_id)))
+        status = _status_key(row["_id"].get("status"))
+        for rollup in targets:
+            rollup["total_campaigns"] += row["count"]
+            rollup["by_status"][status] = rollup["by_status"].get(status, 0) + row["count"]
+            for field in SUMMED_FIELDS:
+                rollup[field] += row[field]
+
+    operations = [ReplaceOne({"_id": owner_id}, doc, upsert=True) for owner_id, doc in rollups.items()]
+    # Owners whose last campaign is gone
+    operations.append(DeleteMany({"_id": {"$nin": list(rollups)}}))
+    await db[ROLLUPS_COLLECTION].bulk_write(operations, ordered=False)
+    return len(rollups) - 1
+
+
+async def get_rollup(owner_id: Optional[str] = None) -> dict:
+    """The rollup document of one owner, or of every campaign when ``owner_id`` is None"""
+    db = get_read_database()
+    doc = await db[ROLLUPS_COLLECTION].find_one({"_id": owner_id or ALL_OWNERS})
+    if doc:
+        return doc
+
+    # Never reconciled yet: build everything once, then an absent owner has no campaigns
+    if not await db[ROLLUPS_COLLECTION].find_one({"_id": ALL_OWNERS}, {"refreshed_at": 1}):
+        await rebuild_campaign_rollups()
+        return await get_database()[ROLLUPS_COLLECTION].find_one({"_id": owner_id or ALL_OWNERS}) or {}
+    return {}
+
+
+async def run_periodic_reconcile(interval_seconds: int) -> None:
+    """Background loop that rebuilds the rollups every interval"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await rebuild_campaign_rollups()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error reconciling campaign rollups: {e}")
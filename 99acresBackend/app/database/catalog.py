@@ -0,0 +1,89 @@
+"""Lazily loaded static catalogs.
+
+The demo datasets behind several routers (premium listings, loan
+applications, success stories, subscription plans) live as JSON files in
+``app/data`` instead of module-level literals. A ``Catalog`` is a list that
+reads and decodes its file the first time it is used, so importing a
+router costs nothing and a worker that never serves a route never holds
+its data.
+
+Besides plain JSON the files use two tagged values:
+``{"$date": "2024-08-15T00:00:00"}`` for a fixed datetime and
+``{"$daysAgo": 10}`` for a datetime relative to when the catalog loads.
+"""
+import json
+import threading
+from collections.abc import MutableSequence
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def _decode(obj: dict) -> Any:
+    if len(obj) == 1:
+        if "$date" in obj:
+            return datetime.fromisoformat(obj["$date"])
+        if "$daysAgo" in obj:
+            return datetime.now() - timedelta(days=obj["$daysAgo"])
+    return obj
+
+
+def load_json(name: str) -> Any:
+    """Read ``app/data/<name>.json`` decoding the tagged date values"""
+    with open(DATA_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f, object_hook=_decode)
+
+
+class Catalog(MutableSequence):
+    """A list backed by ``app/data/<name>.json``, loaded on first access.
+
+    ``transform`` is applied to every item on load, e.g. to turn enum
+    values back into enums or dicts into Pydantic models. Mutations
+    (``append``, item updates) behave as on a normal module-level list.
+    """
+
+    def __init__(self, name: str, transform: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.transform = transform
+        self._items: Optional[List[Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def items(self) -> List[Any]:
+        if self._items is None:
+            with self._lock:
+                if self._items is None:
+                    data = load_json(self.name)
+                    self._items = [self.transform(item) for item in data] if self.transform else data
+        return self._items
+
+    @property
+    def loaded(self) -> bool:
+        return self._items is not None
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __setitem__(self, index, value) -> None:
+        self.items[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self.items[index]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def insert(self, index: int, value: Any) -> None:
+        self.items.insert(index, value)
+
+    def copy(self) -> List[Any]:
+        return self.items.copy()
+
+    def __repr__(self) -> str:
+        state = f"{len(self._items)} items" if self._items is not None else "not loaded"
+        return f"<Catalog {self.name}: {state}>"
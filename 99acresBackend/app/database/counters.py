@@ -0,0 +1,169 @@
+"""Materialized dashboard counters.
+
+The admin dashboard reads a single ``counters/{_id: "dashboard"}`` document
+instead of counting four collections on every poll. Repositories keep the
+totals and per-status breakdowns current with ``$inc`` on insert, status
+change and delete, and push new items onto a capped recent-activity ring
+buffer. Rolling windows (monthly counts, active users) and the top
+properties can't be maintained by increments alone, so a background job
+rebuilds the whole document periodically.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from app.config import settings
+from app.database.mongodb import get_database, get_read_database
+
+COUNTERS_COLLECTION = "counters"
+DASHBOARD_ID = "dashboard"
+ACTIVITY_RING_SIZE = 20
+MONTHLY_DAYS = 30
+COUNTED_COLLECTIONS = ("users", "properties", "appointments", "inquiries")
+# Collections broken down by ``status`` (user documents have no status field)
+STATUS_COLLECTIONS = ("properties", "appointments", "inquiries")
+
+_cache = {"doc": None, "expires_at": 0.0}
+
+
+def _status_key(status: Any) -> str:
+    status = getattr(status, "value", status)
+    return str(status).replace(".", "_").lstrip("$") if status is not None else "unknown"
+
+
+async def _inc(increments: dict, push: Optional[dict] = None) -> None:
+    update = {}
+    if increments:
+        update["$inc"] = increments
+    if push:
+        update["$push"] = push
+    try:
+        await get_database()[COUNTERS_COLLECTION].update_one({"_id": DASHBOARD_ID}, update, upsert=True)
+        _cache["expires_at"] = 0.0
+    except Exception as e:
+        print(f"Error updating dashboard counters: {e}")
+
+
+async def track_insert(collection: str, status: Any = None) -> None:
+    """Count a new document in the totals, its status bucket and the monthly window"""
+    increments = {f"totals.{collection}": 1, f"monthly.{collection}": 1}
+    if collection in STATUS_COLLECTIONS:
+        increments[f"by_status.{collection}.{_status_key(status)}"] = 1
+    await _inc(increments)
+
+
+async def track_delete(collection: str, status: Any = None) -> None:
+    """Remove a deleted document from the totals and its status bucket"""
+    increments = {f"totals.{collection}": -1}
+    if collection in STATUS_COLLECTIONS:
+        increments[f"by_status.{collection}.{_status_key(status)}"] = -1
+    await _inc(increments)
+
+
+async def track_status_change(collection: str, old_status: Any, new_status: Any) -> None:
+    """Move a document between status buckets"""
+    old_key, new_key = _status_key(old_status), _status_key(new_status)
+    if old_key == new_key:
+        return
+    await _inc({
+        f"by_status.{collection}.{old_key}": -1,
+        f"by_status.{collection}.{new_key}": 1,
+    })
+
+
+async def record_activity(activity_type: str, description: str, timestamp: Optional[datetime] = None) -> None:
+    """Append an entry to the recent-activity ring buffer (oldest entries fall off)"""
+    entry = {"type": activity_type, "description": description, "timestamp": timestamp or datetime.utcnow()}
+    await _inc({}, push={"recent_activities": {"$each": [entry], "$slice": -ACTIVITY_RING_SIZE}})
+
+
+async def _collection_counts(name: str, since: datetime, extra: Optional[dict] = None) -> dict:
+    """Total, status breakdown and monthly count of one collection in a single aggregation"""
+    facets = {
+        "total": [{"$count": "count"}],
+        "monthly": [{"$match": {"created_at": {"$gte": since}}}, {"$count": "count"}],
+    }
+    if name in STATUS_COLLECTIONS:
+        facets["by_status"] = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+    facets.update(extra or {})
+    result = await get_database()[name].aggregate([{"$facet": facets}]).to_list(length=1)
+    return result[0] if result else {}
+
+
+def _single(docs: list) -> int:
+    return docs[0]["count"] if docs else 0
+
+
+async def rebuild_dashboard_counters() -> dict:
+    """Recompute the dashboard document from the collections"""
+    db = get_database()
+    since = datetime.utcnow() - timedelta(days=MONTHLY_DAYS)
+    doc = {"totals": {}, "by_status": {}, "monthly": {}}
+
+    active_users = 0
+    for name in COUNTED_COLLECTIONS:
+        extra = None
+        if name == "users":
+            extra = {"active": [{"$match": {"last_login": {"$gte": since}}}, {"$count": "count"}]}
+        counts = await _collection_counts(name, since, extra)
+        doc["totals"][name] = _single(counts.get("total", []))
+        if name in STATUS_COLLECTIONS:
+            doc["by_status"][name] = {_status_key(row["_id"]): row["count"] for row in counts.get("by_status", [])}
+        doc["monthly"][name] = _single(counts.get("monthly", []))
+        if name == "users":
+            active_users = _single(counts.get("active", []))
+    doc["active_users"] = active_users
+
+    # Seed the ring buffer from the newest documents
+    activities = []
+    async for prop in db.properties.find({}, {"title": 1, "created_at": 1}).sort("created_at", -1).limit(5):
+        activities.append({"type": "property", "description": f"New property: {prop.get('title')}",
+                           "timestamp": prop.get("created_at")})
+    async for user in db.users.find({}, {"full_name": 1, "created_at": 1}).sort("created_at", -1).limit(5):
+        activities.append({"type": "user", "description": f"New user registration: {user.get('full_name')}",
+                           "timestamp": user.get("created_at")})
+    async for inquiry in db.inquiries.find({}, {"name": 1, "created_at": 1}).sort("created_at", -1).limit(5):
+        activities.append({"type": "inquiry", "description": f"New inquiry from: {inquiry.get('name')}",
+                           "timestamp": inquiry.get("created_at")})
+    activities = [activity for activity in activities if activity["timestamp"]]
+    activities.sort(key=lambda activity: activity["timestamp"])
+    doc["recent_activities"] = activities[-ACTIVITY_RING_SIZE:]
+
+    # Top properties by views with their inquiry counts in one lookup
+    doc["top_properties"] = await db.properties.aggregate([
+        {"$sort": {"views": -1}},
+        {"$limit": 5},
+        {"$lookup": {"from": "inquiries", "localField": "_id", "foreignField": "property_id", "as": "inquiries"}},
+        {"$project": {"_id": 0, "id": {"$toString": "$_id"}, "title": 1,
+                      "views": {"$ifNull": ["$views", 0]}, "inquiries_count": {"$size": "$inquiries"}}}
+    ]).to_list(length=5)
+
+    doc["refreshed_at"] = datetime.utcnow()
+    await db[COUNTERS_COLLECTION].replace_one({"_id": DASHBOARD_ID}, doc, upsert=True)
+    _cache.update(doc=doc, expires_at=time.monotonic() + settings.DASHBOARD_COUNTERS_CACHE_SECONDS)
+    return doc
+
+
+async def get_dashboard_counters() -> dict:
+    """Read the dashboard document, served from a short in-process cache"""
+    if _cache["doc"] is not None and time.monotonic() < _cache["expires_at"]:
+        return _cache["doc"]
+
+    doc = await get_read_database()[COUNTERS_COLLECTION].find_one({"_id": DASHBOARD_ID})
+    if not doc or "refreshed_at" not in doc:
+        return await rebuild_dashboard_counters()
+
+    _cache.update(doc=doc, expires_at=time.monotonic() + settings.DASHBOARD_COUNTERS_CACHE_SECONDS)
+    return doc
+
+
+async def run_periodic_rebuild(interval_seconds: int) -> None:
+    """Background loop that rebuilds the dashboard document every interval"""
+    while True:
+        try:
+            await rebuild_dashboard_counters()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error rebuilding dashboard counters: {e}")
+        await asyncio.sleep(interval_seconds)
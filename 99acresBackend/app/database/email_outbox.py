@@ -0,0 +1,185 @@
+"""Persistent email outbox and delivery worker.
+
+Requests only insert messages into the ``email_outbox`` collection. The
+worker started in the app lifespan claims due messages in batches, sends
+them over the pooled SMTP connections and records the outcome with one
+bulk write to the outbox plus one ``insert_many`` into ``email_logs``.
+Failed sends are retried with exponential backoff until
+``EMAIL_MAX_ATTEMPTS``; a message claimed by a worker that died is picked
+up again once its lease expires. Sends are capped at ``EMAIL_SEND_RATE``
+messages per second, and messages carrying a ``campaign_id`` in their
+metadata bump the campaign's ``emailsSent`` through the counter buffer.
+"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from app.config import settings
+from app.database.counter_buffer import counter_buffer
+from app.database.mongodb import get_database
+from app.utils.mailer import RateLimiter, SMTPConnectionPool, build_message, smtp_pool
+
+OUTBOX_COLLECTION = "email_outbox"
+LOG_COLLECTION = "email_logs"
+CLAIM_LEASE = timedelta(minutes=10)
+
+
+def _outbox_doc(to_email: str, subject: str, body: str, metadata: Optional[dict] = None) -> dict:
+    now = datetime.utcnow()
+    return {
+        "to_email": to_email,
+        "subject": subject,
+        "body": body,
+        "metadata": metadata or {},
+        "status": "pending",
+        "attempts": 0,
+        "next_attempt_at": now,
+        "created_at": now,
+    }
+
+
+async def enqueue_email(to_email: str, subject: str, body: str, metadata: Optional[dict] = None) -> str:
+    """Queue one email for delivery and return its outbox id"""
+    result = await get_database()[OUTBOX_COLLECTION].insert_one(_outbox_doc(to_email, subject, body, metadata))
+    return str(result.inserted_id)
+
+
+async def enqueue_emails(messages: Iterable[dict]) -> int:
+    """Queue many emails (dicts with to_email, subject, body, optional metadata) in one write.
+
+    Messages already queued for the same campaign job and recipient are
+    skipped (unique index), so re-running a job is safe; returns the number
+    of messages actually queued.
+    """
+    docs = [
+        _outbox_doc(m["to_email"], m["subject"], m["body"], m.get("metadata"))
+        for m in messages
+    ]
+    if not docs:
+        return 0
+    try:
+        result = await get_database()[OUTBOX_COLLECTION].insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+            raise
+        return e.details.get("nInserted", 0)
+    return len(result.inserted_ids)
+
+
+class OutboxWorker:
+    """Claims, sends and records batches of outbox messages"""
+
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        batch_size: int,
+        max_attempts: int,
+        retry_base_seconds: float,
+        send_rate: float = 0
+    ):
+        self.pool = pool
+        self.limiter = RateLimiter(send_rate)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.worker_id = uuid.uuid4().hex
+
+    async def _claim(self) -> List[dict]:
+        outbox = get_database()[OUTBOX_COLLECTION]
+        now = datetime.utcnow()
+        due = {"$or": [
+            {"status": "pending", "next_attempt_at": {"$lte": now}},
+            {"status": "sending", "claimed_at": {"$lte": now - CLAIM_LEASE}},
+        ]}
+        # Three round trips per batch: pick candidate ids, claim the ones still
+        # due in one update_many (atomic per document, so concurrent workers
+        # never claim the same message), then read back what this claim won
+        candidates = await outbox.find(due, {"_id": 1}).sort("next_attempt_at", 1).limit(self.batch_size).to_list(
+            length=self.batch_size
+        )
+        if not candidates:
+            return []
+        ids = [doc["_id"] for doc in candidates]
+        token = uuid.uuid4().hex
+        await outbox.update_many(
+            {"_id": {"$in": ids}, **due},
+            {"$set": {"status": "sending", "claimed_at": now, "claimed_by": self.worker_id, "claim_token": token},
+             "$inc": {"attempts": 1}}
+        )
+        return await outbox.find({"_id": {"$in": ids}, "claim_token": token}).sort("next_attempt_at", 1).to_list(length=self.batch_size)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=self.retry_base_seconds * (2 ** (attempts - 1)))
+
+    async def process_batch(self) -> int:
+        """Send one batch; returns the number of messages claimed"""
+        batch = await self._claim()
+        if not batch:
+            return 0
+
+        messages = [build_message(doc["to_email"], doc["subject"], doc["body"]) for doc in batch]
+        await self.limiter.acquire(len(messages))
+        errors = await self.pool.send_many(messages)
+
+        now = datetime.utcnow()
+        updates, logs = [], []
+        for doc, error in zip(batch, errors):
+            if error is None:
+                updates.append(UpdateOne({"_id": doc["_id"]}, {
+                    "$set": {"status": "sent", "sent_at": now},
+                    "$unset": {"claimed_by": "", "claim_token": "", "last_error": ""}
+                }))
+                campaign_id = doc.get("metadata", {}).get("campaign_id")
+                if campaign_id is not None:
+                    counter_buffer.increment("campaigns", campaign_id, "emailsSent")
+                logs.append({"outbox_id": doc["_id"], "to_email": doc["to_email"], "subject": doc["subject"],
+                             "status": "sent", "sent_at": now, "error_message": None,
+                             "metadata": doc.get("metadata", {})})
+                continue
+
+            final = doc["attempts"] >= self.max_attempts
+            updates.append(UpdateOne({"_id": doc["_id"]}, {
+                "$set": {"status": "failed" if final else "pending",
+                         "next_attempt_at": now + self._backoff(doc["attempts"]),
+                         "last_error": str(error)},
+                "$unset": {"claimed_by": "", "claim_token": ""}
+            }))
+            if final:
+                logs.append({"outbox_id": doc["_id"], "to_email": doc["to_email"], "subject": doc["subject"],
+                             "status": "failed", "sent_at": None, "error_message": str(error),
+                             "metadata": doc.get("metadata", {})})
+
+        db = get_database()
+        await db[OUTBOX_COLLECTION].bulk_write(updates, ordered=False)
+        if logs:
+            for log in logs:
+                log["created_at"] = now
+            await db[LOG_COLLECTION].insert_many(logs, ordered=False)
+        return len(batch)
+
+    async def run(self, poll_seconds: float) -> None:
+        """Background loop: drain due messages, then poll"""
+        try:
+            while True:
+                try:
+                    claimed = await self.process_batch()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(f"Error in email outbox worker: {e}")
+                    claimed = 0
+                if claimed < self.batch_size:
+                    await asyncio.sleep(poll_seconds)
+        finally:
+            await self.pool.close()
+
+
+outbox_worker = OutboxWorker(
+    smtp_pool,
+    batch_size=settings.EMAIL_BATCH_SIZE,
+    max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+    retry_base_seconds=settings.EMAIL_RETRY_BASE_SECONDS,
+    send_rate=settings.EMAIL_SEND_RATE
+)
@@ -0,0 +1,252 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from app.database.search_index import search_index
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize an indexed value so lookups are case-insensitive"""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+
+class _TierIndex:
+    """Listings of one tier plus their secondary and price indexes"""
+
+    def __init__(self, indexes: Dict[str, str], price_field: str, id_field: str):
+        self.indexes = indexes  # canonical filter name -> listing key
+        self.price_field = price_field
+        self.id_field = id_field
+        self.by_id: Dict[Any, dict] = {}
+        self.position: Dict[Any, int] = {}
+        self.values: Dict[str, Dict[Any, set]] = {name: {} for name in indexes}
+        self.prices: List[Tuple[float, int, Any]] = []  # (price, position, id), kept sorted
+        self._next_position = 0
+        self.searchable = False
+
+    def add(self, listing: dict) -> None:
+        listing_id = listing[self.id_field]
+        if listing_id in self.by_id:
+            # Replacing a listing keeps its original ordering slot
+            position = self.position[listing_id]
+            self._unindex(listing_id, self.by_id[listing_id], position)
+        else:
+            position = self._next_position
+            self._next_position += 1
+
+        self.by_id[listing_id] = listing
+        self.position[listing_id] = position
+
+        for name, key in self.indexes.items():
+            value = _normalize(listing.get(key))
+            self.values[name].setdefault(value, set()).add(listing_id)
+
+        price = listing.get(self.price_field)
+        if price is not None:
+            insort(self.prices, (price, position, listing_id))
+
+    def remove(self, listing_id: Any) -> Optional[dict]:
+        listing = self.by_id.pop(listing_id, None)
+        if listing is None:
+            return None
+        self._unindex(listing_id, listing, self.position.pop(listing_id))
+        return listing
+
+    def _unindex(self, listing_id: Any, listing: dict, position: int) -> None:
+        for name, key in self.indexes.items():
+            value = _normalize(listing.get(key))
+            ids = self.values[name].get(value)
+            if ids is not None:
+                ids.discard(listing_id)
+                if not ids:
+                    del self.values[name][value]
+
+        price = listing.get(self.price_field)
+        if price is not None:
+            i = bisect_left(self.prices, (price, position, listing_id))
+            if i < len(self.prices) and self.prices[i][2] == listing_id:
+                self.prices.pop(i)
+
+    def price_range(self, min_price: Optional[float], max_price: Optional[float]) -> set:
+        lo = 0 if min_price is None else bisect_left(self.prices, (min_price,))
+        hi = len(self.prices) if max_price is None else bisect_right(self.prices, (max_price, float("inf")))
+        return {entry[2] for entry in self.prices[lo:hi]}
+
+
+class ListingStore:
+    """Shared in-process listing store used by all listing tier routers.
+
+    Every tier keeps its listings in insertion order, an equality index per
+    registered filter field and a sorted price index, so a filtered lookup is
+    an intersection of index buckets plus a bisect on price instead of a scan.
+    """
+
+    def __init__(self):
+        self._tiers: Dict[str, _TierIndex] = {}
+        self._pending: Dict[str, dict] = {}
+
+    def register(
+        self,
+        tier: str,
+        listings: Iterable[dict],
+        indexes: Dict[str, str],
+        price_field: str = "price",
+        id_field: str = "id",
+        search_fields: Optional[Dict[str, int]] = None,
+        lazy: bool = False
+    ) -> None:
+        """Register (or replace) the listings of a tier and build its indexes.
+
+        ``search_fields`` maps listing keys to BM25 weights; when given, the
+        tier is also kept in the shared full-text ``search_index``. With
+        ``lazy=True`` the listings are not read and nothing is indexed until
+        the tier is first used (see ``load``).
+        """
+        options = dict(indexes=indexes, price_field=price_field, id_field=id_field, search_fields=search_fields)
+        if lazy:
+            self._tiers.pop(tier, None)
+            self._pending[tier] = dict(listings=listings, **options)
+            return
+        self._pending.pop(tier, None)
+
+        tier_index = _TierIndex(indexes, price_field, id_field)
+        search_index.clear_tier(tier)
+        if search_fields:
+            search_index.configure(tier, search_fields)
+        for listing in listings:
+            tier_index.add(listing)
+            if search_fields:
+                search_index.add(tier, listing[id_field], listing)
+        tier_index.searchable = bool(search_fields)
+        self._tiers[tier] = tier_index
+
+    def load(self, tiers: Optional[Iterable[str]] = None) -> None:
+        """Build lazily registered tiers (all of them, or just ``tiers``)"""
+        names = list(self._pending) if tiers is None else [tier for tier in tiers if tier in self._pending]
+        for tier in names:
+            self.register(tier, **self._pending[tier])
+
+    def _tier(self, tier: str) -> _TierIndex:
+        if tier in self._pending:
+            self.load([tier])
+        if tier not in self._tiers:
+            raise KeyError(f"Listing tier '{tier}' is not registered")
+        return self._tiers[tier]
+
+    def add(self, tier: str, listing: dict) -> None:
+        """Insert or replace a single listing, keeping the indexes current"""
+        tier_index = self._tier(tier)
+        tier_index.add(listing)
+        if tier_index.searchable:
+            search_index.add(tier, listing[tier_index.id_field], listing)
+
+    def remove(self, tier: str, listing_id: Any) -> Optional[dict]:
+        """Remove a listing from a tier and its indexes"""
+        search_index.remove(tier, listing_id)
+        return self._tier(tier).remove(listing_id)
+
+    def tiers(self) -> List[str]:
+        """Names of the registered tiers, loaded or not"""
+        return list(self._tiers) + list(self._pending)
+
+    def get(self, tier: str, listing_id: Any) -> Optional[dict]:
+        """Get a listing by ID"""
+        return self._tier(tier).by_id.get(listing_id)
+
+    def all(self, tier: str) -> List[dict]:
+        """Get every listing of a tier in insertion order"""
+        return list(self._tier(tier).by_id.values())
+
+    def total(self, tier: str) -> int:
+        """Number of listings in a tier"""
+        return len(self._tier(tier).by_id)
+
+    def distinct(self, tier: str, field: str) -> List[Any]:
+        """Distinct original values of an indexed field"""
+        tier_index = self._tier(tier)
+        key = tier_index.indexes[field]
+        return [tier_index.by_id[next(iter(ids))][key] for ids in tier_index.values[field].values()]
+
+    def _match_ids(
+        self,
+        tier_index: _TierIndex,
+        filters: Dict[str, Any],
+        min_price: Optional[float],
+        max_price: Optional[float]
+    ) -> Optional[set]:
+        """Intersect the index buckets for the given filters (None means no constraint)"""
+        buckets = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in tier_index.indexes:
+                raise KeyError(f"Field '{name}' is not indexed")
+            bucket = tier_index.values[name].get(_normalize(value))
+            if not bucket:
+                return set()
+            buckets.append(bucket)
+
+        if min_price is not None or max_price is not None:
+            buckets.append(tier_index.price_range(min_price, max_price))
+
+        if not buckets:
+            return None
+
+        buckets.sort(key=len)
+        matched = set(buckets[0])
+        for bucket in buckets[1:]:
+            matched &= bucket
+            if not matched:
+                break
+        return matched
+
+    def query(
+        self,
+        tier: str,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        where: Optional[Callable[[dict], bool]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        **filters: Any
+    ) -> Tuple[List[dict], int]:
+        """Get listings matching the filters in insertion order.
+
+        Equality filters are looked up in the indexes, price bounds use the
+        sorted price index and ``where`` is only evaluated on the narrowed
+        candidates. Returns the requested page and the total match count.
+        """
+        tier_index = self._tier(tier)
+        matched = self._match_ids(tier_index, filters, min_price, max_price)
+
+        end = None if not limit else offset + limit
+
+        if matched is None:
+            if where is None:
+                page = list(islice(tier_index.by_id.values(), offset, end))
+                return page, len(tier_index.by_id)
+            candidates = list(tier_index.by_id.values())
+        else:
+            ordered = sorted(matched, key=tier_index.position.__getitem__)
+            candidates = [tier_index.by_id[listing_id] for listing_id in ordered]
+
+        if where is not None:
+            candidates = [listing for listing in candidates if where(listing)]
+
+        return candidates[offset:end], len(candidates)
+
+    def count(
+        self,
+        tier: str,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        **filters: Any
+    ) -> int:
+        """Count listings matching the indexed filters without materializing them"""
+        tier_index = self._tier(tier)
+        matched = self._match_ids(tier_index, filters, min_price, max_price)
+        return len(tier_index.by_id) if matched is None else len(matched)
+
+
+listing_store = ListingStore()
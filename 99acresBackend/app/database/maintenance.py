@@ -0,0 +1,194 @@
+"""One-off database maintenance commands.
+
+Usage:
+    python -m app.database.maintenance backfill-normalized
+    python -m app.database.maintenance backfill-search-text
+    python -m app.database.maintenance backfill-locations
+    python -m app.database.maintenance refresh-property-stats
+    python -m app.database.maintenance rebuild-dashboard-counters
+    python -m app.database.maintenance rebuild-campaign-rollups
+    python -m app.database.maintenance normalize-appointment-dates
+    python -m app.database.maintenance seed-sample-data
+"""
+import argparse
+import asyncio
+from typing import Callable, Optional
+from pymongo import UpdateOne
+from app.database.mongodb import mongodb, connect_to_mongo, close_mongo_connection, create_sample_data
+from app.database.campaign_rollups import rebuild_campaign_rollups as _rebuild_campaign_rollups
+from app.database.counters import rebuild_dashboard_counters as _rebuild_dashboard_counters
+from app.database.repositories.mongo_user_repository import NORMALIZED_FIELDS as USER_NORMALIZED_FIELDS
+from app.database.repositories.loan_repository import LoanRepository
+from app.database.schemas.appointment import parse_appointment_date
+from app.utils.text import (
+    PROPERTY_NORMALIZED_FIELDS, PROPERTY_SEARCH_FIELDS, add_normalized_fields, build_search_text
+)
+from app.utils.geo import geo_point
+
+BATCH_SIZE = 1000
+
+
+async def _bulk_backfill(
+    collection_name: str,
+    query: dict,
+    projection: dict,
+    build_update: Callable[[dict], Optional[dict]]
+) -> int:
+    """Apply ``$set`` updates built per document with batched unordered bulk writes.
+
+    ``build_update`` returns the fields to set on a document, or None to
+    leave it alone. Returns the number of documents modified.
+    """
+    collection = mongodb.database[collection_name]
+    updated = 0
+    operations = []
+
+    async def flush() -> None:
+        nonlocal updated, operations
+        if operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+            operations = []
+
+    async for doc in collection.find(query, projection):
+        changes = build_update(doc)
+        if changes:
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+        if len(operations) >= BATCH_SIZE:
+            await flush()
+    await flush()
+    return updated
+
+
+async def backfill_normalized_fields(collection_name: str, fields: tuple) -> int:
+    """Write missing or stale ``<field>_norm`` shadow fields"""
+    projection = {field: 1 for field in fields}
+    projection.update({f"{field}_norm": 1 for field in fields})
+
+    def build_update(doc: dict) -> dict:
+        normalized = add_normalized_fields({field: doc.get(field) for field in fields}, fields)
+        return {
+            key: value for key, value in normalized.items()
+            if key.endswith("_norm") and doc.get(key) != value
+        }
+
+    updated = await _bulk_backfill(collection_name, {}, projection, build_update)
+    print(f"✅ Backfilled normalized fields on {updated} '{collection_name}' documents")
+    return updated
+
+
+async def backfill_normalized() -> None:
+    """Backfill every normalized shadow field used by the repositories"""
+    await backfill_normalized_fields("properties", PROPERTY_NORMALIZED_FIELDS)
+    await backfill_normalized_fields("users", USER_NORMALIZED_FIELDS)
+
+
+async def backfill_search_text() -> None:
+    """Write the tokenized ``search_text`` field used by the properties text index"""
+    projection = {field: 1 for field in PROPERTY_SEARCH_FIELDS}
+    projection["search_text"] = 1
+
+    def build_update(doc: dict) -> Optional[dict]:
+        search_text = build_search_text(doc, PROPERTY_SEARCH_FIELDS)
+        return {"search_text": search_text} if doc.get("search_text") != search_text else None
+
+    updated = await _bulk_backfill("properties", {}, projection, build_update)
+    print(f"✅ Backfilled search text on {updated} 'properties' documents")
+
+
+async def backfill_locations() -> None:
+    """Write the GeoJSON ``location`` field behind the properties 2dsphere index"""
+    query = {"latitude": {"$type": "number"}, "longitude": {"$type": "number"}}
+    skipped = 0
+
+    def build_update(doc: dict) -> Optional[dict]:
+        nonlocal skipped
+        point = geo_point(doc["latitude"], doc["longitude"])
+        if point is None:
+            skipped += 1
+            return None
+        return {"location": point} if doc.get("location") != point else None
+
+    updated = await _bulk_backfill("properties", query, {"latitude": 1, "longitude": 1, "location": 1}, build_update)
+    print(f"✅ Backfilled location on {updated} 'properties' documents")
+    if skipped:
+        print(f"⚠️ {skipped} properties have out-of-range coordinates and were left without a location")
+
+
+async def refresh_property_stats() -> None:
+    """Rebuild the materialized property statistics document"""
+    # The repository module imports the SQL models; keep that off the CLI's import path
+    from app.database.repositories.property_repository import PropertyRepository
+
+    snapshot = await PropertyRepository.refresh_property_stats()
+    print(f"✅ Refreshed property stats ({snapshot['total']} properties)")
+
+
+async def rebuild_dashboard_counters() -> None:
+    """Rebuild the materialized admin dashboard counters"""
+    doc = await _rebuild_dashboard_counters()
+    print(f"✅ Rebuilt dashboard counters: {doc['totals']}")
+
+
+async def rebuild_campaign_rollups() -> None:
+    """Reconcile the per-owner campaign statistics rollups"""
+    owners = await _rebuild_campaign_rollups()
+    print(f"✅ Rebuilt campaign rollups for {owners} owners")
+
+
+async def normalize_appointment_dates() -> None:
+    """Convert string ``appointment_date`` values to datetimes.
+
+    Values that can't be parsed are left untouched and reported so they can
+    be fixed by hand rather than overwritten with an arbitrary date.
+    """
+    invalid = []
+
+    def build_update(doc: dict) -> Optional[dict]:
+        try:
+            return {"appointment_date": parse_appointment_date(doc["appointment_date"])}
+        except ValueError:
+            invalid.append(str(doc["_id"]))
+            return None
+
+    updated = await _bulk_backfill(
+        "appointments", {"appointment_date": {"$type": "string"}}, {"appointment_date": 1}, build_update
+    )
+    print(f"✅ Normalized appointment_date on {updated} appointments")
+    if invalid:
+        print(f"⚠️ {len(invalid)} appointments have unparseable dates: {', '.join(invalid)}")
+
+
+async def seed_sample_data() -> None:
+    """Create the sample users, properties and loan applications in an empty database"""
+    await create_sample_data()
+    seeded = await LoanRepository.seed_sample_applications()
+    if seeded:
+        print(f"✅ Seeded {seeded} sample loan applications")
+
+
+COMMANDS = {
+    "backfill-normalized": backfill_normalized,
+    "backfill-search-text": backfill_search_text,
+    "backfill-locations": backfill_locations,
+    "refresh-property-stats": refresh_property_stats,
+    "rebuild-dashboard-counters": rebuild_dashboard_counters,
+    "rebuild-campaign-rollups": rebuild_campaign_rollups,
+    "normalize-appointment-dates": normalize_appointment_dates,
+    "seed-sample-data": seed_sample_data,
+}
+
+
+async def main(command: str) -> None:
+    await connect_to_mongo()
+    try:
+        await COMMANDS[command]()
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="99Acres database maintenance")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(main(args.command))
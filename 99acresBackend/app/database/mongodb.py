@@ -1,26 +1,76 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, TEXT, IndexModel
+from pymongo.read_preferences import SecondaryPreferred
+from typing import List
+from datetime import datetime
 from app.config import settings
+from app.database.pool_monitor import db_monitor
+from app.utils.auth import get_password_hash_async
+from app.utils.text import add_normalized_fields, build_search_text
 import asyncio
+import importlib.util
 
 class MongoDB:
     client: AsyncIOMotorClient = None
     database = None
+    replica = None  # same database, read preference secondaryPreferred
+    setup_task: asyncio.Task = None
 
 mongodb = MongoDB()
 
+def client_options() -> dict:
+    """Pool, timeout and compression options for the Motor client, from Settings"""
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+        "event_listeners": db_monitor.listeners(),
+    }
+    if settings.MONGODB_MAX_IDLE_TIME_MS:
+        options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+    # zstd and snappy need the zstandard / python-snappy packages; missing ones are skipped
+    compressors = available_compressors()
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    if settings.MONGODB_TLS_CA_FILE:
+        options["tlsCAFile"] = settings.MONGODB_TLS_CA_FILE
+    return options
+
+def available_compressors() -> List[str]:
+    """Configured wire compressors whose client-side library is installed"""
+    available = []
+    for name in (c.strip() for c in settings.MONGODB_COMPRESSORS.split(",")):
+        if name == "zstd" and importlib.util.find_spec("zstandard") is None:
+            continue
+        if name == "snappy" and importlib.util.find_spec("snappy") is None:
+            continue
+        if name:
+            available.append(name)
+    return available
+
 async def connect_to_mongo():
     """Create database connection"""
     try:
-        mongodb.client = AsyncIOMotorClient(settings.MONGODB_URL)
+        mongodb.client = AsyncIOMotorClient(settings.MONGODB_URL, **client_options())
         mongodb.database = mongodb.client[settings.DATABASE_NAME]
+        mongodb.replica = mongodb.database
+        if settings.MONGODB_SECONDARY_READS:
+            mongodb.replica = mongodb.database.with_options(
+                read_preference=SecondaryPreferred(max_staleness=settings.MONGODB_MAX_STALENESS_SECONDS)
+            )
         
         # Test the connection
         await mongodb.client.admin.command('ping')
         print("✅ Successfully connected to MongoDB!")
         print(f"📊 Database: {settings.DATABASE_NAME}")
         
-        # Create indexes for better performance
-        await create_indexes()
+        if settings.FAST_STARTUP:
+            # Serve immediately; indexes are built while the first requests run
+            mongodb.setup_task = asyncio.create_task(prepare_database())
+        else:
+            await prepare_database()
         
     except Exception as e:
         print(f"❌ Failed to connect to MongoDB: {e}")
@@ -28,62 +78,227 @@ async def connect_to_mongo():
 
 async def close_mongo_connection():
     """Close database connection"""
+    if mongodb.setup_task and not mongodb.setup_task.done():
+        mongodb.setup_task.cancel()
     if mongodb.client:
         mongodb.client.close()
         print("🔌 MongoDB connection closed")
 
+# Declarative index registry: collection -> list of (keys, options).
+# Compound keys follow the equality -> sort -> range order of the
+# repository queries so the planner can use a single index per query.
+# Paginated listings sort on (<field>, _id) for keyset cursors, so their
+# indexes end in that pair or the planner falls back to an in-memory SORT.
+INDEX_REGISTRY = {
+    "users": [
+        ([("email", ASCENDING)], {"unique": True}),
+        ([("phone", ASCENDING)], {}),
+        ([("role", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("full_name_norm", ASCENDING)], {}),
+        ([("email_norm", ASCENDING)], {}),
+    ],
+    "properties": [
+        ([("owner_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("city_norm", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("city_norm", ASCENDING), ("property_type", ASCENDING), ("status", ASCENDING), ("price", ASCENDING)], {}),
+        ([("city_norm", ASCENDING), ("listing_type", ASCENDING), ("status", ASCENDING), ("price", ASCENDING)], {}),
+        ([("city_norm", ASCENDING), ("bedrooms", ASCENDING), ("price", ASCENDING)], {}),
+        ([("state_norm", ASCENDING), ("property_type", ASCENDING), ("status", ASCENDING)], {}),
+        ([("status", ASCENDING), ("is_featured", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("property_type", ASCENDING), ("price", ASCENDING)], {}),
+        ([("price", ASCENDING)], {}),
+        ([("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        # search_text is already tokenized, so no stemming/stopwords on the server side
+        ([("search_text", TEXT)], {"default_language": "none"}),
+        # GeoJSON point for $geoNear / $geoWithin; documents without one are skipped
+        ([("location", GEOSPHERE), ("status", ASCENDING), ("property_type", ASCENDING), ("price", ASCENDING)], {}),
+    ],
+    "appointments": [
+        ([("user_id", ASCENDING), ("appointment_date", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("user_id", ASCENDING), ("status", ASCENDING), ("appointment_date", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("agent_id", ASCENDING), ("appointment_date", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("agent_id", ASCENDING), ("status", ASCENDING), ("appointment_date", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("status", ASCENDING), ("appointment_date", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("property_id", ASCENDING)], {}),
+        ([("appointment_date", DESCENDING), ("_id", DESCENDING)], {}),
+    ],
+    "campaigns": [
+        ([("owner_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("owner_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("campaign_type", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("created_at", DESCENDING), ("_id", DESCENDING)], {}),
+    ],
+    "banners": [
+        ([("position", ASCENDING), ("is_active", ASCENDING)], {}),
+        ([("is_active", ASCENDING)], {}),
+    ],
+    "email_outbox": [
+        ([("status", ASCENDING), ("next_attempt_at", ASCENDING)], {}),
+        # One message per recipient of a campaign send job, so a re-run job can't double-send
+        ([("metadata.job_id", ASCENDING), ("to_email", ASCENDING)],
+         {"unique": True, "partialFilterExpression": {"metadata.job_id": {"$exists": True}}}),
+    ],
+    "campaign_jobs": [
+        ([("status", ASCENDING), ("created_at", ASCENDING)], {}),
+        ([("campaign_id", ASCENDING), ("status", ASCENDING)], {}),
+    ],
+    "email_logs": [
+        ([("status", ASCENDING), ("created_at", DESCENDING)], {}),
+        ([("created_at", DESCENDING)], {}),
+    ],
+    "loan_applications": [
+        ([("status", ASCENDING), ("loan_type", ASCENDING), ("applied_date", DESCENDING)], {}),
+        ([("status", ASCENDING), ("applied_date", DESCENDING)], {}),
+        ([("loan_type", ASCENDING), ("applied_date", DESCENDING)], {}),
+        ([("applied_date", DESCENDING)], {}),
+    ],
+    "expert_consultations": [
+        ([("submitted_at", DESCENDING)], {}),
+    ],
+}
+
+# Keyset pagination sorts (see schemas.common.cursor_sort)
+NEWEST_FIRST = [("created_at", DESCENDING), ("_id", DESCENDING)]
+LATEST_APPOINTMENT_FIRST = [("appointment_date", DESCENDING), ("_id", DESCENDING)]
+
+# Representative filter/sort shapes issued by the repositories. Each one is
+# explained at startup so a query that falls back to a COLLSCAN or an
+# in-memory SORT is reported.
+QUERY_TEMPLATES = [
+    ("users", {"email": "probe@example.com"}, None),
+    ("users", {}, NEWEST_FIRST),
+    ("users", {"role": "agent"}, NEWEST_FIRST),
+    ("users", {"full_name_norm": {"$regex": "^ajay"}}, None),
+    ("properties", {"city_norm": "mumbai", "property_type": "apartment", "status": "available",
+                    "price": {"$gte": 0, "$lte": 10000000}}, None),
+    ("properties", {"city_norm": "mumbai", "listing_type": "sale", "status": "available"}, None),
+    ("properties", {"city_norm": "mumbai", "bedrooms": 2, "price": {"$lte": 10000000}}, None),
+    ("properties", {"state_norm": "maharashtra", "property_type": "apartment"}, None),
+    ("properties", {}, NEWEST_FIRST),
+    ("properties", {"status": "available"}, NEWEST_FIRST),
+    ("properties", {"city_norm": "mumbai", "status": "available"}, NEWEST_FIRST),
+    ("properties", {"status": "available", "is_featured": True}, NEWEST_FIRST),
+    ("properties", {"owner_id": "000000000000000000000000"}, NEWEST_FIRST),
+    ("properties", {"location": {"$geoWithin": {"$centerSphere": [[77.2, 28.6], 0.001]}}, "status": "available"}, None),
+    ("appointments", {}, LATEST_APPOINTMENT_FIRST),
+    ("appointments", {"status": "pending"}, LATEST_APPOINTMENT_FIRST),
+    ("appointments", {"user_id": "000000000000000000000000"}, LATEST_APPOINTMENT_FIRST),
+    ("appointments", {"user_id": "000000000000000000000000", "status": "pending"}, LATEST_APPOINTMENT_FIRST),
+    ("appointments", {"agent_id": "000000000000000000000000"}, LATEST_APPOINTMENT_FIRST),
+    ("campaigns", {}, NEWEST_FIRST),
+    ("campaigns", {"owner_id": "000000000000000000000000"}, NEWEST_FIRST),
+    ("campaigns", {"owner_id": "000000000000000000000000", "status": "active"}, NEWEST_FIRST),
+    ("campaigns", {"status": "active"}, NEWEST_FIRST),
+    ("campaigns", {"campaign_type": "email"}, NEWEST_FIRST),
+    ("banners", {"position": "home", "is_active": True}, None),
+    ("banners", {"is_active": True}, None),
+    ("email_outbox", {"status": "pending", "next_attempt_at": {"$lte": datetime(2000, 1, 1)}}, [("next_attempt_at", ASCENDING)]),
+    ("email_logs", {"status": "sent"}, [("created_at", DESCENDING)]),
+    ("loan_applications", {"status": "pending", "loan_type": "home_loan"}, [("applied_date", DESCENDING)]),
+    ("loan_applications", {"status": "pending"}, [("applied_date", DESCENDING)]),
+    ("loan_applications", {"loan_type": "home_loan"}, [("applied_date", DESCENDING)]),
+]
+
+async def prepare_database():
+    """Create indexes, then report repository queries that cannot use one"""
+    await create_indexes()
+    if settings.AUDIT_QUERY_PLANS:
+        await audit_query_plans()
+
 async def create_indexes():
-    """Create database indexes for better performance"""
-    try:
-        # Users collection indexes
-        await mongodb.database.users.create_index("email", unique=True)
-        await mongodb.database.users.create_index("phone")
-        await mongodb.database.users.create_index("role")
-        
-        # Properties collection indexes
-        await mongodb.database.properties.create_index("owner_id")
-        await mongodb.database.properties.create_index("city")
-        await mongodb.database.properties.create_index("property_type")
-        await mongodb.database.properties.create_index("status")
-        await mongodb.database.properties.create_index("price")
-        
-        # Appointments collection indexes
-        await mongodb.database.appointments.create_index("user_id")
-        await mongodb.database.appointments.create_index("property_id")
-        await mongodb.database.appointments.create_index("appointment_date")
-        
-        # Campaigns collection indexes
-        await mongodb.database.campaigns.create_index("owner_id")
-        await mongodb.database.campaigns.create_index("status")
-        await mongodb.database.campaigns.create_index("campaign_type")
-        await mongodb.database.campaigns.create_index("created_at")
-        
+    """Create the indexes declared in INDEX_REGISTRY.
+
+    Each collection gets one ``createIndexes`` command and the collections
+    are processed concurrently, so startup waits for the slowest collection
+    rather than for every index in turn.
+    """
+    names = list(INDEX_REGISTRY)
+    results = await asyncio.gather(
+        *(
+            mongodb.database[name].create_indexes(
+                [IndexModel(keys, **options) for keys, options in INDEX_REGISTRY[name]]
+            )
+            for name in names
+        ),
+        return_exceptions=True
+    )
+    failed = [(name, result) for name, result in zip(names, results) if isinstance(result, Exception)]
+    for name, error in failed:
+        print(f"⚠️ Failed to create indexes on '{name}': {error}")
+    if not failed:
         print("📑 Database indexes created successfully!")
-        
-    except Exception as e:
-        print(f"⚠️ Failed to create indexes: {e}")
+
+def _plan_stages(plan) -> List[str]:
+    """Collect every stage name of an explain() plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+async def audit_query_plans() -> List[dict]:
+    """Explain every query template and report the ones planned as a COLLSCAN or a blocking SORT"""
+    async def explain(collection_name, query, sort):
+        cursor = mongodb.database[collection_name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        return await cursor.explain()
+    
+    explains = await asyncio.gather(
+        *(explain(*template) for template in QUERY_TEMPLATES),
+        return_exceptions=True
+    )
+    flagged = []
+    for (collection_name, query, sort), result in zip(QUERY_TEMPLATES, explains):
+        if isinstance(result, Exception):
+            print(f"⚠️ Failed to explain query on '{collection_name}': {result}")
+            continue
+        winning_plan = result.get("queryPlanner", {}).get("winningPlan", {})
+        stages = _plan_stages(winning_plan)
+        # SORT means the index order doesn't match the sort, so results are sorted in memory
+        for stage in ("COLLSCAN", "SORT"):
+            if stage in stages:
+                flagged.append({"collection": collection_name, "query": query, "sort": sort, "stage": stage})
+                print(f"⚠️ {stage} on '{collection_name}' for query {query} sort {sort}")
+    
+    if not flagged:
+        print("🔍 Query plan audit passed: every query template uses an index for its filter and sort")
+    return flagged
 
 async def create_sample_data():
-    """Create sample data if database is empty"""
+    """Create sample data if database is empty.
+
+    Run at startup only with ``SEED_SAMPLE_DATA=true``; otherwise use
+    ``python -m app.database.maintenance seed-sample-data``.
+    """
     try:
-        from passlib.context import CryptContext
-        from datetime import datetime
-        
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        
         # Check if users exist
         user_count = await mongodb.database.users.count_documents({})
         
         if user_count == 0:
             print("📝 Creating sample data...")
             
+            # Hash the sample passwords concurrently, off the event loop
+            passwords = ["admin123", "Ajay@123", "agent123"]
+            hashes = dict(zip(passwords, await asyncio.gather(
+                *(get_password_hash_async(password) for password in passwords)
+            )))
+            
             # Create sample users
             sample_users = [
                 {
                     "email": "admin@99acres.com",
                     "full_name": "Admin User",
                     "phone": "+919999999999",
-                    "password_hash": pwd_context.hash("admin123"),
+                    "password_hash": hashes["admin123"],
                     "role": "admin",
                     "is_active": True,
                     "is_verified": True,
@@ -97,7 +312,7 @@ async def create_sample_data():
                     "email": "ajayvishwakrma1@gmail.com",
                     "full_name": "Ajay Vishwakarma",
                     "phone": "7068009780",
-                    "password_hash": pwd_context.hash("Ajay@123"),
+                    "password_hash": hashes["Ajay@123"],
                     "role": "client",
                     "is_active": True,
                     "is_verified": True,
@@ -111,7 +326,7 @@ async def create_sample_data():
                     "email": "ajayvishwakrma2021@gmail.com",
                     "full_name": "Ajay Vishwakarma",
                     "phone": "7068009780",
-                    "password_hash": pwd_context.hash("Ajay@123"),
+                    "password_hash": hashes["Ajay@123"],
                     "role": "client",
                     "is_active": True,
                     "is_verified": True,
@@ -125,7 +340,7 @@ async def create_sample_data():
                     "email": "agent@99acres.com",
                     "full_name": "Agent Smith",
                     "phone": "+919876543210",
-                    "password_hash": pwd_context.hash("agent123"),
+                    "password_hash": hashes["agent123"],
                     "role": "agent",
                     "is_active": True,
                     "is_verified": True,
@@ -139,6 +354,9 @@ async def create_sample_data():
                 }
             ]
             
+            for user in sample_users:
+                add_normalized_fields(user, ("full_name", "email"))
+            
             # Insert sample users
             result = await mongodb.database.users.insert_many(sample_users)
             print(f"✅ Created {len(result.inserted_ids)} sample users")
@@ -187,6 +405,12 @@ async def create_sample_data():
                 }
             ]
             
+            for prop in sample_properties:
+                add_normalized_fields(prop, ("city", "state"))
+                prop["search_text"] = build_search_text(
+                    prop, ("title", "title", "address", "city", "state", "description")
+                )
+            
             # Insert sample properties
             prop_result = await mongodb.database.properties.insert_many(sample_properties)
             print(f"✅ Created {len(prop_result.inserted_ids)} sample properties")
@@ -197,5 +421,15 @@ async def create_sample_data():
         print(f"❌ Failed to create sample data: {e}")
 
 def get_database():
-    """Get database instance"""
-    return mongodb.database
\ No newline at end of file
+    """Get database instance (primary: writes and reads that must see them)"""
+    return mongodb.database
+
+def get_read_database():
+    """Database handle for reads that tolerate replication lag.
+
+    Analytics, dashboard counts and public listing reads go to a secondary
+    no more than MONGODB_MAX_STALENESS_SECONDS behind, or to the primary when
+    no such secondary is available (always, on a standalone server). Never
+    use it to read back something the same request just wrote.
+    """
+    return mongodb.replica or mongodb.database
\ No newline at end of file
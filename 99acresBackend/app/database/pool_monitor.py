@@ -0,0 +1,191 @@
+"""Connection-pool and latency metrics collected from pymongo event listeners.
+
+``db_monitor.listeners()`` is passed to the Motor client; the driver then
+reports every pool checkout/checkin, command and server heartbeat here.
+``db_monitor.snapshot()`` turns the counters into the numbers served by
+``/health/db``: open and in-use connections against ``maxPoolSize``, how
+many operations are queued waiting for a connection, checkout timeouts,
+and command / heartbeat round-trip percentiles. Listener callbacks run on
+driver threads, so every update holds a lock.
+"""
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from pymongo import monitoring
+
+LATENCY_WINDOW = 1000  # recent samples kept for percentiles
+
+
+def _percentiles(samples: List[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(samples)
+
+    def pick(pct: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 3)
+
+    return {"p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99), "max_ms": round(ordered[-1], 3)}
+
+
+class _ServerPool:
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self.open = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.peak_in_use = 0
+        self.peak_waiting = 0
+        self.checkouts = 0
+        self.checkout_failures: Dict[str, int] = {}
+        self.cleared = 0
+
+
+class _CommandLatency(monitoring.CommandListener):
+    def __init__(self, monitor: "DBMonitor"):
+        self.monitor = monitor
+
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        self.monitor.record_command(event.duration_micros / 1000, failed=False)
+
+    def failed(self, event) -> None:
+        self.monitor.record_command(event.duration_micros / 1000, failed=True)
+
+
+class _HeartbeatLatency(monitoring.ServerHeartbeatListener):
+    def __init__(self, monitor: "DBMonitor"):
+        self.monitor = monitor
+
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        # Awaited (streaming) heartbeats block server-side, so only polls measure RTT
+        if not getattr(event, "awaited", False):
+            self.monitor.record_heartbeat(event.duration * 1000)
+
+    def failed(self, event) -> None:
+        pass
+
+
+class DBMonitor(monitoring.ConnectionPoolListener):
+    """Aggregates driver events into pool utilization and latency metrics"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._pools: Dict[str, _ServerPool] = {}
+        self._commands: Deque[float] = deque(maxlen=window)
+        self._heartbeats: Deque[float] = deque(maxlen=window)
+        self._failed_commands = 0
+
+    def listeners(self) -> list:
+        """Event listeners to pass to the client as ``event_listeners``"""
+        return [self, _CommandLatency(self), _HeartbeatLatency(self)]
+
+    def record_command(self, duration_ms: float, failed: bool) -> None:
+        with self._lock:
+            self._commands.append(duration_ms)
+            if failed:
+                self._failed_commands += 1
+
+    def record_heartbeat(self, duration_ms: float) -> None:
+        with self._lock:
+            self._heartbeats.append(duration_ms)
+
+    @staticmethod
+    def _key(address) -> str:
+        return f"{address[0]}:{address[1]}" if isinstance(address, tuple) else str(address)
+
+    def _pool(self, address) -> _ServerPool:
+        key = self._key(address)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _ServerPool()
+        return pool
+
+    # Connection pool events
+    def pool_created(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).max_size = event.options.get("maxPoolSize")
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).cleared += 1
+
+    def pool_closed(self, event) -> None:
+        with self._lock:
+            self._pools.pop(self._key(event.address), None)
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).open += 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.open = max(0, pool.open - 1)
+
+    def connection_check_out_started(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.waiting += 1
+            pool.peak_waiting = max(pool.peak_waiting, pool.waiting)
+
+    def connection_check_out_failed(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.waiting = max(0, pool.waiting - 1)
+            reason = str(event.reason)
+            pool.checkout_failures[reason] = pool.checkout_failures.get(reason, 0) + 1
+
+    def connection_checked_out(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.waiting = max(0, pool.waiting - 1)
+            pool.in_use += 1
+            pool.checkouts += 1
+            pool.peak_in_use = max(pool.peak_in_use, pool.in_use)
+
+    def connection_checked_in(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.in_use = max(0, pool.in_use - 1)
+
+    def snapshot(self) -> dict:
+        """Point-in-time pool utilization and latency percentiles"""
+        with self._lock:
+            servers = {}
+            for address, pool in self._pools.items():
+                servers[address] = {
+                    "max_pool_size": pool.max_size,
+                    "open": pool.open,
+                    "in_use": pool.in_use,
+                    "available": max(0, pool.open - pool.in_use),
+                    "waiting": pool.waiting,
+                    "utilization": round(pool.in_use / pool.max_size, 3) if pool.max_size else None,
+                    "peak_in_use": pool.peak_in_use,
+                    "peak_waiting": pool.peak_waiting,
+                    "checkouts": pool.checkouts,
+                    "checkout_failures": dict(pool.checkout_failures),
+                    "pool_cleared": pool.cleared,
+                }
+            commands = list(self._commands)
+            heartbeats = list(self._heartbeats)
+            failed = self._failed_commands
+
+        return {
+            "servers": servers,
+            "commands": {"samples": len(commands), "failed": failed, **_percentiles(commands)},
+            "heartbeat_rtt": {"samples": len(heartbeats), **_percentiles(heartbeats)},
+        }
+
+
+db_monitor = DBMonitor()
@@ -3,6 +3,7 @@ from datetime import datetime
 from bson import ObjectId
 from app.database.sqlite_models import Appointment, User
 from app.database.enums import AppointmentStatus
+from app.database import counters
 from app.database.schemas.appointment import AppointmentCreate, AppointmentUpdate
 
 
@@ -20,7 +21,10 @@ class AppointmentRepository:
             appointment_dict["agent_id"] = ObjectId(appointment_data.agent_id)
         
         appointment = Appointment(**appointment_dict)
-        return await appointment.insert()
+        appointment = await appointment.insert()
+        await counters.track_insert("appointments", appointment.status)
+        await counters.record_activity("appointment", f"New appointment for property {appointment.property_id}")
+        return appointment
     
     @staticmethod
     async def get_appointment_by_id(appointment_id: ObjectId) -> Optional[Appointment]:
@@ -77,11 +81,13 @@ class AppointmentRepository:
         
         update_dict = update_data.dict(exclude_unset=True)
         update_dict["updated_at"] = datetime.utcnow()
+        old_status = appointment.status
         
         for key, value in update_dict.items():
             setattr(appointment, key, value)
         
         await appointment.save()
+        await counters.track_status_change("appointments", old_status, appointment.status)
         return appointment
     
     @staticmethod
@@ -91,10 +97,12 @@ class AppointmentRepository:
         if not appointment:
             return None
         
+        old_status = appointment.status
         appointment.status = status
         appointment.updated_at = datetime.utcnow()
         
         await appointment.save()
+        await counters.track_status_change("appointments", old_status, status)
         return appointment
     
     @staticmethod
@@ -105,6 +113,7 @@ class AppointmentRepository:
             return False
         
         await appointment.delete()
+        await counters.track_delete("appointments", appointment.status)
         return True
     
     @staticmethod
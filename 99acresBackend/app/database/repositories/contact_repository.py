@@ -3,6 +3,7 @@ from datetime import datetime
 from bson import ObjectId
 from app.database.sqlite_models import Contact, Inquiry
 from app.database.enums import ContactStatus, InquiryType
+from app.database import counters
 from app.database.schemas.contact import ContactCreate, ContactUpdate, InquiryCreate
 
 
@@ -93,7 +94,10 @@ class InquiryRepository:
             inquiry_dict["property_id"] = ObjectId(inquiry_data.property_id)
         
         inquiry = Inquiry(**inquiry_dict)
-        return await inquiry.insert()
+        inquiry = await inquiry.insert()
+        await counters.track_insert("inquiries", inquiry.status)
+        await counters.record_activity("inquiry", f"New inquiry from: {inquiry.name}")
+        return inquiry
     
     @staticmethod
     async def get_inquiry_by_id(inquiry_id: ObjectId) -> Optional[Inquiry]:
@@ -132,10 +136,12 @@ class InquiryRepository:
         if not inquiry:
             return None
         
+        old_status = inquiry.status
         inquiry.status = status
         inquiry.updated_at = datetime.utcnow()
         
         await inquiry.save()
+        await counters.track_status_change("inquiries", old_status, status)
         return inquiry
     
     @staticmethod
@@ -146,6 +152,7 @@ class InquiryRepository:
             return False
         
         await inquiry.delete()
+        await counters.track_delete("inquiries", inquiry.status)
         return True
     
     @staticmethod
@@ -0,0 +1,174 @@
+# Loan application and expert consultation repository for MongoDB
+from typing import Any, List, Optional, Tuple
+from datetime import datetime
+from pymongo import ReturnDocument
+from app.database.catalog import load_json
+from app.database.mongodb import get_database, get_read_database
+
+APPLICATIONS_COLLECTION = "loan_applications"
+CONSULTATIONS_COLLECTION = "expert_consultations"
+SEQUENCES_COLLECTION = "sequences"
+
+
+def _plain(value: Any) -> Any:
+    """Store enum members as their values"""
+    return getattr(value, "value", value)
+
+
+def _to_api(doc: Optional[dict]) -> Optional[dict]:
+    """Expose the numeric ``_id`` as ``id``"""
+    if doc is None:
+        return None
+    doc["id"] = doc.pop("_id")
+    return doc
+
+
+class LoanRepository:
+    """Repository for loan applications and expert consultation requests.
+
+    Both collections use small sequential integer ids (``_id``) taken from
+    a counter document in ``sequences``, so ids stay unique across workers.
+    """
+
+    @staticmethod
+    async def next_id(sequence: str) -> int:
+        """Atomically take the next value of a named sequence"""
+        counter = await get_database()[SEQUENCES_COLLECTION].find_one_and_update(
+            {"_id": sequence},
+            {"$inc": {"value": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return counter["value"]
+
+    @staticmethod
+    async def create_application(application: dict) -> dict:
+        """Insert a loan application under a new sequence id"""
+        doc = {key: _plain(value) for key, value in application.items() if key != "id"}
+        doc["_id"] = await LoanRepository.next_id(APPLICATIONS_COLLECTION)
+        await get_database()[APPLICATIONS_COLLECTION].insert_one(doc)
+        return _to_api(doc)
+
+    @staticmethod
+    async def get_application(application_id: int) -> Optional[dict]:
+        """Get a loan application by id"""
+        return _to_api(await get_database()[APPLICATIONS_COLLECTION].find_one({"_id": application_id}))
+
+    @staticmethod
+    async def get_applications(
+        status: Optional[str] = None,
+        loan_type: Optional[str] = None,
+        limit: int = 10
+    ) -> List[dict]:
+        """Newest applications first, optionally filtered by status and loan type"""
+        query = {}
+        if status:
+            query["status"] = _plain(status)
+        if loan_type:
+            query["loan_type"] = _plain(loan_type)
+
+        cursor = get_database()[APPLICATIONS_COLLECTION].find(query).sort("applied_date", -1).limit(limit)
+        return [_to_api(doc) async for doc in cursor]
+
+    @staticmethod
+    async def update_status(
+        application_id: int,
+        new_status: str,
+        remarks: Optional[str] = None
+    ) -> Optional[Tuple[str, dict]]:
+        """Set the status (and approval/disbursement date); returns (old status, updated application)"""
+        new_status = _plain(new_status)
+        update = {"status": new_status}
+        if new_status == "approved":
+            update["approval_date"] = datetime.now()
+        elif new_status == "disbursed":
+            update["disbursement_date"] = datetime.now()
+        if remarks:
+            update["remarks"] = remarks
+
+        before = await get_database()[APPLICATIONS_COLLECTION].find_one_and_update(
+            {"_id": application_id},
+            {"$set": update},
+            return_document=ReturnDocument.BEFORE
+        )
+        if not before:
+            return None
+        return before["status"], _to_api({**before, **update})
+
+    @staticmethod
+    async def get_analytics() -> dict:
+        """Status and type distribution plus amount/tenure/rate figures in one aggregation"""
+        result = await get_read_database()[APPLICATIONS_COLLECTION].aggregate([
+            {"$facet": {
+                "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                "by_type": [{"$group": {"_id": "$loan_type", "count": {"$sum": 1}}}],
+                "totals": [{"$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "total_loan_amount": {"$sum": "$loan_amount"},
+                    "average_loan_amount": {"$avg": "$loan_amount"},
+                    "average_tenure_years": {"$avg": "$tenure_years"},
+                    "average_interest_rate": {"$avg": "$interest_rate"},
+                }}],
+            }}
+        ]).to_list(length=1)
+        facets = result[0] if result else {}
+        totals = (facets.get("totals") or [{}])[0]
+        return {
+            "total_applications": totals.get("count", 0),
+            "status_distribution": {row["_id"]: row["count"] for row in facets.get("by_status", [])},
+            "loan_type_distribution": {row["_id"]: row["count"] for row in facets.get("by_type", [])},
+            "total_loan_amount": totals.get("total_loan_amount") or 0,
+            "average_loan_amount": totals.get("average_loan_amount") or 0,
+            "average_tenure_years": totals.get("average_tenure_years") or 0,
+            "average_interest_rate": totals.get("average_interest_rate") or 0,
+        }
+
+    @staticmethod
+    async def create_consultation(consultation: dict) -> dict:
+        """Insert an expert consultation request under a new sequence id"""
+        doc = {key: value for key, value in consultation.items() if key != "id"}
+        doc["_id"] = await LoanRepository.next_id(CONSULTATIONS_COLLECTION)
+        await get_database()[CONSULTATIONS_COLLECTION].insert_one(doc)
+        return _to_api(doc)
+
+    @staticmethod
+    async def get_consultations(limit: int = 100) -> Tuple[List[dict], dict]:
+        """Newest consultation requests and a summary over all of them"""
+        db = get_database()
+        cursor = db[CONSULTATIONS_COLLECTION].find().sort("submitted_at", -1).limit(limit)
+        consultations = [_to_api(doc) async for doc in cursor]
+
+        result = await db[CONSULTATIONS_COLLECTION].aggregate([
+            {"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "pending": {"$sum": {"$cond": [{"$eq": ["$status", "Pending"]}, 1, 0]}},
+                "high_priority": {"$sum": {"$cond": [{"$eq": ["$priority", "High"]}, 1, 0]}},
+                "average_loan_amount": {"$avg": "$financial_details.loan_amount"},
+            }}
+        ]).to_list(length=1)
+        summary = result[0] if result else {}
+        return consultations, {
+            "total": summary.get("total", 0),
+            "pending": summary.get("pending", 0),
+            "high_priority": summary.get("high_priority", 0),
+            "average_loan_amount": summary.get("average_loan_amount") or 0,
+        }
+
+    @staticmethod
+    async def seed_sample_applications() -> int:
+        """Insert the demo applications from ``app/data`` into an empty collection"""
+        db = get_database()
+        if await db[APPLICATIONS_COLLECTION].estimated_document_count():
+            return 0
+
+        samples = [{"_id": app.pop("id"), **app} for app in load_json("loan_applications")]
+        await db[APPLICATIONS_COLLECTION].insert_many(samples)
+        # Continue numbering after the highest sample id
+        await db[SEQUENCES_COLLECTION].update_one(
+            {"_id": APPLICATIONS_COLLECTION},
+            {"$max": {"value": max(app["_id"] for app in samples)}},
+            upsert=True
+        )
+        return len(samples)
@@ -1,9 +1,14 @@
 # Campaign repository for MongoDB operations
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
 from app.database.schemas.campaign import Campaign, CampaignCreate, CampaignUpdate, CampaignStats
-from app.database.mongodb import get_database
+from app.database.mongodb import get_database, get_read_database
+from app.database import campaign_rollups
+from app.database.campaign_dispatch import JOBS_COLLECTION, start_campaign_send
+from app.database.counter_buffer import counter_buffer
+from app.database.schemas.common import cursor_query, cursor_sort, paginate_cursor
 
 class MongoCampaignRepository:
     """Repository for campaign CRUD operations with MongoDB"""
@@ -80,6 +85,7 @@ class MongoCampaignRepository:
         campaign_dict['clickRate'] = 0.0
         
         result = await db.campaigns.insert_one(campaign_dict)
+        await campaign_rollups.apply_delta(user_id, None, campaign_dict)
         created_campaign = await db.campaigns.find_one({"_id": result.inserted_id})
         return Campaign(**created_campaign)
     
@@ -103,9 +109,10 @@ class MongoCampaignRepository:
         limit: int = 100,
         status: Optional[str] = None,
         campaign_type: Optional[str] = None,
-        user_id: Optional[str] = None
-    ) -> List[Campaign]:
-        """Get campaigns with optional filtering"""
+        user_id: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Campaign], Optional[str]]:
+        """Get a page of campaigns (newest first) and the cursor of the next page"""
         db = get_database()
         try:
             query = {}
@@ -117,18 +124,23 @@ class MongoCampaignRepository:
             if user_id:
                 query['owner_id'] = user_id
             
-            cursor = db.campaigns.find(query).skip(skip).limit(limit).sort("created_at", -1)
-            campaigns = await cursor.to_list(length=limit)
+            if cursor:
+                results = db.campaigns.find(cursor_query(query, cursor))
+            else:
+                results = db.campaigns.find(query).skip(skip)
+            
+            campaigns = await results.sort(cursor_sort()).limit(limit + 1).to_list(length=limit + 1)
+            campaigns, next_cursor = paginate_cursor(campaigns, limit)
             
             # Normalize all campaigns
             normalized_campaigns = [
                 Campaign(**MongoCampaignRepository._normalize_campaign(campaign)) 
                 for campaign in campaigns
             ]
-            return normalized_campaigns
+            return normalized_campaigns, next_cursor
         except Exception as e:
             print(f"Error getting campaigns: {e}")
-            return []
+            return [], None
     
     @staticmethod
     async def update_campaign(campaign_id: str, update_data: CampaignUpdate) -> Optional[Campaign]:
@@ -141,14 +153,18 @@ class MongoCampaignRepository:
             
             update_dict['updated_at'] = datetime.utcnow()
             
-            result = await db.campaigns.update_one(
+            # The previous version gives the exact rollup delta for this write
+            before = await db.campaigns.find_one_and_update(
                 {"_id": ObjectId(campaign_id)},
-                {"$set": update_dict}
+                {"$set": update_dict},
+                return_document=ReturnDocument.BEFORE
             )
+            if not before:
+                return None
             
-            if result.modified_count > 0:
-                return await MongoCampaignRepository.get_campaign_by_id(campaign_id)
-            return None
+            after = {**before, **update_dict}
+            await campaign_rollups.apply_delta(before.get('owner_id'), before, after)
+            return Campaign(**MongoCampaignRepository._normalize_campaign(after))
         except Exception as e:
             print(f"Error updating campaign: {e}")
             return None
@@ -158,74 +174,79 @@ class MongoCampaignRepository:
         """Delete campaign"""
         db = get_database()
         try:
-            result = await db.campaigns.delete_one({"_id": ObjectId(campaign_id)})
-            return result.deleted_count > 0
+            deleted = await db.campaigns.find_one_and_delete({"_id": ObjectId(campaign_id)})
+            if not deleted:
+                return False
+            await campaign_rollups.apply_delta(deleted.get('owner_id'), deleted, None)
+            return True
         except Exception as e:
             print(f"Error deleting campaign: {e}")
             return False
     
     @staticmethod
-    async def get_campaign_stats(user_id: Optional[str] = None) -> CampaignStats:
-        """Get campaign statistics"""
+    async def start_send(campaign_id: str) -> Optional[Tuple[int, int]]:
+        """Queue the campaign for delivery to its recipientList.
+
+        Returns (recipients, jobs), or None if the campaign was already sent.
+        """
         db = get_database()
+        # Claim the campaign atomically so concurrent requests can't both fan out
+        campaign = await db.campaigns.find_one_and_update(
+            {"_id": ObjectId(campaign_id), "dispatch": {"$exists": False}},
+            {"$set": {"dispatch": {"status": "preparing"}}},
+            projection={"recipientList": 1}
+        )
+        if not campaign:
+            return None
         try:
-            query = {}
-            if user_id:
-                query['owner_id'] = user_id
-            
-            # Aggregate statistics
-            pipeline = [
-                {"$match": query},
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_campaigns": {"$sum": 1},
-                        "active_campaigns": {
-                            "$sum": {"$cond": [{"$eq": ["$status", "active"]}, 1, 0]}
-                        },
-                        "paused_campaigns": {
-                            "$sum": {"$cond": [{"$eq": ["$status", "paused"]}, 1, 0]}
-                        },
-                        "completed_campaigns": {
-                            "$sum": {"$cond": [{"$eq": ["$status", "completed"]}, 1, 0]}
-                        },
-                        "total_budget": {"$sum": "$budget"},
-                        "total_spent": {"$sum": "$spent"},
-                        "total_impressions": {"$sum": "$impressions"},
-                        "total_clicks": {"$sum": "$clicks"},
-                        "total_conversions": {"$sum": "$conversions"},
-                        "total_leads": {"$sum": "$leads_generated"}
-                    }
-                }
-            ]
+            result = await start_campaign_send(campaign)
+        except Exception:
+            # Release the claim (and any jobs already queued) so the send can be retried
+            await db[JOBS_COLLECTION].delete_many({"campaign_id": campaign["_id"], "status": "pending"})
+            await db.campaigns.update_one({"_id": campaign["_id"]}, {"$unset": {"dispatch": ""}})
+            raise
+        if result[0] == 0:
+            await db.campaigns.update_one({"_id": campaign["_id"]}, {"$unset": {"dispatch": ""}})
+        return result
+    
+    @staticmethod
+    def record_open(campaign_id: str) -> None:
+        """Count an email open (buffered, flushed as a batched $inc)"""
+        try:
+            counter_buffer.increment("campaigns", ObjectId(campaign_id), "emailsOpened")
+        except Exception as e:
+            print(f"Error recording campaign open: {e}")
+    
+    @staticmethod
+    async def get_campaign_stats(user_id: Optional[str] = None) -> CampaignStats:
+        """Get campaign statistics from the owner's pre-aggregated rollup"""
+        try:
+            stats_data = await campaign_rollups.get_rollup(user_id)
+            if not stats_data:
+                return CampaignStats()
             
-            result = await db.campaigns.aggregate(pipeline).to_list(length=1)
+            by_status = stats_data.get('by_status', {})
+            # Calculate rates
+            total_impressions = stats_data.get('total_impressions', 0)
+            total_clicks = stats_data.get('total_clicks', 0)
             
-            if result:
-                stats_data = result[0]
-                # Calculate rates
-                total_impressions = stats_data.get('total_impressions', 0)
-                total_clicks = stats_data.get('total_clicks', 0)
-                
-                avg_click_rate = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-                avg_conversion_rate = (stats_data.get('total_conversions', 0) / total_clicks * 100) if total_clicks > 0 else 0
-                
-                return CampaignStats(
-                    total_campaigns=stats_data.get('total_campaigns', 0),
-                    active_campaigns=stats_data.get('active_campaigns', 0),
-                    paused_campaigns=stats_data.get('paused_campaigns', 0),
-                    completed_campaigns=stats_data.get('completed_campaigns', 0),
-                    total_budget=stats_data.get('total_budget', 0.0),
-                    total_spent=stats_data.get('total_spent', 0.0),
-                    total_impressions=stats_data.get('total_impressions', 0),
-                    total_clicks=stats_data.get('total_clicks', 0),
-                    total_conversions=stats_data.get('total_conversions', 0),
-                    total_leads=stats_data.get('total_leads', 0),
-                    avg_click_rate=round(avg_click_rate, 2),
-                    avg_conversion_rate=round(avg_conversion_rate, 2)
-                )
+            avg_click_rate = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
+            avg_conversion_rate = (stats_data.get('total_conversions', 0) / total_clicks * 100) if total_clicks > 0 else 0
             
-            return CampaignStats()
+            return CampaignStats(
+                total_campaigns=stats_data.get('total_campaigns', 0),
+                active_campaigns=by_status.get('active', 0),
+                paused_campaigns=by_status.get('paused', 0),
+                completed_campaigns=by_status.get('completed', 0),
+                total_budget=stats_data.get('total_budget', 0.0),
+                total_spent=stats_data.get('total_spent', 0.0),
+                total_impressions=total_impressions,
+                total_clicks=total_clicks,
+                total_conversions=stats_data.get('total_conversions', 0),
+                total_leads=stats_data.get('total_leads', 0),
+                avg_click_rate=round(avg_click_rate, 2),
+                avg_conversion_rate=round(avg_conversion_rate, 2)
+            )
         except Exception as e:
             print(f"Error getting campaign stats: {e}")
             return CampaignStats()
@@ -233,7 +254,7 @@ class MongoCampaignRepository:
     @staticmethod
     async def count_campaigns(status: Optional[str] = None, user_id: Optional[str] = None) -> int:
         """Count campaigns with optional filtering"""
-        db = get_database()
+        db = get_read_database()
         try:
             query = {}
             if status:
@@ -1,9 +1,16 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from bson import ObjectId
 from app.database.mongo_models import User, UserRole
 from app.database.mongodb import get_database
-from app.utils.auth import get_password_hash, verify_token
+from app.database import counters
+from app.database.schemas.common import cursor_query, cursor_sort, paginate_cursor
+from app.utils.auth import get_password_hash_async, verify_token
+from app.utils.text import prefix_match, add_normalized_fields
+from app.utils.principal_cache import principal_cache
+
+# Lowercase shadow fields used by the prefix search in get_users
+NORMALIZED_FIELDS = ("full_name", "email")
 
 class MongoUserRepository:
     
@@ -14,13 +21,17 @@ class MongoUserRepository:
         
         # Hash the password
         if 'password' in user_data:
-            user_data['password_hash'] = get_password_hash(user_data.pop('password'))
+            user_data['password_hash'] = await get_password_hash_async(user_data.pop('password'))
         
         user_data['created_at'] = datetime.utcnow()
+        add_normalized_fields(user_data, NORMALIZED_FIELDS)
         
         # Insert user
         result = await db.users.insert_one(user_data)
         
+        await counters.track_insert("users")
+        await counters.record_activity("user", f"New user registration: {user_data.get('full_name')}")
+        
         # Get the created user
         created_user = await db.users.find_one({"_id": result.inserted_id})
         return User(**created_user)
@@ -58,12 +69,17 @@ class MongoUserRepository:
             
     @staticmethod
     async def get_user_from_token(token: str) -> Optional[User]:
-        """Get user from JWT token"""
+        """Get user from JWT token (cached per token until it expires or the user changes)"""
         try:
             payload = verify_token(token)
             if payload and "sub" in payload:
                 user_id = payload["sub"]
-                return await MongoUserRepository.get_user_by_id(user_id)
+                user = principal_cache.get(user_id, payload.get("exp"))
+                if user is None:
+                    user = await MongoUserRepository.get_user_by_id(user_id)
+                    if user is not None:
+                        principal_cache.set(user_id, payload.get("exp"), user)
+                return user
             return None
         except Exception as e:
             print(f"Error verifying token: {e}")
@@ -75,11 +91,13 @@ class MongoUserRepository:
         db = get_database()
         try:
             update_data['updated_at'] = datetime.utcnow()
+            add_normalized_fields(update_data, NORMALIZED_FIELDS)
             
             result = await db.users.update_one(
                 {"_id": ObjectId(user_id)},
                 {"$set": update_data}
             )
+            principal_cache.invalidate(user_id)
             
             if result.modified_count > 0:
                 user_doc = await db.users.find_one({"_id": ObjectId(user_id)})
@@ -106,8 +124,12 @@ class MongoUserRepository:
         """Delete user"""
         db = get_database()
         try:
-            result = await db.users.delete_one({"_id": ObjectId(user_id)})
-            return result.deleted_count > 0
+            user_doc = await db.users.find_one_and_delete({"_id": ObjectId(user_id)}, {"_id": 1})
+            principal_cache.invalidate(user_id)
+            if user_doc is None:
+                return False
+            await counters.track_delete("users")
+            return True
         except Exception as e:
             print(f"Error deleting user: {e}")
             return False
@@ -117,9 +139,10 @@ class MongoUserRepository:
         skip: int = 0,
         limit: int = 20,
         role: Optional[UserRole] = None,
-        search: Optional[str] = None
-    ) -> List[User]:
-        """Get users with filters"""
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[User], Optional[str]]:
+        """Get a page of users (newest first) and the cursor of the next page"""
         db = get_database()
         try:
             query = {}
@@ -128,20 +151,23 @@ class MongoUserRepository:
                 query['role'] = role
             
             if search:
+                # Anchored prefix matches on the normalized fields can use their indexes
                 query["$or"] = [
-                    {"full_name": {"$regex": search, "$options": "i"}},
-                    {"email": {"$regex": search, "$options": "i"}}
+                    {"full_name_norm": prefix_match(search)},
+                    {"email_norm": prefix_match(search)}
                 ]
             
-            cursor = db.users.find(query).skip(skip).limit(limit)
-            users = []
-            async for user_doc in cursor:
-                users.append(User(**user_doc))
+            if cursor:
+                results = db.users.find(cursor_query(query, cursor))
+            else:
+                results = db.users.find(query).skip(skip)
             
-            return users
+            docs = await results.sort(cursor_sort()).limit(limit + 1).to_list(length=limit + 1)
+            page, next_cursor = paginate_cursor(docs, limit)
+            return [User(**user_doc) for user_doc in page], next_cursor
         except Exception as e:
             print(f"Error getting users: {e}")
-            return []
+            return [], None
     
     @staticmethod
     async def count_users(role: Optional[UserRole] = None) -> int:
@@ -0,0 +1,105 @@
+# Location queries over the properties collection (2dsphere index on ``location``)
+from typing import List, Optional
+from bson import ObjectId
+from app.database.mongodb import get_read_database
+from app.utils.geo import geo_point, bounds_polygon
+
+# Internal shadow fields not returned to map clients
+HIDDEN_FIELDS = {"search_text": 0, "city_norm": 0, "state_norm": 0}
+
+# Widest viewport (degrees of longitude) still queried as a GeoJSON polygon
+MAX_POLYGON_SPAN = 180
+
+
+def _serialize(doc: dict) -> dict:
+    doc["id"] = str(doc.pop("_id"))
+    for key, value in doc.items():
+        if isinstance(value, ObjectId):
+            doc[key] = str(value)
+    return doc
+
+
+class PropertyGeoRepository:
+    """Radius and viewport searches answered by the ``location`` 2dsphere index"""
+
+    @staticmethod
+    def _filters(
+        property_type: Optional[str] = None,
+        listing_type: Optional[str] = None,
+        status: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        bedrooms: Optional[int] = None
+    ) -> dict:
+        query = {}
+        if status:
+            query["status"] = status
+        if property_type:
+            query["property_type"] = property_type
+        if listing_type:
+            query["listing_type"] = listing_type
+        if bedrooms is not None:
+            query["bedrooms"] = bedrooms
+        if min_price is not None or max_price is not None:
+            query["price"] = {}
+            if min_price is not None:
+                query["price"]["$gte"] = min_price
+            if max_price is not None:
+                query["price"]["$lte"] = max_price
+        return query
+
+    @staticmethod
+    async def find_nearby(
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        skip: int = 0,
+        limit: int = 20,
+        **filters
+    ) -> List[dict]:
+        """Properties within ``radius_km``, nearest first, with ``distance_km``.
+
+        The filters go into ``$geoNear.query`` so they are applied while the
+        index is walked rather than on the sorted output.
+        """
+        pipeline = [
+            {"$geoNear": {
+                "near": geo_point(latitude, longitude),
+                "key": "location",
+                "distanceField": "distance_km",
+                "distanceMultiplier": 0.001,
+                "maxDistance": radius_km * 1000,
+                "query": PropertyGeoRepository._filters(**filters),
+                "spherical": True,
+            }},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": HIDDEN_FIELDS},
+        ]
+        cursor = get_read_database().properties.aggregate(pipeline)
+        return [_serialize(doc) async for doc in cursor]
+
+    @staticmethod
+    async def find_in_bounds(
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        limit: int = 200,
+        **filters
+    ) -> List[dict]:
+        """Properties inside a map viewport (at most ``limit``, cheapest first).
+
+        The 2dsphere index narrows the search to the (densified) polygon; the
+        plain coordinate ranges then trim it to the exact box. A viewport
+        spanning 180 degrees of longitude or more (zoomed all the way out) is
+        larger than a hemisphere, which MongoDB would read as the
+        complementary region, so only the coordinate ranges are used then.
+        """
+        query = PropertyGeoRepository._filters(**filters)
+        if east - west < MAX_POLYGON_SPAN:
+            query["location"] = {"$geoWithin": {"$geometry": bounds_polygon(south, west, north, east)}}
+        query["latitude"] = {"$gte": south, "$lte": north}
+        query["longitude"] = {"$gte": west, "$lte": east}
+        cursor = get_read_database().properties.find(query, HIDDEN_FIELDS).sort("price", 1).limit(limit)
+        return [_serialize(doc) async for doc in cursor]
@@ -1,8 +1,24 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from bson import ObjectId
-from datetime import datetime
+from datetime import datetime, timedelta
+from app.config import settings
+from app.database.mongodb import get_database, get_read_database
+from app.database import counters
+from app.database.counter_buffer import counter_buffer
 from app.database.sqlite_models import Property
 from app.database.enums import PropertyType, ListingType, PropertyStatus
+from app.database.schemas.common import cursor_query, cursor_sort, paginate_cursor
+from app.utils.text import (
+    normalize_text, add_normalized_fields, build_search_text, tokenize,
+    PROPERTY_NORMALIZED_FIELDS as NORMALIZED_FIELDS, PROPERTY_SEARCH_FIELDS as SEARCH_FIELDS
+)
+from app.utils.geo import add_location_field, geo_point
+
+# Materialized statistics document maintained alongside the collection
+STATS_COLLECTION = "stats"
+STATS_ID = "properties"
+RECENT_DAYS = 30
+STATS_FIELDS = ("status", "property_type", "city", "is_featured", "created_at")
 
 
 class PropertyRepository:
@@ -22,6 +38,8 @@ class PropertyRepository:
             'city': property_data.get('city'),
             'state': property_data.get('state'),
             'pincode': property_data.get('pincode') or '',
+            'latitude': property_data.get('latitude'),
+            'longitude': property_data.get('longitude'),
             
             # Property details
             'bedrooms': property_data.get('bedrooms'),
@@ -50,11 +68,21 @@ class PropertyRepository:
         
         # Remove None values
         model_data = {k: v for k, v in model_data.items() if v is not None}
+        add_normalized_fields(model_data, NORMALIZED_FIELDS)
+        add_location_field(model_data)
+        model_data['search_text'] = build_search_text(model_data, SEARCH_FIELDS)
         
         property_obj = Property(**model_data)
         await property_obj.insert()
+        await PropertyRepository._apply_stats_delta(PropertyRepository._stats_fields(property_obj), 1)
+        await counters.track_insert("properties", property_obj.status)
+        await counters.record_activity("property", f"New property: {property_obj.title}")
         return property_obj
     
+    @staticmethod
+    def _stats_fields(property_obj: Property) -> dict:
+        return {field: getattr(property_obj, field, None) for field in STATS_FIELDS}
+    
     @staticmethod
     async def get_property_by_id(property_id: str) -> Optional[Property]:
         """Get property by ID"""
@@ -69,10 +97,25 @@ class PropertyRepository:
         try:
             property_obj = await Property.get(ObjectId(property_id))
             if property_obj:
+                before = PropertyRepository._stats_fields(property_obj)
                 update_data['updated_at'] = datetime.utcnow()
+                add_normalized_fields(update_data, NORMALIZED_FIELDS)
                 for key, value in update_data.items():
                     setattr(property_obj, key, value)
+                if any(field in update_data for field in SEARCH_FIELDS):
+                    property_obj.search_text = build_search_text(
+                        {field: getattr(property_obj, field, None) for field in SEARCH_FIELDS}, SEARCH_FIELDS
+                    )
+                if 'latitude' in update_data or 'longitude' in update_data:
+                    property_obj.location = geo_point(
+                        getattr(property_obj, 'latitude', None), getattr(property_obj, 'longitude', None)
+                    )
                 await property_obj.save()
+                after = PropertyRepository._stats_fields(property_obj)
+                if after != before:
+                    await PropertyRepository._apply_stats_delta(before, -1)
+                    await PropertyRepository._apply_stats_delta(after, 1)
+                    await counters.track_status_change("properties", before["status"], after["status"])
                 return property_obj
         except:
             pass
@@ -85,6 +128,8 @@ class PropertyRepository:
             property_obj = await Property.get(ObjectId(property_id))
             if property_obj:
                 await property_obj.delete()
+                await PropertyRepository._apply_stats_delta(PropertyRepository._stats_fields(property_obj), -1)
+                await counters.track_delete("properties", property_obj.status)
                 return True
         except:
             pass
@@ -104,15 +149,22 @@ class PropertyRepository:
         bedrooms: Optional[int] = None,
         is_featured: Optional[bool] = None,
         owner_id: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> List[Property]:
-        """Get properties with filters"""
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Property], Optional[str]]:
+        """Get a page of properties with filters and the cursor of the next page.
+
+        Pass the returned cursor back to continue after the last item with an
+        index range query instead of skipping; ``skip`` only applies to the
+        first request and to relevance-ranked text search, which has no
+        stable keyset.
+        """
         query = {}
         
         if city:
-            query['city'] = {"$regex": city, "$options": "i"}
+            query['city_norm'] = normalize_text(city)
         if state:
-            query['state'] = {"$regex": state, "$options": "i"}
+            query['state_norm'] = normalize_text(state)
         if property_type:
             query['property_type'] = property_type
         if listing_type:
@@ -133,18 +185,19 @@ class PropertyRepository:
         if owner_id:
             query['owner_id'] = ObjectId(owner_id)
         
-        properties = Property.find(query)
-        
         if search:
-            properties = properties.find({
-                "$or": [
-                    {"title": {"$regex": search, "$options": "i"}},
-                    {"description": {"$regex": search, "$options": "i"}},
-                    {"area": {"$regex": search, "$options": "i"}}
-                ]
-            })
+            # Text index lookup ranked by relevance instead of three unanchored regexes
+            query['$text'] = {"$search": " ".join(tokenize(search)) or search}
+            properties = Property.find(query).sort([("score", {"$meta": "textScore"})])
+            return await properties.skip(skip).limit(limit).to_list(), None
+        
+        if cursor:
+            properties = Property.find(cursor_query(query, cursor))
+        else:
+            properties = Property.find(query).skip(skip)
         
-        return await properties.skip(skip).limit(limit).to_list()
+        docs = await properties.sort(cursor_sort()).limit(limit + 1).to_list()
+        return paginate_cursor(docs, limit)
     
     @staticmethod
     async def count_properties(
@@ -159,9 +212,9 @@ class PropertyRepository:
         query = {}
         
         if city:
-            query['city'] = {"$regex": city, "$options": "i"}
+            query['city_norm'] = normalize_text(city)
         if state:
-            query['state'] = {"$regex": state, "$options": "i"}
+            query['state_norm'] = normalize_text(state)
         if property_type:
             query['property_type'] = property_type
         if listing_type:
@@ -171,56 +224,123 @@ class PropertyRepository:
         if owner_id:
             query['owner_id'] = ObjectId(owner_id)
         
-        return await Property.find(query).count()
+        return await get_read_database().properties.count_documents(query)
     
     @staticmethod
     async def increment_views(property_id: str) -> None:
-        """Increment property views count"""
+        """Increment property views count (buffered, written by the periodic counter flush)"""
         try:
-            property_obj = await Property.get(ObjectId(property_id))
-            if property_obj:
-                property_obj.views_count += 1
-                await property_obj.save()
+            counter_buffer.increment("properties", ObjectId(property_id), "views")
         except:
             pass
     
     @staticmethod
-    async def get_property_stats() -> dict:
-        """Get property statistics"""
-        total_properties = await Property.find().count()
-        pending_properties = await Property.find(Property.status == PropertyStatus.PENDING).count()
-        approved_properties = await Property.find(Property.status == PropertyStatus.ACTIVE).count()
-        featured_properties = await Property.find(Property.is_featured == True).count()
+    def _stats_pipeline(since: datetime) -> list:
+        """One $facet aggregation producing every property statistics breakdown"""
+        return [
+            {"$facet": {
+                "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                "by_type": [{"$group": {"_id": "$property_type", "count": {"$sum": 1}}}],
+                "by_city": [{"$group": {"_id": "$city", "count": {"$sum": 1}}}],
+                "featured": [{"$match": {"is_featured": True}}, {"$count": "count"}],
+                "recent": [{"$match": {"created_at": {"$gte": since}}}, {"$count": "count"}],
+            }}
+        ]
+    
+    @staticmethod
+    def _stats_key(value) -> str:
+        """Field-name safe key for a breakdown value (no dots or leading $)"""
+        value = getattr(value, "value", value)
+        return str(value).replace(".", "_").lstrip("$") if value is not None else "unknown"
+    
+    @staticmethod
+    async def _compute_stats_snapshot() -> dict:
+        """Collect raw counts for every breakdown in a single round trip.
         
-        # Properties by type
-        types_count = {}
-        for prop_type in PropertyType:
-            count = await Property.find(Property.property_type == prop_type).count()
-            types_count[prop_type.value] = count
+        Reads the primary: the snapshot is persisted and then kept current
+        with deltas, so any secondary lag here would never be corrected.
+        """
+        since = datetime.utcnow() - timedelta(days=RECENT_DAYS)
+        pipeline = PropertyRepository._stats_pipeline(since)
+        result = await get_database().properties.aggregate(pipeline).to_list(length=1)
+        facets = result[0] if result else {}
         
-        # Properties by city (top 10)
-        pipeline = [
-            {"$group": {"_id": "$city", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 10}
-        ]
-        cities_count = {}
-        async for doc in Property.aggregate(pipeline):
-            cities_count[doc["_id"]] = doc["count"]
+        def breakdown(name: str) -> dict:
+            return {PropertyRepository._stats_key(doc["_id"]): doc["count"] for doc in facets.get(name, [])}
         
-        # Recent listings (last 30 days)
-        from datetime import timedelta
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_listings = await Property.find(
-            Property.created_at >= thirty_days_ago
-        ).count()
+        def single(name: str) -> int:
+            docs = facets.get(name, [])
+            return docs[0]["count"] if docs else 0
         
+        by_status = breakdown("by_status")
         return {
-            "total_properties": total_properties,
-            "pending_properties": pending_properties,
-            "approved_properties": approved_properties,
-            "featured_properties": featured_properties,
-            "properties_by_type": types_count,
-            "properties_by_city": cities_count,
-            "recent_listings": recent_listings
-        }
\ No newline at end of file
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_type": breakdown("by_type"),
+            "by_city": breakdown("by_city"),
+            "featured": single("featured"),
+            "recent": single("recent"),
+            "refreshed_at": datetime.utcnow(),
+        }
+    
+    @staticmethod
+    def _format_stats(snapshot: dict) -> dict:
+        by_type = snapshot.get("by_type", {})
+        top_cities = sorted(snapshot.get("by_city", {}).items(), key=lambda item: item[1], reverse=True)[:10]
+        return {
+            "total_properties": snapshot.get("total", 0),
+            "pending_properties": snapshot.get("by_status", {}).get("pending", 0),
+            "approved_properties": snapshot.get("by_status", {}).get("active", 0),
+            "featured_properties": snapshot.get("featured", 0),
+            "properties_by_type": {prop_type.value: by_type.get(prop_type.value, 0) for prop_type in PropertyType},
+            "properties_by_city": {city: count for city, count in top_cities if count > 0},
+            "recent_listings": snapshot.get("recent", 0)
+        }
+    
+    @staticmethod
+    async def refresh_property_stats() -> dict:
+        """Recompute the materialized statistics document from the collection"""
+        snapshot = await PropertyRepository._compute_stats_snapshot()
+        await get_database()[STATS_COLLECTION].replace_one({"_id": STATS_ID}, snapshot, upsert=True)
+        return snapshot
+    
+    @staticmethod
+    async def _apply_stats_delta(property_data: dict, sign: int) -> None:
+        """Count a property in (sign=1) or out of (sign=-1) the materialized statistics.
+        
+        Only touches an existing snapshot; the next full refresh rebuilds it
+        if it does not exist yet.
+        """
+        increments = {
+            "total": sign,
+            f"by_status.{PropertyRepository._stats_key(property_data.get('status'))}": sign,
+            f"by_type.{PropertyRepository._stats_key(property_data.get('property_type'))}": sign,
+            f"by_city.{PropertyRepository._stats_key(property_data.get('city'))}": sign,
+        }
+        if property_data.get("is_featured"):
+            increments["featured"] = sign
+        created_at = property_data.get("created_at")
+        if created_at and created_at >= datetime.utcnow() - timedelta(days=RECENT_DAYS):
+            increments["recent"] = sign
+        try:
+            await get_database()[STATS_COLLECTION].update_one({"_id": STATS_ID}, {"$inc": increments})
+        except Exception as e:
+            print(f"Error updating property stats: {e}")
+    
+    @staticmethod
+    async def get_property_stats(materialized: bool = True) -> dict:
+        """Get property statistics.
+        
+        Reads the materialized stats document (kept current by create, update
+        and delete) and falls back to one $facet aggregation when it is
+        missing or older than PROPERTY_STATS_MAX_AGE_SECONDS, which also bounds
+        the drift of the rolling recent_listings window.
+        """
+        if not materialized:
+            return PropertyRepository._format_stats(await PropertyRepository._compute_stats_snapshot())
+        
+        snapshot = await get_read_database()[STATS_COLLECTION].find_one({"_id": STATS_ID})
+        max_age = timedelta(seconds=settings.PROPERTY_STATS_MAX_AGE_SECONDS)
+        if not snapshot or snapshot["refreshed_at"] < datetime.utcnow() - max_age:
+            snapshot = await PropertyRepository.refresh_property_stats()
+        return PropertyRepository._format_stats(snapshot)
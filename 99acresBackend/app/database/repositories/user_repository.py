@@ -3,7 +3,8 @@ from datetime import datetime
 from sqlalchemy import select
 from app.database.sqlite_models import User
 from app.database.enums import UserRole
-from app.utils.auth import get_password_hash, verify_token
+from app.utils.auth import get_password_hash_async, verify_token
+from app.utils.principal_cache import principal_cache
 from app.database.sqlite_db import get_session
 
 
@@ -14,7 +15,7 @@ class UserRepository:
         """Create a new user"""
         # Hash the password
         if 'password' in user_data:
-            user_data['password_hash'] = get_password_hash(user_data.pop('password'))
+            user_data['password_hash'] = await get_password_hash_async(user_data.pop('password'))
         
         user = User(**user_data)
         async with get_session() as session:
@@ -90,6 +91,8 @@ class UserRepository:
                         setattr(user, key, value)
                     await session.commit()
                     await session.refresh(user)
+                    # Role, block state or password may have changed
+                    principal_cache.invalidate(user_id)
                     return user
                 return None
             except Exception as e:
@@ -125,6 +128,7 @@ class UserRepository:
                 if user:
                     await session.delete(user)
                     await session.commit()
+                    principal_cache.invalidate(user_id)
                     return True
                 return False
             except Exception as e:
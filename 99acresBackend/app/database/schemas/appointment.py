@@ -1,9 +1,24 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from app.database.enums import AppointmentStatus
 
 
+def parse_appointment_date(value) -> datetime:
+    """Parse an appointment date given as DD/MM/YYYY, YYYY-MM-DD or a datetime"""
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        raise ValueError("Invalid date format. Use DD/MM/YYYY or YYYY-MM-DD")
+    try:
+        if '/' in value:
+            day, month, year = value.split('/')
+            return datetime(int(year), int(month), int(day))
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid date format. Use DD/MM/YYYY or YYYY-MM-DD")
+
+
 # Base schemas
 class AppointmentBase(BaseModel):
     client_name: str
@@ -20,14 +35,25 @@ class AppointmentBase(BaseModel):
 class AppointmentCreate(AppointmentBase):
     property_id: str
     agent_id: Optional[str] = None
+    appointment_date: datetime  # Accepts DD/MM/YYYY or YYYY-MM-DD
+
+    @field_validator('appointment_date', mode='before')
+    @classmethod
+    def validate_appointment_date(cls, value):
+        return parse_appointment_date(value)
 
 
 class AppointmentUpdate(BaseModel):
-    appointment_date: Optional[str] = None
+    appointment_date: Optional[datetime] = None  # Accepts DD/MM/YYYY or YYYY-MM-DD
     appointment_time: Optional[str] = None
     status: Optional[AppointmentStatus] = None
     notes: Optional[str] = None
 
+    @field_validator('appointment_date', mode='before')
+    @classmethod
+    def validate_appointment_date(cls, value):
+        return None if value is None else parse_appointment_date(value)
+
 
 # Response schemas
 class AppointmentResponse(AppointmentBase):
@@ -1,4 +1,6 @@
-from typing import Any, List, Optional, Generic, TypeVar
+import base64
+from typing import Any, List, Optional, Generic, Tuple, TypeVar
+from bson import json_util
 from pydantic import BaseModel
 
 T = TypeVar('T')
@@ -22,6 +24,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 class MessageResponse(BaseModel):
@@ -33,4 +36,66 @@ class Token(BaseModel):
     token_type: str = "bearer"
     refresh_token: Optional[str] = None
     expires_in: Optional[int] = None
-    user: Optional[dict] = None
\ No newline at end of file
+    user: Optional[dict] = None
+
+# Keyset (cursor) pagination
+#
+# A cursor is the (sort value, _id) of the last item of a page, so the next
+# page is a range query on an index instead of a skip over every earlier
+# document. Results are ordered by the sort field with _id as tie-breaker.
+
+def encode_cursor(sort_value: Any, doc_id: Any) -> str:
+    """Encode the position after a document as an opaque URL-safe token"""
+    raw = json_util.dumps([sort_value, doc_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Decode a cursor token; raises ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, doc_id = json_util.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return sort_value, doc_id
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def cursor_sort(sort_field: str = "created_at", direction: int = -1) -> List[Tuple[str, int]]:
+    """Sort specification matching the keyset filter"""
+    if sort_field == "_id":
+        return [("_id", direction)]
+    return [(sort_field, direction), ("_id", direction)]
+
+
+def cursor_query(query: dict, cursor: Optional[str], sort_field: str = "created_at", direction: int = -1) -> dict:
+    """Add the keyset condition for ``cursor`` to a Mongo filter"""
+    if not cursor:
+        return query
+
+    sort_value, doc_id = decode_cursor(cursor)
+    op = "$lt" if direction < 0 else "$gt"
+    if sort_field == "_id":
+        after = {"_id": {op: doc_id}}
+    else:
+        after = {"$or": [
+            {sort_field: {op: sort_value}},
+            {sort_field: sort_value, "_id": {op: doc_id}}
+        ]}
+    return {"$and": [query, after]} if query else after
+
+
+def _cursor_value(doc: Any, field: str) -> Any:
+    if isinstance(doc, dict):
+        return doc.get(field)
+    if field == "_id":
+        return getattr(doc, "id", None)
+    return getattr(doc, field, None)
+
+
+def paginate_cursor(docs: List[Any], limit: int, sort_field: str = "created_at") -> Tuple[List[Any], Optional[str]]:
+    """Trim a ``limit + 1`` fetch to one page and build the cursor of the next page"""
+    if len(docs) <= limit:
+        return docs, None
+    page = docs[:limit]
+    last = page[-1]
+    return page, encode_cursor(_cursor_value(last, sort_field), _cursor_value(last, "_id"))
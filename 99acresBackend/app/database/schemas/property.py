@@ -15,6 +15,8 @@ class PropertyBase(BaseModel):
     state: str
     area: str
     pincode: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 # Request schemas
@@ -50,6 +52,8 @@ class PropertyUpdate(BaseModel):
     state: Optional[str] = None
     area: Optional[str] = None
     pincode: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     carpet_area: Optional[float] = None
     built_area: Optional[float] = None
     plot_area: Optional[float] = None
@@ -0,0 +1,117 @@
+import heapq
+import math
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from app.utils.text import tokenize
+
+DocKey = Tuple[str, Any]  # (tier, listing id)
+
+
+class SearchIndex:
+    """In-process inverted index with BM25 ranking over the listing tiers.
+
+    Each listing is tokenized once when it is added. A query only touches the
+    posting lists of its own terms and keeps the best ``k`` scores in a heap,
+    so the cost depends on how many listings contain the terms, not on the
+    size of the catalog.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[DocKey, int]] = {}
+        self._doc_terms: Dict[DocKey, Counter] = {}
+        self._doc_length: Dict[DocKey, int] = {}
+        self._docs: Dict[DocKey, dict] = {}
+        self._tier_fields: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+
+    def configure(self, tier: str, fields: Dict[str, int]) -> None:
+        """Set the searchable fields of a tier and their weights (term frequency multipliers)"""
+        self._tier_fields[tier] = fields
+
+    def _field_tokens(self, tier: str, listing: dict) -> Counter:
+        terms = Counter()
+        for field, weight in self._tier_fields[tier].items():
+            value = listing.get(field)
+            if isinstance(value, (list, tuple)):
+                value = " ".join(str(v) for v in value)
+            for token in tokenize(value):
+                terms[token] += weight
+        return terms
+
+    def add(self, tier: str, listing_id: Any, listing: dict) -> None:
+        """Index (or re-index) one listing"""
+        key = (tier, listing_id)
+        if key in self._docs:
+            self.remove(tier, listing_id)
+
+        terms = self._field_tokens(tier, listing)
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[key] = frequency
+
+        length = sum(terms.values())
+        self._doc_terms[key] = terms
+        self._doc_length[key] = length
+        self._docs[key] = listing
+        self._total_length += length
+
+    def remove(self, tier: str, listing_id: Any) -> None:
+        """Drop one listing from the index"""
+        key = (tier, listing_id)
+        terms = self._doc_terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._doc_length.pop(key)
+        del self._docs[key]
+
+    def clear_tier(self, tier: str) -> None:
+        """Drop every listing of a tier"""
+        for key in [key for key in self._docs if key[0] == tier]:
+            self.remove(*key)
+
+    def search(
+        self,
+        query: str,
+        tiers: Optional[Sequence[str]] = None,
+        offset: int = 0,
+        limit: int = 10
+    ) -> Tuple[List[Tuple[float, str, dict]], int]:
+        """Rank listings for a query with BM25.
+
+        Returns the requested page as ``(score, tier, listing)`` tuples and the
+        number of listings that matched at least one query term.
+        """
+        terms = set(tokenize(query))
+        doc_count = len(self._docs)
+        if not terms or not doc_count:
+            return [], 0
+
+        allowed = set(tiers) if tiers else None
+        average_length = self._total_length / doc_count
+        scores: Dict[DocKey, float] = {}
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, frequency in postings.items():
+                if allowed is not None and key[0] not in allowed:
+                    continue
+                norm = self.K1 * (1 - self.B + self.B * self._doc_length[key] / average_length)
+                scores[key] = scores.get(key, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + norm)
+
+        top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: item[1])
+        page = [(score, key[0], self._docs[key]) for key, score in top[offset:]]
+        return page, len(scores)
+
+
+search_index = SearchIndex()
@@ -9,6 +9,7 @@ from app.database.repositories.property_repository import PropertyRepository
 from app.database.repositories.appointment_repository import AppointmentRepository
 from app.database.models import User
 from app.utils.dependencies import get_admin_user
+from app.utils.query_batch import gather_queries
 
 router = APIRouter()
 
@@ -16,11 +17,14 @@ router = APIRouter()
 @router.get("/dashboard/stats", response_model=AdminDashboard)
 async def get_admin_dashboard_stats(current_user: User = Depends(get_admin_user)):
     """Get admin dashboard statistics"""
-    # Get user stats
-    user_stats = await UserRepository.get_user_stats()
-    
-    # Get property stats
-    property_stats = await PropertyRepository.get_property_stats()
+    # User and property stats are independent, fetch them together
+    results = await gather_queries(
+        "admin_dashboard_stats",
+        users=UserRepository.get_user_stats(),
+        properties=PropertyRepository.get_property_stats()
+    )
+    user_stats = results["users"]
+    property_stats = results["properties"]
     
     # Mock data for additional dashboard metrics (you can implement these)
     dashboard_data = {
@@ -63,9 +67,15 @@ async def get_admin_dashboard_stats(current_user: User = Depends(get_admin_user)
 @router.get("/stats", response_model=DashboardStats)
 async def get_admin_stats(current_user: User = Depends(get_admin_user)):
     """Get basic admin statistics"""
-    user_stats = await UserRepository.get_user_stats()
-    property_stats = await PropertyRepository.get_property_stats()
-    total_appointments = await AppointmentRepository.count_all_appointments()
+    results = await gather_queries(
+        "admin_stats",
+        users=UserRepository.get_user_stats(),
+        properties=PropertyRepository.get_property_stats(),
+        appointments=AppointmentRepository.count_all_appointments()
+    )
+    user_stats = results["users"]
+    property_stats = results["properties"]
+    total_appointments = results["appointments"]
     
     stats = {
         "total_users": user_stats["total_users"],
@@ -1,13 +1,16 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorClient
 from app.database.schemas.appointment import (
-    AppointmentCreate, AppointmentUpdate, AppointmentResponse, AppointmentStats
+    AppointmentCreate, AppointmentUpdate, AppointmentResponse, AppointmentStats,
+    parse_appointment_date
+)
+from app.database.schemas.common import (
+    SuccessResponse, PaginatedResponse, cursor_query, cursor_sort, paginate_cursor
 )
-from app.database.schemas.common import SuccessResponse, PaginatedResponse
 from app.database.models import User, Appointment, AppointmentStatus
+from app.database import counters
 from app.utils.dependencies import get_current_active_user, get_admin_user, get_agent_or_admin_user
 
 router = APIRouter()
@@ -26,6 +29,7 @@ async def create_appointment(
         'name': appointment_data.client_name,  # Map client_name to name
         'phone': appointment_data.client_phone,  # Map client_phone to phone
         'email': appointment_data.client_email,  # Map client_email to email
+        'appointment_date': appointment_data.appointment_date,  # Parsed by the schema validator
         'appointment_time': appointment_data.appointment_time,
         'message': appointment_data.notes,  # Map notes to message
     }
@@ -34,25 +38,10 @@ async def create_appointment(
     if appointment_data.agent_id:
         model_data['agent_id'] = str(appointment_data.agent_id)
     
-    # Parse appointment_date from string to datetime
-    try:
-        # Assuming date format is DD/MM/YYYY based on error message
-        date_str = appointment_data.appointment_date
-        if '/' in date_str:
-            # Handle DD/MM/YYYY format
-            day, month, year = date_str.split('/')
-            model_data['appointment_date'] = datetime(int(year), int(month), int(day))
-        else:
-            # Handle YYYY-MM-DD format
-            model_data['appointment_date'] = datetime.fromisoformat(date_str)
-    except (ValueError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid date format. Use DD/MM/YYYY or YYYY-MM-DD"
-        )
-    
     appointment = Appointment(**model_data)
     await appointment.insert()
+    await counters.track_insert("appointments", appointment.status)
+    await counters.record_activity("appointment", f"New appointment for property {appointment.property_id}")
     
     return SuccessResponse(
         message="Appointment created successfully",
@@ -66,9 +55,10 @@ async def get_appointments(
     size: int = Query(20, ge=1, le=100),
     status_filter: Optional[AppointmentStatus] = None,
     date: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get appointments"""
+    """Get appointments, latest appointment date first"""
     skip = (page - 1) * size
     
     # Build query based on user role
@@ -87,51 +77,26 @@ async def get_appointments(
     if status_filter:
         query["status"] = status_filter
     if date:
-        query["appointment_date"] = date
-    
-    # First, let's clean up any corrupted appointment_date fields in the database
-    from app.config import settings
+        # Dates are stored as datetimes (see `maintenance normalize-appointment-dates`),
+        # so a day filter is a range on the appointment_date indexes
+        try:
+            day = parse_appointment_date(date)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        query["appointment_date"] = {"$gte": day, "$lt": day + timedelta(days=1)}
     
+    # A cursor continues after the previous page
+    # using the appointment_date indexes instead of skipping
     try:
-        # Quick cleanup of corrupted data
-        client = AsyncIOMotorClient(settings.MONGODB_URL)
-        db = client[settings.DATABASE_NAME]
-        collection = db["appointments"]
-        
-        # Fix records where appointment_date is the literal string 'string'
-        await collection.update_many(
-            {"appointment_date": "string"},
-            {"$set": {"appointment_date": datetime.utcnow()}}
-        )
-        
-        # Fix any other string dates that aren't valid ISO dates
-        cursor = collection.find({"appointment_date": {"$type": "string", "$ne": "string"}})
-        async for doc in cursor:
-            try:
-                date_str = doc['appointment_date']
-                if '/' in date_str:
-                    day, month, year = date_str.split('/')
-                    fixed_date = datetime(int(year), int(month), int(day))
-                else:
-                    fixed_date = datetime.fromisoformat(date_str)
-                
-                await collection.update_one(
-                    {"_id": doc["_id"]},
-                    {"$set": {"appointment_date": fixed_date}}
-                )
-            except (ValueError, AttributeError):
-                # Set to current date if can't parse
-                await collection.update_one(
-                    {"_id": doc["_id"]},
-                    {"$set": {"appointment_date": datetime.utcnow()}}
-                )
-        
-        await client.close()
-    except Exception as cleanup_error:
-        print(f"Error during data cleanup: {cleanup_error}")
+        page_query = cursor_query(query, cursor, sort_field="appointment_date")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    # Now perform the normal query
-    appointments = await Appointment.find(query).skip(skip).limit(size).to_list()
+    appointments = Appointment.find(page_query).sort(cursor_sort("appointment_date"))
+    if not cursor:
+        appointments = appointments.skip(skip)
+    appointments = await appointments.limit(size + 1).to_list()
+    appointments, next_cursor = paginate_cursor(appointments, size, sort_field="appointment_date")
     total = await Appointment.find(query).count()
     
     # Convert appointments to response format
@@ -151,7 +116,8 @@ async def get_appointments(
         total=total,
         page=page,
         size=size,
-        pages=(total + size - 1) // size
+        pages=(total + size - 1) // size,
+        next_cursor=next_cursor
     )
 
 
@@ -253,27 +219,12 @@ async def update_appointment(
     update_data = appointment_update.dict(exclude_unset=True)
     update_data["updated_at"] = datetime.utcnow()
     
-    # Handle date parsing if appointment_date is being updated
-    if "appointment_date" in update_data and isinstance(update_data["appointment_date"], str):
-        try:
-            date_str = update_data["appointment_date"]
-            if '/' in date_str:
-                # Handle DD/MM/YYYY format
-                day, month, year = date_str.split('/')
-                update_data["appointment_date"] = datetime(int(year), int(month), int(day))
-            else:
-                # Handle YYYY-MM-DD format
-                update_data["appointment_date"] = datetime.fromisoformat(date_str)
-        except (ValueError, TypeError):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid date format. Use DD/MM/YYYY or YYYY-MM-DD"
-            )
-    
+    old_status = appointment.status
     for key, value in update_data.items():
         setattr(appointment, key, value)
     
     await appointment.save()
+    await counters.track_status_change("appointments", old_status, appointment.status)
     
     return SuccessResponse(message="Appointment updated successfully")
 
@@ -307,5 +258,6 @@ async def delete_appointment(
             )
     
     await appointment.delete()
+    await counters.track_delete("appointments", appointment.status)
     
     return SuccessResponse(message="Appointment deleted successfully")
\ No newline at end of file
@@ -4,7 +4,7 @@ from datetime import timedelta
 from app.database.schemas.user import UserCreate, UserLogin
 from app.database.schemas.common import Token, SuccessResponse
 from app.database.repositories.user_repository import UserRepository
-from app.utils.auth import verify_password, create_access_token
+from app.utils.auth import verify_password_async, create_access_token
 from app.config import settings
 
 router = APIRouter()
@@ -39,7 +39,7 @@ async def login(credentials: UserLogin):
     # Find user by email or username
     user = await UserRepository.get_user_by_email_or_username(credentials.email)
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not await verify_password_async(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -3,7 +3,7 @@ from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.database.repositories.mongo_user_repository import MongoUserRepository
 from app.database.mongo_models import User
-from app.utils.auth import get_password_hash, verify_password, create_access_token
+from app.utils.auth import verify_password_async, create_access_token
 from app.config import settings
 from pydantic import BaseModel
 from typing import Optional
@@ -113,7 +113,7 @@ async def login(request: Request, user_data: UserLoginCustom):
             raise HTTPException(status_code=400, detail="User not found with this email address")
         
         # Verify password
-        if not verify_password(user_data.password, user.password_hash):
+        if not await verify_password_async(user_data.password, user.password_hash):
             raise HTTPException(status_code=400, detail="Invalid password")
             
         # Note: Removed strict user_type validation to allow flexible login
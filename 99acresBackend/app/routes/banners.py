@@ -1,11 +1,21 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional, List
 from pydantic import BaseModel
+import time
 from datetime import datetime
-from app.database.mongodb import mongodb
+from bson import ObjectId
+from app.config import settings
+from app.database.mongodb import mongodb, get_read_database
+from app.database.counter_buffer import counter_buffer
 
 router = APIRouter()
 
+# Short-lived cache of /stats/overview, reset by every banner write
+_stats_cache = {"data": None, "expires_at": 0.0}
+
+# Banner ids confirmed to exist -> monotonic expiry; unknown ids are never cached
+_known_banners = {}
+
 # Pydantic models for banners
 class BannerCreate(BaseModel):
     title: str
@@ -38,8 +48,8 @@ async def get_banners(
         if is_active is not None:
             query["is_active"] = is_active
 
-        banners = await mongodb.database.banners.find(query).to_list(limit)
-        total_count = await mongodb.database.banners.count_documents(query)
+        banners = await get_read_database().banners.find(query).to_list(limit)
+        total_count = await get_read_database().banners.count_documents(query)
         
         return {
             "success": True,
@@ -85,7 +95,7 @@ async def get_banner_by_id(banner_id: int):
 async def get_banners_by_position(position: str):
     """Get banners by position (home, sidebar, listing, etc.)"""
     try:
-        position_banners = await mongodb.database.banners.find({"position": position, "is_active": True}).to_list(100)
+        position_banners = await get_read_database().banners.find({"position": position, "is_active": True}).to_list(100)
         
         return {
             "success": True,
@@ -107,7 +117,7 @@ async def get_banners_by_position(position: str):
 async def get_active_banners():
     """Get only active banners"""
     try:
-        active_banners = await mongodb.database.banners.find({"is_active": True}).to_list(100)
+        active_banners = await get_read_database().banners.find({"is_active": True}).to_list(100)
         
         return {
             "success": True,
@@ -128,27 +138,55 @@ async def get_active_banners():
 async def get_banner_statistics():
     """Get banner performance statistics"""
     try:
-        total_banners = await mongodb.database.banners.count_documents({})
-        active_banners = await mongodb.database.banners.count_documents({"is_active": True})
-        total_views = sum([b["views"] for b in await mongodb.database.banners.find({}).to_list(1000)])
-        total_clicks = sum([b["clicks"] for b in await mongodb.database.banners.find({}).to_list(1000)])
+        now = time.monotonic()
+        if _stats_cache["data"] is not None and now < _stats_cache["expires_at"]:
+            return _stats_cache["data"]
+        
+        # Totals, per-position rollups and top performers in one round trip
+        result = await get_read_database().banners.aggregate([
+            {"$facet": {
+                "overview": [{"$group": {
+                    "_id": None,
+                    "total_banners": {"$sum": 1},
+                    "active_banners": {"$sum": {"$cond": [{"$eq": ["$is_active", True]}, 1, 0]}},
+                    "total_views": {"$sum": "$views"},
+                    "total_clicks": {"$sum": "$clicks"}
+                }}],
+                "by_position": [{"$group": {
+                    "_id": "$position",
+                    "count": {"$sum": 1},
+                    "views": {"$sum": "$views"},
+                    "clicks": {"$sum": "$clicks"}
+                }}],
+                "top_performers": [
+                    {"$sort": {"clicks": -1}},
+                    {"$limit": 3},
+                    {"$project": {"_id": 0, "id": "$_id", "title": 1, "clicks": 1}}
+                ]
+            }}
+        ]).to_list(length=1)
+        facets = result[0] if result else {}
+        
+        overview = facets["overview"][0] if facets.get("overview") else {}
+        total_banners = overview.get("total_banners", 0)
+        active_banners = overview.get("active_banners", 0)
+        total_views = overview.get("total_views", 0)
+        total_clicks = overview.get("total_clicks", 0)
         avg_ctr = round((total_clicks / total_views * 100), 2) if total_views > 0 else 0
         
         # Position breakdown
-        positions = {}
-        for banner in await mongodb.database.banners.find({}).to_list(1000):
-            pos = banner["position"]
-            if pos not in positions:
-                positions[pos] = {"count": 0, "views": 0, "clicks": 0}
-            positions[pos]["count"] += 1
-            positions[pos]["views"] += banner["views"]
-            positions[pos]["clicks"] += banner["clicks"]
+        positions = {
+            row["_id"]: {"count": row["count"], "views": row["views"], "clicks": row["clicks"]}
+            for row in facets.get("by_position", [])
+        }
         
         # Top performing banners
-        top_banners = sorted(await mongodb.database.banners.find({}).to_list(1000), key=lambda x: x["clicks"], reverse=True)[:3]
-        top_performers = [{"id": b["id"], "title": b["title"], "clicks": b["clicks"]} for b in top_banners]
+        top_performers = [
+            {**row, "id": str(row["id"]) if isinstance(row.get("id"), ObjectId) else row.get("id")}
+            for row in facets.get("top_performers", [])
+        ]
         
-        return {
+        response = {
             "success": True,
             "message": "Banner statistics retrieved successfully",
             "data": {
@@ -164,6 +202,8 @@ async def get_banner_statistics():
                 "top_performers": top_performers
             }
         }
+        _stats_cache.update(data=response, expires_at=now + settings.BANNER_STATS_CACHE_SECONDS)
+        return response
         
     except Exception as e:
         return {
@@ -172,6 +212,40 @@ async def get_banner_statistics():
             "data": {}
         }
 
+def _banner_key(banner_id: str):
+    """The ``_id`` a path id refers to: ObjectId for API-created banners, int for seeded ones"""
+    if ObjectId.is_valid(banner_id):
+        return ObjectId(banner_id)
+    if banner_id.isdigit():
+        return int(banner_id)
+    raise HTTPException(status_code=404, detail="Banner not found")
+
+async def _require_banner(banner_id: str):
+    """Resolve the banner's ``_id``; 404 unless it exists, so tracking can't buffer counters for arbitrary ids"""
+    key = _banner_key(banner_id)
+    now = time.monotonic()
+    if _known_banners.get(key, 0.0) > now:
+        return key
+    if not await mongodb.database.banners.find_one({"_id": key}, {"_id": 1}):
+        _known_banners.pop(key, None)
+        raise HTTPException(status_code=404, detail="Banner not found")
+    _known_banners[key] = now + settings.BANNER_ID_CACHE_SECONDS
+    return key
+
+@router.post("/{banner_id}/view", response_model=dict)
+async def track_banner_view(banner_id: str):
+    """Record a banner impression (buffered and flushed in batches)"""
+    key = await _require_banner(banner_id)
+    counter_buffer.increment("banners", key, "views")
+    return {"success": True, "message": "View recorded", "data": {"banner_id": banner_id}}
+
+@router.post("/{banner_id}/click", response_model=dict)
+async def track_banner_click(banner_id: str):
+    """Record a banner click (buffered and flushed in batches)"""
+    key = await _require_banner(banner_id)
+    counter_buffer.increment("banners", key, "clicks")
+    return {"success": True, "message": "Click recorded", "data": {"banner_id": banner_id}}
+
 @router.post("/", response_model=dict)
 async def create_banner(banner: BannerCreate):
     """Create a new banner"""
@@ -181,6 +255,7 @@ async def create_banner(banner: BannerCreate):
         banner_data["views"] = 0
         banner_data["clicks"] = 0
         result = await mongodb.database.banners.insert_one(banner_data)
+        _stats_cache["expires_at"] = 0.0
         
         return {
             "success": True,
@@ -201,6 +276,7 @@ async def update_banner(banner_id: int, banner_data: BannerUpdate):
     try:
         update_data = {k: v for k, v in banner_data.dict().items() if v is not None}
         result = await mongodb.database.banners.update_one({"_id": banner_id}, {"$set": update_data})
+        _stats_cache["expires_at"] = 0.0
         
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Banner not found or no changes made")
@@ -223,10 +299,13 @@ async def update_banner(banner_id: int, banner_data: BannerUpdate):
         }
 
 @router.delete("/{banner_id}", response_model=dict)
-async def delete_banner(banner_id: int):
+async def delete_banner(banner_id: str):
     """Delete a banner (simulation)"""
+    key = _banner_key(banner_id)
     try:
-        result = await mongodb.database.banners.delete_one({"_id": banner_id})
+        result = await mongodb.database.banners.delete_one({"_id": key})
+        _stats_cache["expires_at"] = 0.0
+        _known_banners.pop(key, None)
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Banner not found")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
 from datetime import datetime
+from app.database.listing_store import listing_store
 
 router = APIRouter()
 
@@ -224,6 +225,16 @@ BASIC_LISTINGS = [
     }
 ]
 
+listing_store.register("basic", BASIC_LISTINGS, indexes={
+    "city": "city",
+    "type": "type",
+    "status": "status",
+    "featured": "featured",
+    "verified": "verified"
+}, search_fields={
+    "title": 3, "location": 2, "city": 2, "state": 1, "type": 1, "description": 1, "amenities": 1
+})
+
 @router.get("", response_model=dict)
 @router.get("/", response_model=dict)
 async def get_basic_listings(
@@ -237,42 +248,29 @@ async def get_basic_listings(
 ):
     """Get basic listings with enhanced features and filtering"""
     try:
-        filtered_listings = BASIC_LISTINGS.copy()
-        
-        # Apply filters
-        if city:
-            filtered_listings = [l for l in filtered_listings if l["city"].lower() == city.lower()]
-        
-        if type:
-            filtered_listings = [l for l in filtered_listings if l["type"].lower() == type.lower()]
-        
-        if status:
-            filtered_listings = [l for l in filtered_listings if l["status"].lower() == status.lower()]
-            
-        if featured is not None:
-            filtered_listings = [l for l in filtered_listings if l["featured"] == featured]
-        
-        if min_price is not None:
-            filtered_listings = [l for l in filtered_listings if l["price"] >= min_price]
-            
-        if max_price is not None:
-            filtered_listings = [l for l in filtered_listings if l["price"] <= max_price]
-        
-        # Apply limit
-        if limit:
-            filtered_listings = filtered_listings[:limit]
+        # Indexed lookup on city/type/status/featured plus a price range bisect
+        filtered_listings, _ = listing_store.query(
+            "basic",
+            city=city,
+            type=type,
+            status=status,
+            featured=featured,
+            min_price=min_price,
+            max_price=max_price,
+            limit=limit
+        )
         
         # Calculate statistics
         total_views = sum([l["views"] for l in BASIC_LISTINGS])
-        featured_count = len([l for l in BASIC_LISTINGS if l["featured"]])
-        verified_count = len([l for l in BASIC_LISTINGS if l["verified"]])
+        featured_count = listing_store.count("basic", featured=True)
+        verified_count = listing_store.count("basic", verified=True)
         
         return {
             "success": True,
             "message": "Basic listings retrieved successfully",
             "data": filtered_listings,
             "count": len(filtered_listings),
-            "total_available": len(BASIC_LISTINGS),
+            "total_available": listing_store.total("basic"),
             "statistics": {
                 "total_views": total_views,
                 "featured_listings": featured_count,
@@ -301,9 +299,9 @@ async def get_basic_listings(
 async def get_basic_dashboard():
     """Get basic listings dashboard data"""
     try:
-        total_listings = len(BASIC_LISTINGS)
-        active_listings = len([l for l in BASIC_LISTINGS if l["status"] == "active"])
-        featured_listings = len([l for l in BASIC_LISTINGS if l["featured"]])
+        total_listings = listing_store.total("basic")
+        active_listings = listing_store.count("basic", status="active")
+        featured_listings = listing_store.count("basic", featured=True)
         views_this_month = sum([l["views"] for l in BASIC_LISTINGS if l["created_date"].startswith("2025-10")])
         total_views = sum([l["views"] for l in BASIC_LISTINGS])
         
@@ -356,7 +354,7 @@ async def get_basic_dashboard():
 async def get_featured_basic_listings():
     """Get featured basic listings only"""
     try:
-        featured_listings = [l for l in BASIC_LISTINGS if l["featured"] and l["status"] == "active"]
+        featured_listings, _ = listing_store.query("basic", featured=True, status="active")
         
         return {
             "success": True,
@@ -377,7 +375,7 @@ async def get_featured_basic_listings():
 async def get_verified_basic_listings():
     """Get verified basic listings only"""
     try:
-        verified_listings = [l for l in BASIC_LISTINGS if l["verified"] and l["status"] == "active"]
+        verified_listings, _ = listing_store.query("basic", verified=True, status="active")
         
         return {
             "success": True,
@@ -398,11 +396,11 @@ async def get_verified_basic_listings():
 async def get_basic_listings_stats():
     """Get comprehensive statistics for basic listings"""
     try:
-        total_listings = len(BASIC_LISTINGS)
-        active_listings = len([l for l in BASIC_LISTINGS if l["status"] == "active"])
-        sold_listings = len([l for l in BASIC_LISTINGS if l["status"] == "sold"])
-        featured_listings = len([l for l in BASIC_LISTINGS if l["featured"]])
-        verified_listings = len([l for l in BASIC_LISTINGS if l["verified"]])
+        total_listings = listing_store.total("basic")
+        active_listings = listing_store.count("basic", status="active")
+        sold_listings = listing_store.count("basic", status="sold")
+        featured_listings = listing_store.count("basic", featured=True)
+        verified_listings = listing_store.count("basic", verified=True)
         
         # Price statistics for active listings
         active_prices = [l["price"] for l in BASIC_LISTINGS if l["status"] == "active"]
@@ -465,7 +463,7 @@ async def get_basic_listings_stats():
 async def get_basic_listing_by_id(listing_id: int):
     """Get a specific basic listing by ID"""
     try:
-        listing = next((l for l in BASIC_LISTINGS if l["id"] == listing_id), None)
+        listing = listing_store.get("basic", listing_id)
         
         if not listing:
             raise HTTPException(status_code=404, detail="Basic listing not found")
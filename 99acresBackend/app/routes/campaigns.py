@@ -1,15 +1,20 @@
 # Campaign routes with MongoDB integration
-from fastapi import APIRouter, HTTPException, status, Depends, Query, Security
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Security, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, List
 from app.database.repositories.mongo_campaign_repository import MongoCampaignRepository
 from app.database.repositories.mongo_user_repository import MongoUserRepository
 from app.database.schemas.campaign import Campaign, CampaignCreate, CampaignUpdate, CampaignStats
+from app.database.schemas.common import decode_cursor
 from app.database.mongo_models import User
+import base64
 
 security = HTTPBearer(auto_error=False)
 router = APIRouter()
 
+# 1x1 transparent GIF returned by the open-tracking pixel
+TRACKING_PIXEL = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
 async def get_current_user_optional(credentials: Optional[HTTPAuthorizationCredentials] = Security(security)) -> Optional[User]:
     """Get current user from token (optional - returns None if no token)"""
     if not credentials:
@@ -50,13 +55,25 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
 @router.get("/", response_model=List[Campaign])
 async def get_campaigns(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     status: Optional[str] = Query(None, description="Filter by status: active, paused, completed, archived"),
     campaign_type: Optional[str] = Query(None, description="Filter by type: marketing, email, sms, social_media"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
-    """Get all campaigns with optional filtering (authentication optional for viewing)"""
+    """Get all campaigns with optional filtering (authentication optional for viewing).
+
+    The next page cursor is returned in the ``X-Next-Cursor`` header so the
+    response body stays a plain list.
+    """
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         # If authenticated: Admins see all campaigns, others see only their own
         # If not authenticated: See all campaigns
@@ -64,13 +81,16 @@ async def get_campaigns(
         if current_user:
             user_id = None if current_user.role == "admin" else str(current_user.id)
         
-        campaigns = await MongoCampaignRepository.get_campaigns(
+        campaigns, next_cursor = await MongoCampaignRepository.get_campaigns(
             skip=skip,
             limit=limit,
             status=status,
             campaign_type=campaign_type,
-            user_id=user_id
+            user_id=user_id,
+            cursor=cursor
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return campaigns
     except Exception as e:
         print(f"Error fetching campaigns: {e}")
@@ -193,6 +213,50 @@ async def delete_campaign(
         print(f"Error deleting campaign: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting campaign: {str(e)}")
 
+@router.post("/{campaign_id}/send")
+async def send_campaign(
+    campaign_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Send an email campaign to its recipientList.
+
+    Recipients are split into send jobs and delivered in the background;
+    progress shows up in the campaign's ``emailsSent`` and ``dispatch``.
+    """
+    try:
+        existing_campaign = await MongoCampaignRepository.get_campaign_by_id(campaign_id)
+        
+        if not existing_campaign:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        
+        # Check ownership unless admin
+        if current_user.role != "admin" and existing_campaign.owner_id != str(current_user.id):
+            raise HTTPException(status_code=403, detail="Not authorized to send this campaign")
+        
+        if not existing_campaign.emailContent:
+            raise HTTPException(status_code=400, detail="Campaign has no emailContent to send")
+        
+        result = await MongoCampaignRepository.start_send(campaign_id)
+        if result is None:
+            raise HTTPException(status_code=409, detail="Campaign has already been sent")
+        
+        recipients, jobs = result
+        if recipients == 0:
+            raise HTTPException(status_code=400, detail="Campaign has no recipients")
+        
+        return {"campaign_id": campaign_id, "recipients": recipients, "jobs": jobs, "status": "queued"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error sending campaign: {e}")
+        raise HTTPException(status_code=500, detail=f"Error sending campaign: {str(e)}")
+
+@router.get("/{campaign_id}/open.gif", include_in_schema=False)
+async def track_campaign_open(campaign_id: str):
+    """Open-tracking pixel embedded in campaign emails"""
+    MongoCampaignRepository.record_open(campaign_id)
+    return Response(content=TRACKING_PIXEL, media_type="image/gif", headers={"Cache-Control": "no-store"})
+
 @router.get("/count/total")
 async def count_campaigns(
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
-from datetime import datetime, timedelta
 from bson import ObjectId
 from app.database.schemas.dashboard import (
     DashboardStats, UserDashboard, AdminDashboard, PropertyStats,
     RecentActivity, TopProperties, UserActivityStats
 )
 from app.database.schemas.common import SuccessResponse
+from app.database.counters import get_dashboard_counters
+from app.utils.query_batch import gather_queries
 from app.database.models import (
     User, Property, Appointment, Contact, Inquiry, 
     PropertyStatus, AppointmentStatus, ContactStatus, UserRole
@@ -21,41 +22,51 @@ async def get_user_dashboard(current_user: User = Depends(get_current_active_use
     """Get user dashboard data"""
     user_id = ObjectId(str(current_user.id))
     
-    # Get user properties count
-    my_properties = await Property.find(Property.created_by == user_id).count()
-    
-    # Get user appointments
-    my_appointments = await Appointment.find(
-        {"$or": [
-            {"user_id": user_id},
-            {"agent_id": user_id}
-        ]}
-    ).count()
-    
-    # Get pending appointments
-    pending_appointments = await Appointment.find({
-        "$and": [
+    # Independent queries run concurrently
+    queries = dict(
+        # User properties count
+        my_properties=Property.find(Property.created_by == user_id).count(),
+        # User appointments
+        my_appointments=Appointment.find(
             {"$or": [
                 {"user_id": user_id},
                 {"agent_id": user_id}
-            ]},
-            {"status": AppointmentStatus.PENDING}
-        ]
-    }).count()
-    
-    # Get recent inquiries
-    recent_inquiries = await Inquiry.find(
-        Inquiry.user_id == user_id
-    ).sort(-Inquiry.created_at).limit(5).to_list()
+            ]}
+        ).count(),
+        # Pending appointments
+        pending_appointments=Appointment.find({
+            "$and": [
+                {"$or": [
+                    {"user_id": user_id},
+                    {"agent_id": user_id}
+                ]},
+                {"status": AppointmentStatus.PENDING}
+            ]
+        }).count(),
+        # Recent inquiries
+        recent_inquiries=Inquiry.find(
+            Inquiry.user_id == user_id
+        ).sort(-Inquiry.created_at).limit(5).to_list()
+    )
+    if current_user.role in [UserRole.AGENT, UserRole.ADMIN, UserRole.SUPER_ADMIN]:
+        # Sum of views computed by the server instead of loading every property
+        queries["views"] = Property.aggregate([
+            {"$match": {"created_by": user_id}},
+            {"$group": {"_id": None, "views": {"$sum": {"$ifNull": ["$views", 0]}}}}
+        ]).to_list()
+    results = await gather_queries("user_dashboard", **queries)
+    
+    my_properties = results["my_properties"]
+    my_appointments = results["my_appointments"]
+    pending_appointments = results["pending_appointments"]
+    recent_inquiries = results["recent_inquiries"]
     
     # Get favorite properties count (assuming we have a favorites collection)
     favorites_count = 0  # Placeholder for favorites feature
     
-    # Calculate property views (placeholder)
-    property_views = 0
-    if current_user.role in [UserRole.AGENT, UserRole.ADMIN, UserRole.SUPER_ADMIN]:
-        properties = await Property.find(Property.created_by == user_id).to_list()
-        property_views = sum(prop.views or 0 for prop in properties)
+    # Property views of the user's listings
+    views = results.get("views")
+    property_views = views[0]["views"] if views else 0
     
     # Recent activities
     activities = []
@@ -80,85 +91,31 @@ async def get_user_dashboard(current_user: User = Depends(get_current_active_use
 @router.get("/admin", response_model=AdminDashboard)
 async def get_admin_dashboard(current_user: User = Depends(get_admin_user)):
     """Get admin dashboard data"""
-    # Get total counts
-    total_users = await User.find().count()
-    total_properties = await Property.find().count()
-    total_appointments = await Appointment.find().count()
-    total_inquiries = await Inquiry.find().count()
-    
-    # Get pending counts
-    pending_properties = await Property.find(Property.status == PropertyStatus.PENDING).count()
-    pending_appointments = await Appointment.find(Appointment.status == AppointmentStatus.PENDING).count()
-    pending_inquiries = await Inquiry.find(Inquiry.status == ContactStatus.PENDING).count()
-    
-    # Get active users (users who logged in last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    active_users = await User.find(User.last_login >= thirty_days_ago).count()
-    
-    # Get monthly stats
-    one_month_ago = datetime.utcnow() - timedelta(days=30)
-    monthly_properties = await Property.find(Property.created_at >= one_month_ago).count()
-    monthly_users = await User.find(User.created_at >= one_month_ago).count()
-    monthly_appointments = await Appointment.find(Appointment.created_at >= one_month_ago).count()
-    
-    # Get recent activities
-    recent_properties = await Property.find().sort(-Property.created_at).limit(5).to_list()
-    recent_users = await User.find().sort(-User.created_at).limit(5).to_list()
-    recent_inquiries = await Inquiry.find().sort(-Inquiry.created_at).limit(5).to_list()
-    
-    activities = []
-    
-    # Add recent property activities
-    for prop in recent_properties:
-        activities.append(RecentActivity(
-            type="property",
-            description=f"New property: {prop.title}",
-            timestamp=prop.created_at
-        ))
-    
-    # Add recent user activities
-    for user in recent_users:
-        activities.append(RecentActivity(
-            type="user",
-            description=f"New user registration: {user.full_name}",
-            timestamp=user.created_at
-        ))
-    
-    # Add recent inquiry activities
-    for inquiry in recent_inquiries:
-        activities.append(RecentActivity(
-            type="inquiry",
-            description=f"New inquiry from: {inquiry.name}",
-            timestamp=inquiry.created_at
-        ))
-    
-    # Sort activities by timestamp
+    # One materialized document kept current by the repositories and the
+    # background rebuild job, instead of a dozen counts per poll
+    counters = await get_dashboard_counters()
+    totals = counters.get("totals", {})
+    by_status = counters.get("by_status", {})
+    monthly = counters.get("monthly", {})
+    
+    activities = [RecentActivity(**activity) for activity in counters.get("recent_activities", [])]
     activities.sort(key=lambda x: x.timestamp, reverse=True)
     activities = activities[:10]  # Keep only 10 most recent
     
-    # Get top properties by views
-    top_properties_data = await Property.find().sort(-Property.views).limit(5).to_list()
-    top_properties = []
-    for prop in top_properties_data:
-        top_properties.append(TopProperties(
-            id=str(prop.id),
-            title=prop.title,
-            views=prop.views or 0,
-            inquiries_count=await Inquiry.find(Inquiry.property_id == prop.id).count()
-        ))
+    top_properties = [TopProperties(**prop) for prop in counters.get("top_properties", [])]
     
     return AdminDashboard(
-        total_users=total_users,
-        total_properties=total_properties,
-        total_appointments=total_appointments,
-        total_inquiries=total_inquiries,
-        pending_properties=pending_properties,
-        pending_appointments=pending_appointments,
-        pending_inquiries=pending_inquiries,
-        active_users=active_users,
-        monthly_users=monthly_users,
-        monthly_properties=monthly_properties,
-        monthly_appointments=monthly_appointments,
+        total_users=totals.get("users", 0),
+        total_properties=totals.get("properties", 0),
+        total_appointments=totals.get("appointments", 0),
+        total_inquiries=totals.get("inquiries", 0),
+        pending_properties=by_status.get("properties", {}).get("pending", 0),
+        pending_appointments=by_status.get("appointments", {}).get(AppointmentStatus.PENDING.value, 0),
+        pending_inquiries=by_status.get("inquiries", {}).get(ContactStatus.NEW.value, 0),
+        active_users=counters.get("active_users", 0),
+        monthly_users=monthly.get("users", 0),
+        monthly_properties=monthly.get("properties", 0),
+        monthly_appointments=monthly.get("appointments", 0),
         recent_activities=activities,
         top_properties=top_properties
     )
@@ -168,30 +125,31 @@ async def get_admin_dashboard(current_user: User = Depends(get_admin_user)):
 async def get_dashboard_stats(current_user: User = Depends(get_current_active_user)):
     """Get general dashboard statistics"""
     if current_user.role in [UserRole.ADMIN, UserRole.SUPER_ADMIN]:
-        # Admin stats
-        total_properties = await Property.find().count()
-        total_users = await User.find().count()
-        total_appointments = await Appointment.find().count()
+        # Admin stats come from the materialized counters
+        totals = (await get_dashboard_counters()).get("totals", {})
         
         return DashboardStats(
-            total_properties=total_properties,
-            total_users=total_users,
-            total_appointments=total_appointments,
+            total_properties=totals.get("properties", 0),
+            total_users=totals.get("users", 0),
+            total_appointments=totals.get("appointments", 0),
             user_specific_data={}
         )
     else:
         # User stats
         user_id = ObjectId(str(current_user.id))
-        my_properties = await Property.find(Property.created_by == user_id).count()
-        my_appointments = await Appointment.find(Appointment.user_id == user_id).count()
-        my_inquiries = await Inquiry.find(Inquiry.user_id == user_id).count()
+        results = await gather_queries(
+            "user_stats",
+            properties=Property.find(Property.created_by == user_id).count(),
+            appointments=Appointment.find(Appointment.user_id == user_id).count(),
+            inquiries=Inquiry.find(Inquiry.user_id == user_id).count()
+        )
         
         return DashboardStats(
-            total_properties=my_properties,
+            total_properties=results["properties"],
             total_users=0,
-            total_appointments=my_appointments,
+            total_appointments=results["appointments"],
             user_specific_data={
-                "my_inquiries": my_inquiries,
+                "my_inquiries": results["inquiries"],
                 "favorites": 0  # Placeholder for favorites
             }
         )
@@ -202,32 +160,24 @@ async def get_property_stats(current_user: User = Depends(get_current_active_use
     """Get property-related statistics"""
     if current_user.role in [UserRole.ADMIN, UserRole.SUPER_ADMIN]:
         # Admin property stats
-        total_properties = await Property.find().count()
-        active_properties = await Property.find(Property.status == PropertyStatus.ACTIVE).count()
-        pending_properties = await Property.find(Property.status == PropertyStatus.PENDING).count()
-        sold_properties = await Property.find(Property.status == PropertyStatus.SOLD).count()
+        query = {}
     else:
         # User property stats
-        user_id = ObjectId(str(current_user.id))
-        total_properties = await Property.find(Property.created_by == user_id).count()
-        active_properties = await Property.find({
-            "created_by": user_id,
-            "status": PropertyStatus.ACTIVE
-        }).count()
-        pending_properties = await Property.find({
-            "created_by": user_id,
-            "status": PropertyStatus.PENDING
-        }).count()
-        sold_properties = await Property.find({
-            "created_by": user_id,
-            "status": PropertyStatus.SOLD
-        }).count()
+        query = {"created_by": ObjectId(str(current_user.id))}
+    
+    results = await gather_queries(
+        "property_stats",
+        total=Property.find(query).count(),
+        active=Property.find({**query, "status": PropertyStatus.ACTIVE}).count(),
+        pending=Property.find({**query, "status": PropertyStatus.PENDING}).count(),
+        sold=Property.find({**query, "status": PropertyStatus.SOLD}).count()
+    )
     
     return PropertyStats(
-        total_properties=total_properties,
-        active_properties=active_properties,
-        pending_properties=pending_properties,
-        sold_properties=sold_properties
+        total_properties=results["total"],
+        active_properties=results["active"],
+        pending_properties=results["pending"],
+        sold_properties=results["sold"]
     )
 
 
@@ -241,25 +191,28 @@ async def get_recent_activity(
     
     if current_user.role in [UserRole.ADMIN, UserRole.SUPER_ADMIN]:
         # Admin sees all activities
-        recent_properties = await Property.find().sort(-Property.created_at).limit(limit//3).to_list()
-        recent_appointments = await Appointment.find().sort(-Appointment.created_at).limit(limit//3).to_list()
-        recent_inquiries = await Inquiry.find().sort(-Inquiry.created_at).limit(limit//3).to_list()
+        results = await gather_queries(
+            "admin_activity",
+            properties=Property.find().sort(-Property.created_at).limit(limit//3).to_list(),
+            appointments=Appointment.find().sort(-Appointment.created_at).limit(limit//3).to_list(),
+            inquiries=Inquiry.find().sort(-Inquiry.created_at).limit(limit//3).to_list()
+        )
         
-        for prop in recent_properties:
+        for prop in results["properties"]:
             activities.append(RecentActivity(
                 type="property",
                 description=f"Property '{prop.title}' was created",
                 timestamp=prop.created_at
             ))
         
-        for appointment in recent_appointments:
+        for appointment in results["appointments"]:
             activities.append(RecentActivity(
                 type="appointment",
                 description=f"Appointment scheduled for {appointment.appointment_date}",
                 timestamp=appointment.created_at
             ))
         
-        for inquiry in recent_inquiries:
+        for inquiry in results["inquiries"]:
             activities.append(RecentActivity(
                 type="inquiry",
                 description=f"New inquiry from {inquiry.name}",
@@ -269,17 +222,20 @@ async def get_recent_activity(
         # User sees only their activities
         user_id = ObjectId(str(current_user.id))
         
-        user_properties = await Property.find(Property.created_by == user_id).sort(-Property.created_at).limit(limit//2).to_list()
-        user_appointments = await Appointment.find(Appointment.user_id == user_id).sort(-Appointment.created_at).limit(limit//2).to_list()
+        results = await gather_queries(
+            "user_activity",
+            properties=Property.find(Property.created_by == user_id).sort(-Property.created_at).limit(limit//2).to_list(),
+            appointments=Appointment.find(Appointment.user_id == user_id).sort(-Appointment.created_at).limit(limit//2).to_list()
+        )
         
-        for prop in user_properties:
+        for prop in results["properties"]:
             activities.append(RecentActivity(
                 type="property",
                 description=f"You created property '{prop.title}'",
                 timestamp=prop.created_at
             ))
         
-        for appointment in user_appointments:
+        for appointment in results["appointments"]:
             activities.append(RecentActivity(
                 type="appointment",
                 description=f"You scheduled an appointment for {appointment.appointment_date}",
@@ -1,13 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, status, Query
 from typing import Optional, List
 from pydantic import BaseModel, EmailStr
 from app.database.schemas.common import SuccessResponse, PaginatedResponse
-from app.database.models import User, EmailLog as EmailLogDoc
+from app.database.models import User
+from app.database.mongodb import get_database
+from app.database.email_outbox import LOG_COLLECTION, enqueue_email, enqueue_emails
 from app.utils.dependencies import get_current_active_user, get_admin_user
 from app.config import settings
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import uuid
 from datetime import datetime
 
@@ -37,88 +36,24 @@ class EmailLog(BaseModel):
 
 # In-memory storage for demo (replace with database in production)
 email_templates = {}
-email_logs = []
-
-async def send_email_background(to_email: str, subject: str, message: str):
-    """Background task to send email"""
-    try:
-        # Create message
-        msg = MIMEMultipart()
-        msg['From'] = settings.FROM_EMAIL
-        msg['To'] = to_email
-        msg['Subject'] = subject
-
-        # Add body
-        msg.attach(MIMEText(message, 'html'))
-
-        # Create SMTP session
-        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-        server.starttls()
-        server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(settings.FROM_EMAIL, to_email, text)
-        server.quit()
-
-        # Log success - try to persist to DB, otherwise fallback to in-memory
-        try:
-            db_log = EmailLogDoc(
-                to_email=to_email,
-                subject=subject,
-                status="sent",
-                sent_at=datetime.utcnow(),
-                metadata={}
-            )
-            await db_log.insert()
-        except Exception:
-            log_id = str(uuid.uuid4())
-            email_logs.append(EmailLog(
-                id=log_id,
-                to_email=to_email,
-                subject=subject,
-                status="sent",
-                sent_at=datetime.utcnow()
-            ))
-
-    except Exception as e:
-        # Log failure - try DB then fallback
-        try:
-            db_log = EmailLogDoc(
-                to_email=to_email,
-                subject=subject,
-                status="failed",
-                error_message=str(e),
-                metadata={}
-            )
-            await db_log.insert()
-        except Exception:
-            log_id = str(uuid.uuid4())
-            email_logs.append(EmailLog(
-                id=log_id,
-                to_email=to_email,
-                subject=subject,
-                status="failed",
-                error_message=str(e)
-            ))
 
 @router.post("/send", response_model=SuccessResponse)
 async def send_email(
     email_data: EmailRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user)
 ):
-    """Send an email"""
+    """Send an email (queued in the outbox, delivered by the email worker)"""
     try:
-        # Add to background tasks
-        background_tasks.add_task(
-            send_email_background,
+        email_id = await enqueue_email(
             email_data.to_email,
             email_data.subject,
-            email_data.message
+            email_data.message,
+            metadata={"template_id": email_data.template_id} if email_data.template_id else None
         )
 
         return SuccessResponse(
             message="Email queued for sending",
-            data={"email_id": str(uuid.uuid4())}
+            data={"email_id": email_id}
         )
     except Exception as e:
         raise HTTPException(
@@ -176,20 +111,29 @@ async def get_email_logs(
     current_user: User = Depends(get_admin_user)
 ):
     """Get email logs (Admin only)"""
-    logs = email_logs
-
-    if status_filter:
-        logs = [log for log in logs if log.status == status_filter]
-
-    start = (page - 1) * size
-    end = start + size
+    collection = get_database()[LOG_COLLECTION]
+    query = {"status": status_filter} if status_filter else {}
+
+    total = await collection.count_documents(query)
+    cursor = collection.find(query).sort("created_at", -1).skip((page - 1) * size).limit(size)
+    logs = [
+        EmailLog(
+            id=str(doc["_id"]),
+            to_email=doc["to_email"],
+            subject=doc["subject"],
+            status=doc["status"],
+            sent_at=doc.get("sent_at"),
+            error_message=doc.get("error_message")
+        ).dict()
+        async for doc in cursor
+    ]
 
     return PaginatedResponse(
-        items=[log.dict() for log in logs[start:end]],
-        total=len(logs),
+        items=logs,
+        total=total,
         page=page,
         size=size,
-        pages=(len(logs) + size - 1) // size
+        pages=(total + size - 1) // size
     )
 
 @router.get("", response_model=SuccessResponse)
@@ -224,7 +168,6 @@ async def test_email_config():
 @router.post("", response_model=SuccessResponse)
 async def send_email_custom(
     email_data: dict,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user)
 ):
     """Send an email with custom data format"""
@@ -238,32 +181,32 @@ async def send_email_custom(
         body = email_data.get("body", "")
 
         # Handle different recipients formats
-        if isinstance(recipients, int):
-            # If recipients is a number, this might be a template or bulk send
-            # For now, we'll treat it as a single email
-            to_email = "default@example.com"  # This should be configured
-        elif isinstance(recipients, list) and recipients:
-            to_email = recipients[0]  # Use first recipient
+        if isinstance(recipients, list):
+            to_emails = [r for r in recipients if isinstance(r, str) and r]
         else:
-            to_email = "default@example.com"
+            # A bare count carries no addresses to deliver to
+            to_emails = []
+        if not to_emails:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="recipients must be a non-empty list of email addresses"
+            )
 
-        # Add to background tasks
-        background_tasks.add_task(
-            send_email_background,
-            to_email,
-            subject,
-            body
+        queued = await enqueue_emails(
+            {"to_email": to_email, "subject": subject, "body": body, "metadata": {"name": name}}
+            for to_email in to_emails
         )
 
         return SuccessResponse(
             message="Email queued for sending",
             data={
-                "email_id": str(uuid.uuid4()),
                 "name": name,
                 "subject": subject,
-                "recipients_count": len(recipients) if isinstance(recipients, list) else recipients
+                "recipients_count": queued
             }
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
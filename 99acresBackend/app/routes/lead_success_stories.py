@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, EmailStr
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
+from app.database.catalog import Catalog
 
 router = APIRouter()
 
@@ -58,310 +59,11 @@ class StoryStats(BaseModel):
     top_performing_agents: List[Dict[str, Any]]
 
 # Sample success stories data
-success_stories_data = [
-    {
-        "id": 1,
-        "title": "From Dream to Reality: Young Couple's First Home Journey",
-        "client_name": "Raj & Priya Sharma",
-        "client_location": "Gurgaon, Haryana",
-        "property_type": "3BHK Apartment",
-        "deal_value": 1850000.0,  # ₹18.5 Lakh
-        "category": StoryCategory.FIRST_TIME_BUYER,
-        "story_summary": "Young IT professionals successfully purchased their first home in Gurgaon with expert guidance on home loans and property selection.",
-        "detailed_story": "Raj and Priya, both software engineers in their late 20s, had been dreaming of owning their first home. After years of saving and research, they approached our team with a budget of ₹20 lakhs. Our agent Neha Agarwal understood their requirements: a modern 3BHK apartment near IT hubs with good connectivity to Delhi. After showing them 15+ properties over 2 months, we found the perfect match in Sector 37C. The property offered excellent amenities, metro connectivity, and was within their budget. We also helped them secure a home loan at competitive rates and handled all documentation seamlessly.",
-        "challenges_faced": [
-            "Limited budget for desired location",
-            "First-time home loan application complexity",
-            "Understanding legal documentation",
-            "Property title verification concerns",
-            "Negotiating with multiple sellers"
-        ],
-        "solutions_provided": [
-            "Identified emerging areas with growth potential",
-            "Connected with pre-approved bank partners",
-            "Provided legal documentation support",
-            "Conducted thorough due diligence",
-            "Expert negotiation saved ₹1.5 lakhs"
-        ],
-        "agent_name": "Neha Agarwal",
-        "agent_rating": 4.9,
-        "timeline_days": 67,
-        "status": StoryStatus.FEATURED,
-        "featured": True,
-        "images": [
-            "https://example.com/story1-property.jpg",
-            "https://example.com/story1-clients.jpg",
-            "https://example.com/story1-handover.jpg"
-        ],
-        "video_url": "https://example.com/story1-testimonial.mp4",
-        "client_testimonial": "Neha was absolutely fantastic! She understood our needs perfectly and guided us through every step. As first-time buyers, we were overwhelmed, but she made the entire process smooth and stress-free. We saved money and got our dream home. Highly recommended!",
-        "agent_comments": "Working with Raj and Priya was a pleasure. Their clear communication and trust in the process made it smooth. Seeing their joy during the handover was the best reward!",
-        "created_at": datetime.now() - timedelta(days=30),
-        "published_at": datetime.now() - timedelta(days=25),
-        "views": 2850,
-        "likes": 127,
-        "tags": ["first_home", "young_professionals", "gurgaon", "success", "home_loan"]
-    },
-    {
-        "id": 2,
-        "title": "Smart Investment: ₹50 Lakh Property Generates 12% Returns",
-        "client_name": "Mr. Vikram Malhotra",
-        "client_location": "Mumbai, Maharashtra",
-        "property_type": "2BHK Commercial Space",
-        "deal_value": 5000000.0,  # ₹50 Lakh
-        "category": StoryCategory.INVESTMENT,
-        "story_summary": "Experienced investor diversified portfolio with a commercial property purchase that now generates consistent 12% annual returns.",
-        "detailed_story": "Mr. Vikram Malhotra, a successful businessman, wanted to diversify his investment portfolio beyond stocks and mutual funds. He approached our Mumbai team with a budget of ₹50 lakhs for a commercial property investment. Our agent Rohit Mehta conducted extensive market research and identified a prime 2BHK commercial space in Andheri East, near the metro station and IT parks. The property was perfect for rental to corporate clients. Within 3 months of purchase, we helped him secure a multinational company as a tenant at ₹50,000 monthly rent, providing 12% annual returns plus capital appreciation potential.",
-        "challenges_faced": [
-            "Finding high-yield commercial properties",
-            "Tenant verification and reliability",
-            "Commercial property legal complexities",
-            "Market timing for maximum returns",
-            "Competition from other investors"
-        ],
-        "solutions_provided": [
-            "Identified emerging commercial hubs",
-            "Pre-verified tenant database access",
-            "Comprehensive legal due diligence",
-            "Market analysis for optimal timing",
-            "Exclusive off-market property deals"
-        ],
-        "agent_name": "Rohit Mehta",
-        "agent_rating": 4.8,
-        "timeline_days": 45,
-        "status": StoryStatus.PUBLISHED,
-        "featured": True,
-        "images": [
-            "https://example.com/story2-commercial.jpg",
-            "https://example.com/story2-location.jpg",
-            "https://example.com/story2-returns.jpg"
-        ],
-        "video_url": None,
-        "client_testimonial": "Rohit's market knowledge is exceptional. He found me a property that not only met my budget but exceeded my return expectations. The tenant he arranged is reliable, and I'm earning consistent monthly income. Great investment advice!",
-        "agent_comments": "Mr. Malhotra's clear investment goals made it easier to find the right property. His trust in our market analysis led to this successful investment.",
-        "created_at": datetime.now() - timedelta(days=45),
-        "published_at": datetime.now() - timedelta(days=40),
-        "views": 1920,
-        "likes": 89,
-        "tags": ["investment", "commercial", "mumbai", "high_returns", "portfolio_diversification"]
-    },
-    {
-        "id": 3,
-        "title": "Luxury Villa Dream Fulfilled: ₹3.5 Cr Goa Retreat",
-        "client_name": "Dr. Anjali & Mr. Suresh Reddy",
-        "client_location": "Bangalore to Goa",
-        "property_type": "Luxury Villa",
-        "deal_value": 35000000.0,  # ₹3.5 Cr
-        "category": StoryCategory.LUXURY_PURCHASE,
-        "story_summary": "Bangalore-based doctors fulfilled their dream of owning a luxury vacation villa in Goa with panoramic sea views and premium amenities.",
-        "detailed_story": "Dr. Anjali and Mr. Suresh Reddy, successful medical professionals from Bangalore, had been planning to buy a luxury vacation home in Goa for years. They wanted a property that could serve as both a personal retreat and a potential rental investment. Our Goa specialist, Kavita Sharma, understood their vision of a villa with sea views, privacy, and luxury amenities. After an extensive search across North and South Goa, we found a stunning 4BHK villa in Candolim with panoramic Arabian Sea views, infinity pool, and beautifully landscaped gardens. The property also came with rental management services, making it a perfect investment too.",
-        "challenges_faced": [
-            "Finding authentic luxury properties in Goa",
-            "Navigating interstate property purchase laws",
-            "Verifying property titles in coastal areas",
-            "Ensuring rental management quality",
-            "Coordinating remote inspections from Bangalore"
-        ],
-        "solutions_provided": [
-            "Exclusive access to luxury property network",
-            "Legal expertise in Goa property laws",
-            "Comprehensive title verification process",
-            "Partnered with premium rental management",
-            "Virtual tours and detailed video inspections"
-        ],
-        "agent_name": "Kavita Sharma",
-        "agent_rating": 5.0,
-        "timeline_days": 89,
-        "status": StoryStatus.FEATURED,
-        "featured": True,
-        "images": [
-            "https://example.com/story3-villa-exterior.jpg",
-            "https://example.com/story3-sea-view.jpg",
-            "https://example.com/story3-pool.jpg",
-            "https://example.com/story3-interior.jpg"
-        ],
-        "video_url": "https://example.com/story3-villa-tour.mp4",
-        "client_testimonial": "Kavita made our dream come true! The villa is absolutely stunning, exactly what we envisioned. Her attention to detail and understanding of luxury properties is remarkable. We now have our perfect Goa retreat!",
-        "agent_comments": "Dr. Anjali and Mr. Suresh had a clear vision, and it was rewarding to find them the perfect property. Their trust throughout the process made this complex luxury transaction smooth.",
-        "created_at": datetime.now() - timedelta(days=60),
-        "published_at": datetime.now() - timedelta(days=50),
-        "views": 3200,
-        "likes": 156,
-        "tags": ["luxury", "goa", "villa", "sea_view", "vacation_home", "investment"]
-    },
-    {
-        "id": 4,
-        "title": "Lightning Fast Sale: Property Sold in 15 Days",
-        "client_name": "Mrs. Meera Gupta",
-        "client_location": "Noida, Uttar Pradesh",
-        "property_type": "2BHK Apartment",
-        "deal_value": 1200000.0,  # ₹12 Lakh
-        "category": StoryCategory.QUICK_SALE,
-        "story_summary": "Urgent relocation requirement led to a record-breaking property sale in just 15 days at full market value.",
-        "detailed_story": "Mrs. Meera Gupta needed to sell her 2BHK apartment in Noida urgently due to her husband's job transfer to Dubai. With only 20 days before their departure, she approached our team for a quick sale. Our agent Amit Kumar immediately activated our extensive buyer network and implemented a fast-track marketing strategy. Using professional photography, virtual tours, and targeted marketing to pre-qualified buyers, we generated 25+ inquiries in the first week. By day 10, we had 3 serious offers, and by day 15, the deal was closed at ₹12 lakhs - the full asking price. All paperwork was completed before their departure.",
-        "challenges_faced": [
-            "Extremely tight timeline for sale",
-            "Achieving full market value in quick sale",
-            "Buyer verification in compressed timeframe",
-            "Coordinating documentation while packing",
-            "Ensuring clean title transfer quickly"
-        ],
-        "solutions_provided": [
-            "Activated premium buyer network immediately",
-            "Professional staging and photography",
-            "Pre-qualified buyer database access",
-            "Dedicated documentation support team",
-            "Express legal clearance services"
-        ],
-        "agent_name": "Amit Kumar",
-        "agent_rating": 4.9,
-        "timeline_days": 15,
-        "status": StoryStatus.PUBLISHED,
-        "featured": True,
-        "images": [
-            "https://example.com/story4-apartment.jpg",
-            "https://example.com/story4-sale-board.jpg",
-            "https://example.com/story4-handover.jpg"
-        ],
-        "video_url": None,
-        "client_testimonial": "Amit was our savior! We thought we'd have to sell at a loss due to time pressure, but he got us the full price in just 15 days. His efficiency and network are incredible. Thank you for making our relocation stress-free!",
-        "agent_comments": "Mrs. Gupta's trust in our fast-track process allowed us to work efficiently. The urgent timeline brought out the best in our team's coordination and buyer network.",
-        "created_at": datetime.now() - timedelta(days=20),
-        "published_at": datetime.now() - timedelta(days=15),
-        "views": 1750,
-        "likes": 93,
-        "tags": ["quick_sale", "relocation", "noida", "full_price", "urgent", "efficiency"]
-    },
-    {
-        "id": 5,
-        "title": "Perfect Rental Match: 3BHK for IT Professional Family",
-        "client_name": "Mr. Karan Singh",
-        "client_location": "Pune, Maharashtra",
-        "property_type": "3BHK Apartment",
-        "deal_value": 35000.0,  # ₹35,000 monthly rent
-        "category": StoryCategory.RENTAL_SUCCESS,
-        "story_summary": "IT professional found the perfect family home rental in Pune with all desired amenities and excellent school proximity.",
-        "detailed_story": "Mr. Karan Singh, a software architect, was relocating from Hyderabad to Pune for a new job. With two school-going children, he needed a 3BHK apartment near good schools, with family-friendly amenities, and within a ₹35,000 monthly budget. Our Pune team, led by Priya Patel, understood the family's priorities: safety, schools, parks, and community feel. After showing 8 properties over one weekend, we found the perfect match in Baner - a well-maintained apartment in a family-oriented society with a swimming pool, playground, and two renowned schools within 1km. The landlord was also a family person, making the relationship smooth.",
-        "challenges_faced": [
-            "Finding family-oriented rental properties",
-            "School proximity requirements",
-            "Landlord preference for families with children",
-            "Relocation timeline pressure",
-            "Ensuring safety and community feel"
-        ],
-        "solutions_provided": [
-            "Specialized family rental database",
-            "School proximity mapping and ratings",
-            "Pre-screened family-friendly landlords",
-            "Weekend intensive property tours",
-            "Community safety and amenity verification"
-        ],
-        "agent_name": "Priya Patel",
-        "agent_rating": 4.8,
-        "timeline_days": 7,
-        "status": StoryStatus.PUBLISHED,
-        "featured": False,
-        "images": [
-            "https://example.com/story5-apartment.jpg",
-            "https://example.com/story5-community.jpg",
-            "https://example.com/story5-playground.jpg"
-        ],
-        "video_url": None,
-        "client_testimonial": "Priya understood our family needs perfectly. The apartment she found is ideal - great schools nearby, safe community, and the kids love the playground. The entire process was smooth and quick!",
-        "agent_comments": "Mr. Karan's clear family priorities made it easier to shortlist properties. Seeing the family settle happily in their new home was very satisfying.",
-        "created_at": datetime.now() - timedelta(days=35),
-        "published_at": datetime.now() - timedelta(days=30),
-        "views": 980,
-        "likes": 45,
-        "tags": ["rental", "family", "pune", "schools", "relocation", "community"]
-    },
-    {
-        "id": 6,
-        "title": "Commercial Space Success: Restaurant Owner's Dream Location",
-        "client_name": "Mr. Rajesh Khanna",
-        "client_location": "Delhi, Delhi",
-        "property_type": "Commercial Space",
-        "deal_value": 8000000.0,  # ₹80 Lakh
-        "category": StoryCategory.COMMERCIAL,
-        "story_summary": "Restaurant entrepreneur found the perfect high-footfall location in Delhi's prime market area for his new fine dining venture.",
-        "detailed_story": "Mr. Rajesh Khanna, an experienced restaurateur, was looking to open his third fine dining restaurant in Delhi. He needed a commercial space in a high-footfall area with parking, visibility, and the right ambiance for upscale dining. Our commercial specialist, Sunita Devi, conducted thorough market research and identified a premium ground floor space in Khan Market. The 2000 sq ft space had excellent street visibility, dedicated parking, and was surrounded by upscale shops and offices. The location's demographics perfectly matched his target customers. Within 6 months of purchase, his restaurant became one of Khan Market's most popular dining destinations.",
-        "challenges_faced": [
-            "Finding prime commercial locations",
-            "High competition for premium spaces",
-            "Ensuring proper licensing capabilities",
-            "Parking and accessibility requirements",
-            "Negotiating with commercial landlords"
-        ],
-        "solutions_provided": [
-            "Exclusive commercial property network",
-            "Market analysis and footfall studies",
-            "Licensing and compliance verification",
-            "Infrastructure and accessibility audit",
-            "Expert commercial negotiation services"
-        ],
-        "agent_name": "Sunita Devi",
-        "agent_rating": 4.9,
-        "timeline_days": 52,
-        "status": StoryStatus.PUBLISHED,
-        "featured": False,
-        "images": [
-            "https://example.com/story6-commercial.jpg",
-            "https://example.com/story6-location.jpg",
-            "https://example.com/story6-restaurant.jpg"
-        ],
-        "video_url": None,
-        "client_testimonial": "Sunita's understanding of commercial real estate is outstanding. She found me the perfect location that has contributed significantly to my restaurant's success. Her market knowledge is invaluable!",
-        "agent_comments": "Mr. Rajesh's clear business vision and trust in market analysis made this successful. Seeing his restaurant thrive in the location we found is extremely rewarding.",
-        "created_at": datetime.now() - timedelta(days=90),
-        "published_at": datetime.now() - timedelta(days=80),
-        "views": 1456,
-        "likes": 78,
-        "tags": ["commercial", "restaurant", "delhi", "prime_location", "business_success"]
-    },
-    {
-        "id": 7,
-        "title": "Corporate Relocation: Executive Housing in Record Time",
-        "client_name": "Ms. Anita Sharma",
-        "client_location": "Chennai to Bangalore",
-        "property_type": "Furnished 2BHK",
-        "deal_value": 45000.0,  # ₹45,000 monthly rent
-        "category": StoryCategory.RELOCATION,
-        "story_summary": "Senior executive's corporate relocation handled seamlessly with fully furnished premium accommodation near IT corridor.",
-        "detailed_story": "Ms. Anita Sharma, a senior executive with a multinational company, was transferred from Chennai to Bangalore with just 10 days notice. She needed a fully furnished, premium 2BHK apartment near Electronic City, with modern amenities and corporate housing standards. Our Bangalore corporate housing specialist, Dr. Vikram Tech, immediately activated our executive housing network. Within 48 hours, we arranged virtual tours of 5 suitable properties. Ms. Sharma selected a premium furnished apartment in a corporate-friendly complex with gym, swimming pool, and 24/7 security. All documentation and setup were completed before her arrival, allowing her to focus on her new role immediately.",
-        "challenges_faced": [
-            "Extremely short notice for relocation",
-            "Corporate housing quality standards",
-            "Furnished apartment availability",
-            "Electronic City proximity requirement",
-            "Quick documentation and verification"
-        ],
-        "solutions_provided": [
-            "Dedicated corporate housing network",
-            "24/7 emergency relocation services",
-            "Pre-verified furnished property database",
-            "Location-specific property mapping",
-            "Express documentation services"
-        ],
-        "agent_name": "Dr. Vikram Tech",
-        "agent_rating": 5.0,
-        "timeline_days": 3,
-        "status": StoryStatus.PUBLISHED,
-        "featured": False,
-        "images": [
-            "https://example.com/story7-furnished.jpg",
-            "https://example.com/story7-amenities.jpg",
-            "https://example.com/story7-location.jpg"
-        ],
-        "video_url": None,
-        "client_testimonial": "Dr. Vikram's emergency service was incredible! In just 3 days, he arranged everything perfectly. The apartment exceeded my expectations, and I could start work without any housing stress. Exceptional service!",
-        "agent_comments": "Ms. Anita's corporate relocation required precision and speed. Our emergency protocol and corporate network made this tight timeline achievable.",
-        "created_at": datetime.now() - timedelta(days=15),
-        "published_at": datetime.now() - timedelta(days=10),
-        "views": 1250,
-        "likes": 67,
-        "tags": ["relocation", "corporate", "bangalore", "furnished", "emergency", "executive"]
-    }
-]
+success_stories_data = Catalog("success_stories", lambda story: {
+    **story,
+    "category": StoryCategory(story["category"]),
+    "status": StoryStatus(story["status"])
+})
 
 @router.get("/", response_model=List[SuccessStory])
 async def get_success_stories(
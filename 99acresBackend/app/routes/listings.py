@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
+from app.database.listing_store import listing_store
 
 router = APIRouter()
 
@@ -97,6 +98,14 @@ SAMPLE_LISTINGS = [
     }
 ]
 
+listing_store.register("listings", SAMPLE_LISTINGS, indexes={
+    "city": "city",
+    "type": "property_type",
+    "status": "status",
+    "featured": "is_featured",
+    "listing_type": "listing_type"
+}, search_fields={"title": 3, "address": 2, "city": 2, "state": 1, "property_type": 1, "description": 1})
+
 @router.get("", response_model=dict)
 @router.get("/", response_model=dict)
 async def get_listings(
@@ -109,34 +118,23 @@ async def get_listings(
 ):
     """Get property listings with optional filters"""
     try:
-        filtered_listings = SAMPLE_LISTINGS.copy()
-        
-        # Apply filters
-        if city:
-            filtered_listings = [l for l in filtered_listings if l["city"].lower() == city.lower()]
-        
-        if property_type:
-            filtered_listings = [l for l in filtered_listings if l["property_type"].lower() == property_type.lower()]
-            
-        if listing_type:
-            filtered_listings = [l for l in filtered_listings if l["listing_type"].lower() == listing_type.lower()]
-        
-        if min_price is not None:
-            filtered_listings = [l for l in filtered_listings if l["price"] >= min_price]
-            
-        if max_price is not None:
-            filtered_listings = [l for l in filtered_listings if l["price"] <= max_price]
-        
-        # Apply limit
-        if limit:
-            filtered_listings = filtered_listings[:limit]
+        # Indexed lookup on city/type/listing type plus a price range bisect
+        filtered_listings, _ = listing_store.query(
+            "listings",
+            city=city,
+            type=property_type,
+            listing_type=listing_type,
+            min_price=min_price,
+            max_price=max_price,
+            limit=limit
+        )
         
         return {
             "success": True,
             "message": "Listings retrieved successfully",
             "data": filtered_listings,
             "count": len(filtered_listings),
-            "total_available": len(SAMPLE_LISTINGS),
+            "total_available": listing_store.total("listings"),
             "filters_applied": {
                 "city": city,
                 "property_type": property_type,
@@ -159,7 +157,7 @@ async def get_listings(
 async def get_listing_by_id(listing_id: int):
     """Get a specific listing by ID"""
     try:
-        listing = next((l for l in SAMPLE_LISTINGS if l["id"] == listing_id), None)
+        listing = listing_store.get("listings", listing_id)
         
         if not listing:
             raise HTTPException(status_code=404, detail="Listing not found")
@@ -183,7 +181,7 @@ async def get_listing_by_id(listing_id: int):
 async def get_featured_listings():
     """Get featured property listings"""
     try:
-        featured_listings = [l for l in SAMPLE_LISTINGS if l.get("is_featured", False)]
+        featured_listings, _ = listing_store.query("listings", featured=True)
         
         return {
             "success": True,
@@ -204,7 +202,7 @@ async def get_featured_listings():
 async def get_listings_by_city(city: str):
     """Get listings by city name"""
     try:
-        city_listings = [l for l in SAMPLE_LISTINGS if l["city"].lower() == city.lower()]
+        city_listings, _ = listing_store.query("listings", city=city)
         
         return {
             "success": True,
@@ -226,9 +224,9 @@ async def get_listings_by_city(city: str):
 async def get_available_listing_types():
     """Get available property types and listing types"""
     try:
-        property_types = list(set([l["property_type"] for l in SAMPLE_LISTINGS]))
-        listing_types = list(set([l["listing_type"] for l in SAMPLE_LISTINGS]))
-        cities = list(set([l["city"] for l in SAMPLE_LISTINGS]))
+        property_types = listing_store.distinct("listings", "type")
+        listing_types = listing_store.distinct("listings", "listing_type")
+        cities = listing_store.distinct("listings", "city")
         
         return {
             "success": True,
@@ -237,7 +235,7 @@ async def get_available_listing_types():
                 "property_types": property_types,
                 "listing_types": listing_types,
                 "cities": cities,
-                "total_listings": len(SAMPLE_LISTINGS)
+                "total_listings": listing_store.total("listings")
             }
         }
         
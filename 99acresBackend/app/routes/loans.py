@@ -1,9 +1,15 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Iterator, List, Optional
 from datetime import datetime, timedelta
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from enum import Enum
-import math
+import csv
+import io
+import json
+import numpy as np
+from app.database.repositories.loan_repository import LoanRepository
+from app.utils import finance
 
 router = APIRouter()
 
@@ -95,6 +101,28 @@ class LoanComparison(BaseModel):
     tenure: int  # in years
     interest_rate: Optional[float] = None  # Optional, will calculate for all banks if not provided
 
+class LoanGridRequest(BaseModel):
+    amount: float
+    tenures: List[int] = [5, 10, 15, 20, 25, 30]  # in years
+    rate_shifts: List[float] = [-0.5, -0.25, 0.0, 0.25, 0.5]  # percentage points added to each bank's rate
+    loan_type: str = "home_loan"
+
+class Prepayment(BaseModel):
+    month: int = Field(ge=1)  # 1-based month the lump sum is paid in
+    amount: float = Field(ge=0)
+
+class PrepaymentScenario(BaseModel):
+    name: str
+    lump_sums: List[Prepayment] = []
+    extra_monthly: float = Field(default=0.0, ge=0)  # paid on top of the EMI every month
+    extra_from_month: int = Field(default=1, ge=1)
+
+class AmortizationRequest(BaseModel):
+    principal: float = Field(gt=0)
+    rate: float = Field(ge=0)
+    tenure_years: int = Field(ge=1)
+    scenarios: List[PrepaymentScenario] = []  # compared against the baseline without prepayments
+
 class SimpleLoanRequest(BaseModel):
     amount: float
     tenure: int
@@ -132,97 +160,6 @@ class ExpertConsultation(BaseModel):
     preferred_time: Optional[str] = "Any time"
     message: Optional[str] = None
 
-# Sample loan applications data
-LOAN_APPLICATIONS = [
-    {
-        "id": 1,
-        "applicant_name": "Rajesh Kumar",
-        "email": "rajesh.kumar@gmail.com",
-        "phone": "+91-9876543210",
-        "loan_type": LoanType.home_loan,
-        "property_value": 8500000.0,
-        "loan_amount": 6800000.0,
-        "tenure_years": 20,
-        "interest_rate": 8.5,
-        "emi": 58736.0,
-        "total_payable": 14096640.0,
-        "employment_type": EmploymentType.salaried,
-        "monthly_income": 125000.0,
-        "existing_emi": 15000.0,
-        "credit_score": 785,
-        "property_address": "Sector 45, Gurgaon, Haryana",
-        "co_applicant_name": "Priya Kumar",
-        "co_applicant_income": 85000.0,
-        "status": LoanStatus.approved,
-        "applied_date": datetime(2024, 8, 15),
-        "approval_date": datetime(2024, 9, 2),
-        "disbursement_date": datetime(2024, 9, 15),
-        "processing_fee": 68000.0,
-        "documentation": ["Income Proof", "Property Papers", "Identity Proof", "Bank Statements"],
-        "bank_name": "HDFC Bank",
-        "loan_officer": "Amit Sharma",
-        "remarks": "Excellent credit profile, quick approval"
-    },
-    {
-        "id": 2,
-        "applicant_name": "Neha Agarwal",
-        "email": "neha.agarwal@outlook.com",
-        "phone": "+91-9876543211",
-        "loan_type": LoanType.property_loan,
-        "property_value": 12000000.0,
-        "loan_amount": 9600000.0,
-        "tenure_years": 15,
-        "interest_rate": 9.2,
-        "emi": 97847.0,
-        "total_payable": 17612460.0,
-        "employment_type": EmploymentType.self_employed,
-        "monthly_income": 250000.0,
-        "existing_emi": 0.0,
-        "credit_score": 750,
-        "property_address": "Koramangala, Bangalore, Karnataka",
-        "co_applicant_name": None,
-        "co_applicant_income": None,
-        "status": LoanStatus.under_review,
-        "applied_date": datetime(2024, 9, 20),
-        "approval_date": None,
-        "disbursement_date": None,
-        "processing_fee": 96000.0,
-        "documentation": ["Business Proof", "ITR Documents", "Property Valuation", "Bank Statements"],
-        "bank_name": "ICICI Bank",
-        "loan_officer": "Sunita Devi",
-        "remarks": "Under technical evaluation"
-    },
-    {
-        "id": 3,
-        "applicant_name": "Vikram Malhotra",
-        "email": "vikram.malhotra@company.com",
-        "phone": "+91-9876543212",
-        "loan_type": LoanType.construction_loan,
-        "property_value": 15000000.0,
-        "loan_amount": 10500000.0,
-        "tenure_years": 25,
-        "interest_rate": 8.8,
-        "emi": 85234.0,
-        "total_payable": 25570200.0,
-        "employment_type": EmploymentType.business,
-        "monthly_income": 300000.0,
-        "existing_emi": 25000.0,
-        "credit_score": 720,
-        "property_address": "Sector 50, Noida, Uttar Pradesh",
-        "co_applicant_name": "Kavita Malhotra",
-        "co_applicant_income": 150000.0,
-        "status": LoanStatus.pending,
-        "applied_date": datetime(2024, 10, 1),
-        "approval_date": None,
-        "disbursement_date": None,
-        "processing_fee": 105000.0,
-        "documentation": ["Construction Plan", "Approved Blueprint", "Income Proof", "Land Documents"],
-        "bank_name": "SBI",
-        "loan_officer": "Rajesh Gupta",
-        "remarks": "Documentation under verification"
-    }
-]
-
 # Bank interest rates data
 BANK_RATES = [
     {"bank": "HDFC Bank", "home_loan": 8.50, "property_loan": 9.00, "construction_loan": 9.25},
@@ -233,19 +170,15 @@ BANK_RATES = [
     {"bank": "PNB", "home_loan": 8.30, "property_loan": 8.80, "construction_loan": 9.00}
 ]
 
-# Expert consultation requests storage
-EXPERT_CONSULTATIONS = []
+# Amortization schedule limits and streaming chunk size
+MAX_SCHEDULE_YEARS = 40
+MAX_SCHEDULE_SCENARIOS = 20
+SCHEDULE_CHUNK_ROWS = 120
 
 def calculate_emi(principal: float, annual_rate: float, tenure_years: int) -> dict:
     """Calculate EMI and other loan details"""
-    monthly_rate = (annual_rate / 100) / 12
     tenure_months = tenure_years * 12
-    
-    if monthly_rate == 0:
-        emi = principal / tenure_months
-    else:
-        emi = principal * (monthly_rate * (1 + monthly_rate) ** tenure_months) / ((1 + monthly_rate) ** tenure_months - 1)
-    
+    emi = float(finance.emi(principal, annual_rate, tenure_months))
     total_payable = emi * tenure_months
     total_interest = total_payable - principal
     
@@ -260,30 +193,12 @@ def calculate_emi(principal: float, annual_rate: float, tenure_years: int) -> di
 
 def check_eligibility(income: float, existing_emi: float, employment_type: str, credit_score: int = None) -> dict:
     """Check loan eligibility based on income and other factors"""
-    # Calculate available income for EMI (50% rule)
-    available_income = income * 0.5 - existing_emi
-    
-    # Base eligibility multiplier
-    if employment_type == "salaried":
-        multiplier = 60  # 60x monthly income
-    elif employment_type == "self_employed":
-        multiplier = 55  # 55x monthly income
-    else:
-        multiplier = 50  # 50x monthly income
-    
-    # Credit score bonus
-    if credit_score:
-        if credit_score >= 750:
-            multiplier += 10
-        elif credit_score >= 700:
-            multiplier += 5
-        elif credit_score < 650:
-            multiplier -= 10
-    
-    max_loan_amount = available_income * multiplier
+    available_income = float(finance.available_income(income, existing_emi))
+    multiplier = finance.employment_multiplier(employment_type, credit_score)
+    max_loan_amount = float(finance.max_loan_amount(income, existing_emi, multiplier))
     
     return {
-        "eligible": available_income > 0 and max_loan_amount > 500000,
+        "eligible": bool(finance.is_eligible(income, existing_emi, max_loan_amount)),
         "max_loan_amount": round(max_loan_amount, 2),
         "max_emi": round(available_income, 2),
         "available_income": round(available_income, 2),
@@ -301,76 +216,93 @@ class LoanEligibilityRequest(BaseModel):
     tenure: int
     borrowers: Optional[str] = "One"  # "One" or "Two"
 
+def estimate_eligibility(request: LoanEligibilityRequest) -> dict:
+    """Eligibility from age, occupation and co-borrowers, with a sample EMI for the max loan"""
+    # Map occupation to employment type
+    employment_type = "salaried" if request.occupation.lower() == "salaried" else "self_employed"
+    
+    available_income = float(finance.available_income(request.income, request.existingEmi))
+    multiplier = finance.employment_multiplier(employment_type)
+    age_factor = float(finance.age_factor(request.age))
+    borrowers_factor = 1.2 if request.borrowers == "Two" else 1.0
+    
+    max_loan_amount = float(finance.max_loan_amount(
+        request.income, request.existingEmi, multiplier, age_factor * borrowers_factor
+    ))
+    eligible = bool(finance.is_eligible(request.income, request.existingEmi, max_loan_amount))
+    sample_emi = float(finance.emi(max_loan_amount, request.interestRate, request.tenure * 12))
+    
+    return {
+        "eligible": eligible,
+        "maxLoanAmount": round(max_loan_amount, 2),
+        "maxEmi": round(available_income, 2),
+        "maxPropertyValue": round(max_loan_amount / finance.MAX_LTV, 2),
+        "availableIncome": round(available_income, 2),
+        "sampleEmi": round(sample_emi, 2),
+        "factors": {
+            "employmentFactor": multiplier,
+            "ageFactor": age_factor,
+            "borrowersFactor": borrowers_factor,
+            "tenure": request.tenure,
+            "interestRate": request.interestRate
+        },
+        "message": "Eligible for loan" if eligible else "Not eligible - insufficient income",
+        "recommendations": [
+            "Reduce existing EMI to increase eligibility" if request.existingEmi > 0 else "No existing EMI - good for eligibility",
+            "Consider co-borrower to increase loan amount" if request.borrowers == "One" else "Co-borrower already included",
+            "Optimal age range for best rates: 30-45 years" if request.age < 30 or request.age > 45 else "Age is in optimal range"
+        ]
+    }
+
+def prepayment_vector(scenario: PrepaymentScenario, tenure_months: int) -> np.ndarray:
+    """Extra principal paid in each month of the loan under a scenario"""
+    extra = np.zeros(tenure_months)
+    if scenario.extra_monthly:
+        extra[max(scenario.extra_from_month, 1) - 1:] += scenario.extra_monthly
+    lump_sums = [p for p in scenario.lump_sums if 1 <= p.month <= tenure_months]
+    if lump_sums:
+        np.add.at(extra, [p.month - 1 for p in lump_sums], [p.amount for p in lump_sums])
+    return extra
+
+def iter_schedule_rows(request: AmortizationRequest) -> Iterator[List[list]]:
+    """Yield the schedule of each scenario in chunks of rows (lists in SCHEDULE_COLUMNS order).
+
+    Only one scenario's arrays exist at a time, so memory stays at a few
+    hundred rows regardless of how many scenarios are requested.
+    """
+    tenure_months = request.tenure_years * 12
+    scenarios = [PrepaymentScenario(name="baseline")] + request.scenarios
+    for scenario in scenarios:
+        schedule = finance.amortization_schedule(
+            request.principal, request.rate, tenure_months, prepayment_vector(scenario, tenure_months)
+        )
+        columns = [schedule["month"].tolist()] + [
+            np.round(schedule[name], 2).tolist() for name in finance.SCHEDULE_COLUMNS[1:]
+        ]
+        rows = list(zip(*columns))
+        for start in range(0, len(rows), SCHEDULE_CHUNK_ROWS):
+            yield [[scenario.name, *row] for row in rows[start:start + SCHEDULE_CHUNK_ROWS]]
+
+def ndjson_schedule(request: AmortizationRequest) -> Iterator[str]:
+    keys = ("scenario",) + finance.SCHEDULE_COLUMNS
+    for chunk in iter_schedule_rows(request):
+        yield "".join(json.dumps(dict(zip(keys, row))) + "\n" for row in chunk)
+
+def csv_schedule(request: AmortizationRequest) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(("scenario",) + finance.SCHEDULE_COLUMNS)
+    for chunk in iter_schedule_rows(request):
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
 @router.post("/eligibility", response_model=dict)
 async def check_loan_eligibility(request: LoanEligibilityRequest):
     """Check loan eligibility based on income, age, and other factors"""
     try:
-        # Map occupation to employment type
-        employment_type = "salaried" if request.occupation.lower() == "salaried" else "self_employed"
-        
-        # Calculate available income for EMI (50% rule)
-        available_income = request.income * 0.5 - request.existingEmi
-        
-        # Base eligibility multiplier
-        if employment_type == "salaried":
-            multiplier = 60  # 60x monthly income
-        else:
-            multiplier = 55  # 55x monthly income
-        
-        # Age factor (optimal age is 30-45)
-        if 30 <= request.age <= 45:
-            age_factor = 1.0
-        elif 25 <= request.age < 30 or 45 < request.age <= 55:
-            age_factor = 0.95
-        else:
-            age_factor = 0.85
-        
-        # Borrowers factor
-        borrowers_factor = 1.2 if request.borrowers == "Two" else 1.0
-        
-        # Calculate max loan amount
-        max_loan_amount = available_income * multiplier * age_factor * borrowers_factor
-        
-        # Calculate max EMI
-        max_emi = available_income
-        
-        # Calculate property value (assuming 80% LTV)
-        max_property_value = max_loan_amount / 0.8
-        
-        # Eligibility check
-        eligible = available_income > 0 and max_loan_amount > 500000
-        
-        # Calculate sample EMI for the max loan amount
-        monthly_rate = (request.interestRate / 100) / 12
-        tenure_months = request.tenure * 12
-        
-        if monthly_rate == 0:
-            sample_emi = max_loan_amount / tenure_months
-        else:
-            sample_emi = max_loan_amount * (monthly_rate * (1 + monthly_rate) ** tenure_months) / ((1 + monthly_rate) ** tenure_months - 1)
-        
-        return {
-            "eligible": eligible,
-            "maxLoanAmount": round(max_loan_amount, 2),
-            "maxEmi": round(max_emi, 2),
-            "maxPropertyValue": round(max_property_value, 2),
-            "availableIncome": round(available_income, 2),
-            "sampleEmi": round(sample_emi, 2),
-            "factors": {
-                "employmentFactor": multiplier,
-                "ageFactor": age_factor,
-                "borrowersFactor": borrowers_factor,
-                "tenure": request.tenure,
-                "interestRate": request.interestRate
-            },
-            "message": "Eligible for loan" if eligible else "Not eligible - insufficient income",
-            "recommendations": [
-                "Reduce existing EMI to increase eligibility" if request.existingEmi > 0 else "No existing EMI - good for eligibility",
-                "Consider co-borrower to increase loan amount" if request.borrowers == "One" else "Co-borrower already included",
-                "Optimal age range for best rates: 30-45 years" if request.age < 30 or request.age > 45 else "Age is in optimal range"
-            ]
-        }
-        
+        return estimate_eligibility(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error checking loan eligibility: {str(e)}")
 
@@ -379,9 +311,6 @@ async def check_loan_eligibility(request: LoanEligibilityRequest):
 async def apply_loan(loan_request: LoanRequest):
     """Submit a new loan application"""
     try:
-        # Generate new application ID
-        new_id = max([app["id"] for app in LOAN_APPLICATIONS]) + 1 if LOAN_APPLICATIONS else 1
-        
         # Calculate processing fee (1% of loan amount)
         processing_fee = loan_request.amount * 0.01
         
@@ -396,7 +325,6 @@ async def apply_loan(loan_request: LoanRequest):
         
         # Create loan application
         new_application = {
-            "id": new_id,
             "applicant_name": loan_request.applicant_name,
             "email": loan_request.email,
             "phone": loan_request.phone,
@@ -425,8 +353,9 @@ async def apply_loan(loan_request: LoanRequest):
             "remarks": "Application submitted successfully"
         }
         
-        # Add to applications list
-        LOAN_APPLICATIONS.append(new_application)
+        # Store the application; its id comes from an atomic sequence
+        new_application = await LoanRepository.create_application(new_application)
+        new_id = new_application["id"]
         
         return {
             "success": True,
@@ -456,18 +385,12 @@ async def get_loan_applications(
     loan_type: Optional[LoanType] = Query(None, description="Filter by loan type"),
     limit: int = Query(10, ge=1, le=100, description="Number of applications to return")
 ):
-    """Get loan applications with optional filtering"""
-    applications = LOAN_APPLICATIONS.copy()
-    
-    if status:
-        applications = [app for app in applications if app["status"] == status]
-    
-    if loan_type:
-        applications = [app for app in applications if app["loan_type"] == loan_type]
+    """Get loan applications with optional filtering (newest first)"""
+    applications = await LoanRepository.get_applications(status=status, loan_type=loan_type, limit=limit)
     
     # Convert to response format
     response_data = []
-    for app in applications[:limit]:
+    for app in applications:
         response_data.append({
             "id": app["id"],
             "applicant_name": app["applicant_name"],
@@ -489,7 +412,7 @@ async def get_loan_applications(
 @router.get("/applications/{application_id}", response_model=dict)
 async def get_loan_application(application_id: int):
     """Get specific loan application details"""
-    application = next((app for app in LOAN_APPLICATIONS if app["id"] == application_id), None)
+    application = await LoanRepository.get_application(application_id)
     
     if not application:
         raise HTTPException(status_code=404, detail="Loan application not found")
@@ -504,15 +427,11 @@ async def get_loan_application(application_id: int):
 async def apply_loan_simple(loan_data: SimpleLoanRequest):
     """Submit a simple loan application with minimal data"""
     try:
-        # Generate new application ID
-        new_id = max([app["id"] for app in LOAN_APPLICATIONS]) + 1 if LOAN_APPLICATIONS else 1
-        
         # Set default property value if not provided
         property_value = loan_data.property_value or (loan_data.amount * 1.33)  # Assume 75% LTV
         
         # Create simplified loan application
         new_application = {
-            "id": new_id,
             "applicant_name": loan_data.applicant_name,
             "email": loan_data.email,
             "phone": loan_data.phone,
@@ -541,8 +460,9 @@ async def apply_loan_simple(loan_data: SimpleLoanRequest):
             "remarks": "Quick application submitted"
         }
         
-        # Add to applications list
-        LOAN_APPLICATIONS.append(new_application)
+        # Store the application; its id comes from an atomic sequence
+        new_application = await LoanRepository.create_application(new_application)
+        new_id = new_application["id"]
         
         return {
             "success": True,
@@ -590,6 +510,32 @@ async def calculate_loan_emi(emi_data: EMICalculator):
         }
     }
 
+@router.post("/amortization")
+async def stream_amortization_schedule(
+    schedule_request: AmortizationRequest,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv")
+):
+    """Stream month-by-month amortization schedules for a loan and its prepayment scenarios.
+
+    The first scenario is always ``baseline`` (no prepayments). Prepayments
+    keep the EMI and shorten the loan. Rows are written as they are
+    computed, one scenario at a time, as NDJSON lines or CSV.
+    """
+    if schedule_request.principal <= 0 or schedule_request.rate < 0:
+        raise HTTPException(status_code=400, detail="principal must be positive and rate non-negative")
+    if not 1 <= schedule_request.tenure_years <= MAX_SCHEDULE_YEARS:
+        raise HTTPException(status_code=400, detail=f"tenure_years must be between 1 and {MAX_SCHEDULE_YEARS}")
+    if len(schedule_request.scenarios) > MAX_SCHEDULE_SCENARIOS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SCHEDULE_SCENARIOS} scenarios")
+    
+    if format == "csv":
+        return StreamingResponse(
+            csv_schedule(schedule_request),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=amortization.csv"}
+        )
+    return StreamingResponse(ndjson_schedule(schedule_request), media_type="application/x-ndjson")
+
 @router.post("/check-eligibility", response_model=dict)
 async def check_loan_eligibility(eligibility_data: EligibilityCheck):
     """Check loan eligibility based on income and other factors"""
@@ -602,7 +548,7 @@ async def check_loan_eligibility(eligibility_data: EligibilityCheck):
     
     # Calculate LTV ratio
     ltv_ratio = (eligibility_data.loan_amount / eligibility_data.property_value) * 100
-    max_ltv = 80.0  # Maximum 80% LTV
+    max_ltv = finance.MAX_LTV * 100
     
     return {
         "success": True,
@@ -611,11 +557,11 @@ async def check_loan_eligibility(eligibility_data: EligibilityCheck):
             "requested_ltv": round(ltv_ratio, 2),
             "max_allowed_ltv": max_ltv,
             "ltv_compliant": ltv_ratio <= max_ltv,
-            "max_loan_on_property": round(eligibility_data.property_value * 0.8, 2)
+            "max_loan_on_property": round(eligibility_data.property_value * finance.MAX_LTV, 2)
         },
         "recommendation": {
             "eligible": eligibility["eligible"] and ltv_ratio <= max_ltv,
-            "recommended_loan_amount": min(eligibility["max_loan_amount"], eligibility_data.property_value * 0.8),
+            "recommended_loan_amount": min(eligibility["max_loan_amount"], eligibility_data.property_value * finance.MAX_LTV),
             "recommended_emi": min(eligibility["max_emi"], eligibility["max_emi"]),
             "suggestions": [
                 "Maintain good credit score for better rates",
@@ -645,32 +591,26 @@ async def compare_loan_options(comparison_data: LoanComparison):
         
         # Use the provided interest rate or default to home loan rates
         loan_type = "home_loan"  # Default to home loan
-        
-        for bank_data in BANK_RATES:
-            bank_name = bank_data["bank"]
-            
-            # Use provided interest rate or bank's rate for the loan type
-            interest_rate = comparison_data.interest_rate if comparison_data.interest_rate else bank_data[loan_type]
-            
-            # EMI Calculation
-            monthly_rate = interest_rate / (12 * 100)
-            tenure_months = comparison_data.tenure * 12
-            
-            if monthly_rate > 0:
-                emi = (comparison_data.amount * monthly_rate * (1 + monthly_rate)**tenure_months) / ((1 + monthly_rate)**tenure_months - 1)
-            else:
-                emi = comparison_data.amount / tenure_months
-            
-            # Total calculations
-            total_payment = emi * tenure_months
-            total_interest = total_payment - comparison_data.amount
-            
-            # Processing fee calculation (standard 0.5% with max 50,000)
-            processing_fee = min(0.005 * comparison_data.amount, 50000)
-            
+        tenure_months = comparison_data.tenure * 12
+        
+        # Price every bank in one vectorized pass
+        rates = np.array([
+            comparison_data.interest_rate if comparison_data.interest_rate else bank_data[loan_type]
+            for bank_data in BANK_RATES
+        ])
+        emis = finance.emi(comparison_data.amount, rates, tenure_months)
+        total_payments = emis * tenure_months
+        total_interests = total_payments - comparison_data.amount
+        
+        # Processing fee calculation (standard 0.5% with max 50,000)
+        processing_fee = min(0.005 * comparison_data.amount, 50000)
+        
+        for bank_data, interest_rate, emi, total_payment, total_interest in zip(
+            BANK_RATES, rates.tolist(), emis.tolist(), total_payments.tolist(), total_interests.tolist()
+        ):
             # Create loan option
             loan_option = LoanOption(
-                bank_name=bank_name,
+                bank_name=bank_data["bank"],
                 loan_type="Home Loan",
                 interest_rate=interest_rate,
                 emi=round(emi, 2),
@@ -740,10 +680,56 @@ async def compare_loan_options(comparison_data: LoanComparison):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error comparing loan options: {str(e)}")
 
+@router.post("/compare/grid")
+async def compare_loan_grid(grid_request: LoanGridRequest):
+    """EMI of every bank across rate shifts and tenures, computed in one vectorized pass.
+
+    ``emi``, ``total_payable`` and ``total_interest`` are indexed
+    ``[bank][rate_shift][tenure]`` in the order of ``banks``, ``rate_shifts``
+    and ``tenures_years``.
+    """
+    if grid_request.amount <= 0:
+        raise HTTPException(status_code=400, detail="amount must be positive")
+    if not grid_request.tenures or not grid_request.rate_shifts:
+        raise HTTPException(status_code=400, detail="tenures and rate_shifts must not be empty")
+    if len(grid_request.tenures) > 40 or len(grid_request.rate_shifts) > 40:
+        raise HTTPException(status_code=400, detail="At most 40 tenures and 40 rate shifts")
+    if min(grid_request.tenures) <= 0:
+        raise HTTPException(status_code=400, detail="tenures must be positive")
+    if any(grid_request.loan_type not in bank_data for bank_data in BANK_RATES):
+        raise HTTPException(status_code=400, detail=f"Unknown loan_type '{grid_request.loan_type}'")
+    
+    bank_rates = np.array([bank_data[grid_request.loan_type] for bank_data in BANK_RATES])
+    rate_shifts = np.array(grid_request.rate_shifts, dtype=float)
+    if (bank_rates.min() + rate_shifts.min()) < 0:
+        raise HTTPException(status_code=400, detail="rate_shifts would make an interest rate negative")
+    
+    tenures = np.array(grid_request.tenures, dtype=float)
+    emis = finance.emi_grid(grid_request.amount, bank_rates, rate_shifts, tenures)
+    total_payable = emis * (tenures * 12)
+    total_interest = total_payable - grid_request.amount
+    cheapest = np.argmin(emis, axis=0)  # bank index per (shift, tenure)
+    
+    banks = [bank_data["bank"] for bank_data in BANK_RATES]
+    return {
+        "success": True,
+        "loan_amount": grid_request.amount,
+        "loan_type": grid_request.loan_type,
+        "banks": banks,
+        "base_rates": bank_rates.tolist(),
+        "rate_shifts": rate_shifts.tolist(),
+        "tenures_years": grid_request.tenures,
+        "emi": np.round(emis, 2).tolist(),
+        "total_payable": np.round(total_payable, 2).tolist(),
+        "total_interest": np.round(total_interest, 2).tolist(),
+        "lowest_emi_bank": [[banks[index] for index in row] for row in cheapest.tolist()]
+    }
+
 @router.get("/analytics", response_model=dict)
 async def get_loan_analytics():
     """Get loan application analytics and statistics"""
-    total_applications = len(LOAN_APPLICATIONS)
+    analytics = await LoanRepository.get_analytics()
+    total_applications = analytics["total_applications"]
     
     if total_applications == 0:
         return {
@@ -757,26 +743,10 @@ async def get_loan_analytics():
             }
         }
     
-    # Status distribution
-    status_counts = {}
-    for app in LOAN_APPLICATIONS:
-        status = app["status"]
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
-    # Loan type distribution
-    type_counts = {}
-    for app in LOAN_APPLICATIONS:
-        loan_type = app["loan_type"]
-        type_counts[loan_type] = type_counts.get(loan_type, 0) + 1
-    
-    # Financial metrics
-    total_loan_amount = sum(app["loan_amount"] for app in LOAN_APPLICATIONS)
-    average_loan_amount = total_loan_amount / total_applications
-    average_tenure = sum(app["tenure_years"] for app in LOAN_APPLICATIONS) / total_applications
-    average_interest_rate = sum(app["interest_rate"] for app in LOAN_APPLICATIONS) / total_applications
+    status_counts = analytics["status_distribution"]
     
     # Approval rate
-    approved_count = status_counts.get(LoanStatus.approved, 0)
+    approved_count = status_counts.get(LoanStatus.approved.value, 0)
     approval_rate = (approved_count / total_applications) * 100
     
     return {
@@ -784,17 +754,17 @@ async def get_loan_analytics():
         "analytics": {
             "total_applications": total_applications,
             "status_distribution": status_counts,
-            "loan_type_distribution": type_counts,
+            "loan_type_distribution": analytics["loan_type_distribution"],
             "financial_metrics": {
-                "total_loan_amount": round(total_loan_amount, 2),
-                "average_loan_amount": round(average_loan_amount, 2),
-                "average_tenure_years": round(average_tenure, 1),
-                "average_interest_rate": round(average_interest_rate, 2)
+                "total_loan_amount": round(analytics["total_loan_amount"], 2),
+                "average_loan_amount": round(analytics["average_loan_amount"], 2),
+                "average_tenure_years": round(analytics["average_tenure_years"], 1),
+                "average_interest_rate": round(analytics["average_interest_rate"], 2)
             },
             "performance_metrics": {
                 "approval_rate": round(approval_rate, 2),
-                "pending_applications": status_counts.get(LoanStatus.pending, 0),
-                "under_review_applications": status_counts.get(LoanStatus.under_review, 0)
+                "pending_applications": status_counts.get(LoanStatus.pending.value, 0),
+                "under_review_applications": status_counts.get(LoanStatus.under_review.value, 0)
             }
         }
     }
@@ -802,26 +772,16 @@ async def get_loan_analytics():
 @router.put("/applications/{application_id}/status", response_model=dict)
 async def update_application_status(application_id: int, new_status: LoanStatus, remarks: Optional[str] = None):
     """Update loan application status (Admin function)"""
-    application = next((app for app in LOAN_APPLICATIONS if app["id"] == application_id), None)
+    result = await LoanRepository.update_status(application_id, new_status, remarks)
     
-    if not application:
+    if not result:
         raise HTTPException(status_code=404, detail="Loan application not found")
     
-    old_status = application["status"]
-    application["status"] = new_status
-    
-    # Update relevant dates
-    if new_status == LoanStatus.approved:
-        application["approval_date"] = datetime.now()
-    elif new_status == LoanStatus.disbursed:
-        application["disbursement_date"] = datetime.now()
-    
-    if remarks:
-        application["remarks"] = remarks
+    old_status, _ = result
     
     return {
         "success": True,
-        "message": f"Application status updated from {old_status} to {new_status}",
+        "message": f"Application status updated from {old_status} to {new_status.value}",
         "application_id": application_id,
         "old_status": old_status,
         "new_status": new_status,
@@ -833,9 +793,6 @@ async def update_application_status(application_id: int, new_status: LoanStatus,
 async def talk_to_expert(consultation_data: ExpertConsultation):
     """Submit request to talk to a loan expert"""
     try:
-        # Generate new consultation ID
-        consultation_id = len(EXPERT_CONSULTATIONS) + 1
-        
         # Calculate loan-to-value ratio
         ltv_ratio = (consultation_data.loan_amount / consultation_data.total_budget) * 100
         
@@ -852,7 +809,6 @@ async def talk_to_expert(consultation_data: ExpertConsultation):
         
         # Create consultation record
         consultation_record = {
-            "id": consultation_id,
             "name": consultation_data.name,
             "phone": consultation_data.phone,
             "email": consultation_data.email,
@@ -873,8 +829,8 @@ async def talk_to_expert(consultation_data: ExpertConsultation):
             "scheduled_call_time": None
         }
         
-        # Add to consultations list
-        EXPERT_CONSULTATIONS.append(consultation_record)
+        consultation_record = await LoanRepository.create_consultation(consultation_record)
+        consultation_id = consultation_record["id"]
         
         # Determine expert recommendation
         if ltv_ratio > 80:
@@ -916,15 +872,18 @@ async def talk_to_expert(consultation_data: ExpertConsultation):
         raise HTTPException(status_code=500, detail=f"Error processing expert consultation request: {str(e)}")
 
 @router.get("/consultations", response_model=dict)
-async def get_expert_consultations():
-    """Get all expert consultation requests (Admin function)"""
+async def get_expert_consultations(
+    limit: int = Query(100, ge=1, le=500, description="Number of consultations to return")
+):
+    """Get the latest expert consultation requests (Admin function)"""
+    consultations, summary = await LoanRepository.get_consultations(limit=limit)
     return {
         "success": True,
-        "total_consultations": len(EXPERT_CONSULTATIONS),
-        "consultations": EXPERT_CONSULTATIONS,
+        "total_consultations": summary["total"],
+        "consultations": consultations,
         "summary": {
-            "pending": len([c for c in EXPERT_CONSULTATIONS if c["status"] == "Pending"]),
-            "high_priority": len([c for c in EXPERT_CONSULTATIONS if c["priority"] == "High"]),
-            "average_loan_amount": sum(c["financial_details"]["loan_amount"] for c in EXPERT_CONSULTATIONS) / len(EXPERT_CONSULTATIONS) if EXPERT_CONSULTATIONS else 0
+            "pending": summary["pending"],
+            "high_priority": summary["high_priority"],
+            "average_loan_amount": summary["average_loan_amount"]
         }
     }
\ No newline at end of file
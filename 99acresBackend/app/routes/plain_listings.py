@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
+from app.database.listing_store import listing_store
 
 router = APIRouter()
 
@@ -157,6 +158,11 @@ PLAIN_LISTINGS = [
     }
 ]
 
+listing_store.register("plain", PLAIN_LISTINGS, indexes={
+    "type": "type",
+    "status": "status"
+}, search_fields={"title": 3, "location": 2, "type": 1})
+
 @router.get("", response_model=dict)
 @router.get("/", response_model=dict)
 async def get_plain_listings(
@@ -166,25 +172,14 @@ async def get_plain_listings(
 ):
     """Get simple property listings with basic information only"""
     try:
-        filtered_listings = PLAIN_LISTINGS.copy()
-        
-        # Apply filters
-        if type:
-            filtered_listings = [l for l in filtered_listings if l["type"].lower() == type.lower()]
-        
-        if status:
-            filtered_listings = [l for l in filtered_listings if l["status"].lower() == status.lower()]
-        
-        # Apply limit
-        if limit:
-            filtered_listings = filtered_listings[:limit]
+        filtered_listings, _ = listing_store.query("plain", type=type, status=status, limit=limit)
         
         return {
             "success": True,
             "message": "Plain listings retrieved successfully",
             "data": filtered_listings,
             "count": len(filtered_listings),
-            "total": len(PLAIN_LISTINGS)
+            "total": listing_store.total("plain")
         }
         
     except Exception as e:
@@ -246,8 +241,8 @@ async def get_simple_listings():
 async def get_listing_types():
     """Get available property types in plain listings"""
     try:
-        types = list(set([listing["type"] for listing in PLAIN_LISTINGS]))
-        statuses = list(set([listing["status"] for listing in PLAIN_LISTINGS]))
+        types = listing_store.distinct("plain", "type")
+        statuses = listing_store.distinct("plain", "status")
         
         return {
             "success": True,
@@ -270,9 +265,9 @@ async def get_listing_types():
 async def get_listings_summary():
     """Get summary statistics of plain listings"""
     try:
-        total_listings = len(PLAIN_LISTINGS)
-        active_count = len([l for l in PLAIN_LISTINGS if l["status"] == "active"])
-        sold_count = len([l for l in PLAIN_LISTINGS if l["status"] == "sold"])
+        total_listings = listing_store.total("plain")
+        active_count = listing_store.count("plain", status="active")
+        sold_count = listing_store.count("plain", status="sold")
         
         # Views statistics
         total_views = sum([l["views"] for l in PLAIN_LISTINGS])
@@ -319,8 +314,8 @@ async def get_listings_summary():
 async def get_dashboard_data():
     """Get dashboard data specifically formatted for frontend"""
     try:
-        total_listings = len(PLAIN_LISTINGS)
-        active_listings = len([l for l in PLAIN_LISTINGS if l["status"] == "active"])
+        total_listings = listing_store.total("plain")
+        active_listings = listing_store.count("plain", status="active")
         views_this_month = sum([l["views"] for l in PLAIN_LISTINGS if l["created_date"].startswith("2025-10")])
         
         # Format listings for table display
@@ -366,7 +361,7 @@ async def get_dashboard_data():
 async def get_plain_listing_by_id(listing_id: int):
     """Get a specific plain listing by ID"""
     try:
-        listing = next((l for l in PLAIN_LISTINGS if l["id"] == listing_id), None)
+        listing = listing_store.get("plain", listing_id)
         
         if not listing:
             raise HTTPException(status_code=404, detail="Plain listing not found")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
 from datetime import datetime
+from app.database.listing_store import listing_store
 
 router = APIRouter()
 
@@ -260,6 +261,16 @@ PLATINUM_LISTINGS = [
     }
 ]
 
+listing_store.register("platinum", PLATINUM_LISTINGS, indexes={
+    "city": "city",
+    "type": "type",
+    "status": "status",
+    "featured": "featured",
+    "premium_badge": "premium_badge"
+}, search_fields={
+    "title": 3, "location": 2, "city": 2, "state": 1, "type": 1, "description": 1, "amenities": 1
+})
+
 @router.get("", response_model=dict)
 @router.get("/", response_model=dict)
 async def get_platinum_listings(
@@ -274,38 +285,25 @@ async def get_platinum_listings(
 ):
     """Get platinum listings with premium features and maximum visibility"""
     try:
-        filtered_listings = PLATINUM_LISTINGS.copy()
-        
-        # Apply filters
-        if city:
-            filtered_listings = [l for l in filtered_listings if l["city"].lower() == city.lower()]
-        
-        if type:
-            filtered_listings = [l for l in filtered_listings if l["type"].lower() == type.lower()]
-        
-        if status:
-            filtered_listings = [l for l in filtered_listings if l["status"].lower() == status.lower()]
-            
-        if featured is not None:
-            filtered_listings = [l for l in filtered_listings if l["featured"] == featured]
-            
-        if furnishing:
-            filtered_listings = [l for l in filtered_listings if furnishing.lower() in l["furnishing"].lower()]
-        
-        if min_price is not None:
-            filtered_listings = [l for l in filtered_listings if l["price"] >= min_price]
-            
-        if max_price is not None:
-            filtered_listings = [l for l in filtered_listings if l["price"] <= max_price]
-        
-        # Apply limit
-        if limit:
-            filtered_listings = filtered_listings[:limit]
+        # Indexed lookup on city/type/status/featured plus a price range bisect;
+        # the furnishing substring match only runs over the narrowed candidates
+        furnishing_filter = furnishing.lower() if furnishing else None
+        filtered_listings, _ = listing_store.query(
+            "platinum",
+            city=city,
+            type=type,
+            status=status,
+            featured=featured,
+            min_price=min_price,
+            max_price=max_price,
+            where=(lambda l: furnishing_filter in l["furnishing"].lower()) if furnishing_filter else None,
+            limit=limit
+        )
         
         # Calculate advanced statistics
         total_views = sum([l["views"] for l in PLATINUM_LISTINGS])
-        featured_count = len([l for l in PLATINUM_LISTINGS if l["featured"]])
-        premium_badge_count = len([l for l in PLATINUM_LISTINGS if l["premium_badge"]])
+        featured_count = listing_store.count("platinum", featured=True)
+        premium_badge_count = listing_store.count("platinum", premium_badge=True)
         avg_price_per_sqft = sum([l["price_per_sqft"] for l in PLATINUM_LISTINGS]) // len(PLATINUM_LISTINGS)
         
         return {
@@ -313,7 +311,7 @@ async def get_platinum_listings(
             "message": "Platinum listings retrieved successfully",
             "data": filtered_listings,
             "count": len(filtered_listings),
-            "total_available": len(PLATINUM_LISTINGS),
+            "total_available": listing_store.total("platinum"),
             "statistics": {
                 "total_views": total_views,
                 "featured_listings": featured_count,
@@ -344,10 +342,10 @@ async def get_platinum_listings(
 async def get_platinum_dashboard():
     """Get platinum listings dashboard data with premium features overview"""
     try:
-        total_listings = len(PLATINUM_LISTINGS)
-        active_listings = len([l for l in PLATINUM_LISTINGS if l["status"] == "active"])
-        featured_listings = len([l for l in PLATINUM_LISTINGS if l["featured"]])
-        premium_badge_listings = len([l for l in PLATINUM_LISTINGS if l["premium_badge"]])
+        total_listings = listing_store.total("platinum")
+        active_listings = listing_store.count("platinum", status="active")
+        featured_listings = listing_store.count("platinum", featured=True)
+        premium_badge_listings = listing_store.count("platinum", premium_badge=True)
         social_promotion_listings = len([l for l in PLATINUM_LISTINGS if l["social_media_promotion"]])
         views_this_month = sum([l["views"] for l in PLATINUM_LISTINGS if l["created_date"].startswith("2025-10")])
         total_views = sum([l["views"] for l in PLATINUM_LISTINGS])
@@ -416,7 +414,7 @@ async def get_platinum_dashboard():
 async def get_featured_platinum_listings():
     """Get featured platinum listings with premium placement"""
     try:
-        featured_listings = [l for l in PLATINUM_LISTINGS if l["featured"] and l["status"] == "active"]
+        featured_listings, _ = listing_store.query("platinum", featured=True, status="active")
         
         return {
             "success": True,
@@ -437,7 +435,7 @@ async def get_featured_platinum_listings():
 async def get_premium_badge_listings():
     """Get listings with premium badge status"""
     try:
-        premium_listings = [l for l in PLATINUM_LISTINGS if l["premium_badge"] and l["status"] == "active"]
+        premium_listings, _ = listing_store.query("platinum", premium_badge=True, status="active")
         
         return {
             "success": True,
@@ -458,9 +456,9 @@ async def get_premium_badge_listings():
 async def get_platinum_analytics():
     """Get comprehensive analytics for platinum listings"""
     try:
-        total_listings = len(PLATINUM_LISTINGS)
-        active_listings = len([l for l in PLATINUM_LISTINGS if l["status"] == "active"])
-        sold_listings = len([l for l in PLATINUM_LISTINGS if l["status"] == "sold"])
+        total_listings = listing_store.total("platinum")
+        active_listings = listing_store.count("platinum", status="active")
+        sold_listings = listing_store.count("platinum", status="sold")
         
         # Performance metrics
         total_views = sum([l["views"] for l in PLATINUM_LISTINGS])
@@ -538,7 +536,7 @@ async def get_platinum_analytics():
 async def get_platinum_listing_by_id(listing_id: int):
     """Get a specific platinum listing with all premium details"""
     try:
-        listing = next((l for l in PLATINUM_LISTINGS if l["id"] == listing_id), None)
+        listing = listing_store.get("platinum", listing_id)
         
         if not listing:
             raise HTTPException(status_code=404, detail="Platinum listing not found")
@@ -4,7 +4,7 @@ from app.database.schemas.property import (
     PropertyCreate, PropertyUpdate, PropertyResponse, PropertySearch, 
     PropertyStats, AdminPropertyUpdate
 )
-from app.database.schemas.common import SuccessResponse, PaginatedResponse
+from app.database.schemas.common import SuccessResponse, PaginatedResponse, decode_cursor
 from app.database.repositories.property_repository import PropertyRepository
 from app.database.models import User, Property, PropertyType, ListingType, PropertyStatus, UserRole
 from app.utils.dependencies import (
@@ -15,6 +15,15 @@ from app.utils.dependencies import (
 router = APIRouter()
 
 
+def validate_cursor(cursor: Optional[str]) -> None:
+    """Reject malformed pagination cursors with a 400"""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 def convert_property_to_response(property_obj: Property) -> dict:
     """Convert Property model to PropertyResponse dict with proper field mapping"""
     prop_dict = property_obj.dict()
@@ -66,18 +75,21 @@ async def get_properties(
     bedrooms: Optional[int] = None,
     is_featured: Optional[bool] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Get properties list"""
     skip = (page - 1) * size
+    validate_cursor(cursor)
     
     # Only show approved properties for non-admin users
     status_filter = PropertyStatus.ACTIVE
     if current_user and current_user.role in ["admin", "super_admin"]:
         status_filter = None
     
-    properties = await PropertyRepository.get_properties(
+    properties, next_cursor = await PropertyRepository.get_properties(
         skip=skip,
+        cursor=cursor,
         limit=size,
         city=city,
         state=state,
@@ -111,7 +123,8 @@ async def get_properties(
         total=total,
         page=page,
         size=size,
-        pages=(total + size - 1) // size
+        pages=(total + size - 1) // size,
+        next_cursor=next_cursor
     )
 
 
@@ -119,13 +132,16 @@ async def get_properties(
 async def get_my_properties(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get current user's properties"""
     skip = (page - 1) * size
+    validate_cursor(cursor)
     
-    properties = await PropertyRepository.get_properties(
+    properties, next_cursor = await PropertyRepository.get_properties(
         skip=skip,
+        cursor=cursor,
         limit=size,
         owner_id=str(current_user.id)
     )
@@ -144,7 +160,8 @@ async def get_my_properties(
         total=total,
         page=page,
         size=size,
-        pages=(total + size - 1) // size
+        pages=(total + size - 1) // size,
+        next_cursor=next_cursor
     )
 
 
@@ -264,13 +281,16 @@ async def search_properties(
     search_data: PropertySearch,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Search properties"""
     skip = (page - 1) * size
+    validate_cursor(cursor)
     
-    properties = await PropertyRepository.get_properties(
+    properties, next_cursor = await PropertyRepository.get_properties(
         skip=skip,
+        cursor=cursor,
         limit=size,
         city=search_data.city,
         state=search_data.state,
@@ -302,5 +322,6 @@ async def search_properties(
         total=total,
         page=page,
         size=size,
-        pages=(total + size - 1) // size
+        pages=(total + size - 1) // size,
+        next_cursor=next_cursor
     )
\ No newline at end of file
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
 from pydantic import BaseModel
+from app.database.affordability import AffordabilityIndex
+from app.database.mongodb import mongodb
+from app.database.repositories.property_geo_repository import PropertyGeoRepository
 
 router = APIRouter()
 
@@ -130,6 +133,9 @@ SAMPLE_PROPERTIES = [
     }
 ]
 
+# Price-sorted view of SAMPLE_PROPERTIES for budget searches
+affordability_index = AffordabilityIndex(SAMPLE_PROPERTIES)
+
 @router.get("", response_model=dict)
 @router.get("/", response_model=dict)
 async def get_properties(
@@ -173,6 +179,83 @@ async def get_properties(
         }
     }
 
+@router.get("/nearby", response_model=dict)
+async def get_nearby_properties(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search centre"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude of the search centre"),
+    radius_km: float = Query(5, gt=0, le=100, description="Search radius in kilometres"),
+    property_type: Optional[str] = None,
+    listing_type: Optional[str] = None,
+    status: Optional[str] = Query("available", description="Property status (empty for any)"),
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    bedrooms: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Properties within a radius, nearest first, with their distance in km"""
+    # $geoNear needs the 2dsphere index, which FAST_STARTUP builds in the background
+    if mongodb.setup_task and not mongodb.setup_task.done():
+        raise HTTPException(
+            status_code=503,
+            detail="Location index is still being built, try again shortly",
+            headers={"Retry-After": "30"}
+        )
+    try:
+        properties = await PropertyGeoRepository.find_nearby(
+            lat, lng, radius_km, skip=skip, limit=limit,
+            property_type=property_type, listing_type=listing_type, status=status,
+            min_price=min_price, max_price=max_price, bedrooms=bedrooms
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching nearby properties: {str(e)}")
+    
+    return {
+        "success": True,
+        "message": f"Found {len(properties)} properties within {radius_km} km",
+        "data": properties,
+        "pagination": {
+            "count": len(properties),
+            "skip": skip,
+            "limit": limit
+        }
+    }
+
+@router.get("/in-bounds", response_model=dict)
+async def get_properties_in_bounds(
+    south: float = Query(..., ge=-90, le=90),
+    west: float = Query(..., ge=-180, le=180),
+    north: float = Query(..., ge=-90, le=90),
+    east: float = Query(..., ge=-180, le=180),
+    property_type: Optional[str] = None,
+    listing_type: Optional[str] = None,
+    status: Optional[str] = Query("available", description="Property status (empty for any)"),
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    bedrooms: Optional[int] = None,
+    limit: int = Query(200, ge=1, le=500)
+):
+    """Properties inside a map viewport (south-west / north-east corners)"""
+    if south >= north or west >= east:
+        raise HTTPException(status_code=400, detail="Bounds must satisfy south < north and west < east")
+    
+    try:
+        properties = await PropertyGeoRepository.find_in_bounds(
+            south, west, north, east, limit=limit,
+            property_type=property_type, listing_type=listing_type, status=status,
+            min_price=min_price, max_price=max_price, bedrooms=bedrooms
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching properties in bounds: {str(e)}")
+    
+    return {
+        "success": True,
+        "message": f"Found {len(properties)} properties in the map area",
+        "data": properties,
+        "count": len(properties),
+        "truncated": len(properties) == limit
+    }
+
 @router.get("/{property_id}", response_model=dict)
 async def get_property(property_id: int):
     """Get single property by ID - SQLite integration pending"""
@@ -220,104 +303,88 @@ async def update_property(property_id: int):
         "message": f"Property {property_id} update - SQLite integration in progress"
     }
 
-@router.post("/find-properties")
-@router.post("/find-properties/")
-async def find_properties(search_request: PropertySearchRequest):
-    """Find properties based on budget and loan criteria"""
-    try:
-        # Filter properties based on total budget
-        budget_range_min = search_request.total_budget * 0.8  # Allow 20% below budget
-        budget_range_max = search_request.total_budget * 1.1  # Allow 10% above budget
-        
-        filtered_properties = []
-        
-        for property in SAMPLE_PROPERTIES:
-            # Check if property price is within budget range
-            if budget_range_min <= property["price"] <= budget_range_max:
-                # Calculate financing details for this property
-                down_payment_needed = property["price"] - search_request.loan_amount
-                down_payment_percentage = (down_payment_needed / property["price"]) * 100
-                
-                # Calculate affordability score (higher is better)
-                affordability_score = 100
-                if down_payment_needed > search_request.savings:
-                    affordability_score -= 30  # Insufficient down payment
-                if property["price"] > search_request.total_budget:
-                    affordability_score -= 20  # Over budget
-                
-                # Add financing details to property
-                property_with_finance = property.copy()
-                property_with_finance["financing_details"] = {
-                    "property_price": property["price"],
-                    "loan_amount": search_request.loan_amount,
-                    "down_payment_needed": round(down_payment_needed),
-                    "down_payment_percentage": round(down_payment_percentage, 1),
-                    "monthly_emi": search_request.emi,
-                    "loan_tenure": search_request.loan_tenure,
-                    "affordability_score": affordability_score,
-                    "is_affordable": down_payment_needed <= search_request.savings
-                }
-                
-                filtered_properties.append(property_with_finance)
-        
-        # Sort by affordability score (best matches first)
-        filtered_properties.sort(key=lambda x: x["financing_details"]["affordability_score"], reverse=True)
-        
-        # Calculate summary statistics
-        total_properties = len(filtered_properties)
-        affordable_count = len([p for p in filtered_properties if p["financing_details"]["is_affordable"]])
-        
-        if total_properties == 0:
-            return {
-                "success": True,
-                "message": "No properties found within your budget range",
-                "search_criteria": {
-                    "total_budget": search_request.total_budget,
-                    "loan_amount": search_request.loan_amount,
-                    "savings": search_request.savings,
-                    "monthly_emi": search_request.emi
-                },
-                "properties": [],
-                "summary": {
-                    "total_found": 0,
-                    "affordable_count": 0,
-                    "budget_range": f"₹{budget_range_min:,.0f} - ₹{budget_range_max:,.0f}"
-                },
-                "suggestions": [
-                    "Consider increasing your budget",
-                    "Look for properties in different locations",
-                    "Consider a higher loan amount if eligible",
-                    "Explore properties with lower prices"
-                ]
-            }
-        
+def find_affordable_properties(search_request: PropertySearchRequest, skip: int = 0, limit: int = 20) -> dict:
+    """Budget search shared by /api/properties/find-properties and /find-properties"""
+    result = affordability_index.search(
+        search_request.total_budget,
+        search_request.loan_amount,
+        search_request.savings,
+        skip=skip,
+        limit=limit
+    )
+    budget_range = f"₹{result.budget_min:,.0f} - ₹{result.budget_max:,.0f}"
+    
+    if result.total_found == 0:
         return {
             "success": True,
-            "message": f"Found {total_properties} properties matching your criteria",
+            "message": "No properties found within your budget range",
             "search_criteria": {
                 "total_budget": search_request.total_budget,
                 "loan_amount": search_request.loan_amount,
                 "savings": search_request.savings,
-                "monthly_emi": search_request.emi,
-                "loan_tenure": search_request.loan_tenure
+                "monthly_emi": search_request.emi
             },
-            "properties": filtered_properties,
+            "properties": [],
             "summary": {
-                "total_found": total_properties,
-                "affordable_count": affordable_count,
-                "budget_range": f"₹{budget_range_min:,.0f} - ₹{budget_range_max:,.0f}",
-                "average_price": round(sum(p["price"] for p in filtered_properties) / total_properties),
-                "price_range": {
-                    "min": min(p["price"] for p in filtered_properties),
-                    "max": max(p["price"] for p in filtered_properties)
-                }
+                "total_found": 0,
+                "affordable_count": 0,
+                "budget_range": budget_range
             },
-            "financing_summary": {
-                "average_down_payment": round(sum(p["financing_details"]["down_payment_needed"] for p in filtered_properties) / total_properties),
-                "properties_within_savings": affordable_count,
-                "recommended_property": filtered_properties[0]["title"] if filtered_properties else None
+            "suggestions": [
+                "Consider increasing your budget",
+                "Look for properties in different locations",
+                "Consider a higher loan amount if eligible",
+                "Explore properties with lower prices"
+            ]
+        }
+    
+    for property in result.properties:
+        property["financing_details"]["monthly_emi"] = search_request.emi
+        property["financing_details"]["loan_tenure"] = search_request.loan_tenure
+    
+    return {
+        "success": True,
+        "message": f"Found {result.total_found} properties matching your criteria",
+        "search_criteria": {
+            "total_budget": search_request.total_budget,
+            "loan_amount": search_request.loan_amount,
+            "savings": search_request.savings,
+            "monthly_emi": search_request.emi,
+            "loan_tenure": search_request.loan_tenure
+        },
+        "properties": result.properties,
+        "pagination": {
+            "skip": skip,
+            "limit": limit,
+            "returned": len(result.properties),
+            "has_more": skip + len(result.properties) < result.total_found
+        },
+        "summary": {
+            "total_found": result.total_found,
+            "affordable_count": result.affordable_count,
+            "budget_range": budget_range,
+            "average_price": result.average_price,
+            "price_range": {
+                "min": result.min_price,
+                "max": result.max_price
             }
+        },
+        "financing_summary": {
+            "average_down_payment": result.average_down_payment,
+            "properties_within_savings": result.affordable_count,
+            "recommended_property": result.recommended_property
         }
-        
+    }
+
+@router.post("/find-properties")
+@router.post("/find-properties/")
+async def find_properties(
+    search_request: PropertySearchRequest,
+    skip: int = Query(0, ge=0, description="Number of ranked matches to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Number of matches to return")
+):
+    """Find properties based on budget and loan criteria, best affordability first"""
+    try:
+        return find_affordable_properties(search_request, skip, limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error finding properties: {str(e)}")
\ No newline at end of file
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Security
+from fastapi import APIRouter, HTTPException, status, Depends, Security, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Optional
-from app.routes.loans import EXPERT_CONSULTATIONS, ExpertConsultation
-from app.routes.properties_simple import SAMPLE_PROPERTIES, PropertySearchRequest
+from app.routes.loans import ExpertConsultation, LoanEligibilityRequest, estimate_eligibility
+from app.database.repositories.loan_repository import LoanRepository
+from app.routes.properties_simple import PropertySearchRequest, find_affordable_properties
 from app.database.mongo_models import User
 from app.database.repositories.mongo_user_repository import MongoUserRepository
 from app.utils.auth import verify_password, create_access_token
@@ -82,9 +83,6 @@ class RootPropertySearch(BaseModel):
 async def talk_to_expert_root(consultation_data: RootExpertConsultation):
     """Submit request to talk to a loan expert (Root level endpoint)"""
     try:
-        # Generate new consultation ID
-        consultation_id = len(EXPERT_CONSULTATIONS) + 1
-        
         # Calculate loan-to-value ratio
         ltv_ratio = (consultation_data.loan_amount / consultation_data.total_budget) * 100
         
@@ -101,7 +99,6 @@ async def talk_to_expert_root(consultation_data: RootExpertConsultation):
         
         # Create consultation record
         consultation_record = {
-            "id": consultation_id,
             "name": consultation_data.name,
             "phone": consultation_data.phone,
             "email": consultation_data.email,
@@ -122,8 +119,8 @@ async def talk_to_expert_root(consultation_data: RootExpertConsultation):
             "scheduled_call_time": None
         }
         
-        # Add to consultations list
-        EXPERT_CONSULTATIONS.append(consultation_record)
+        consultation_record = await LoanRepository.create_consultation(consultation_record)
+        consultation_id = consultation_record["id"]
         
         # Determine expert recommendation
         if ltv_ratio > 80:
@@ -166,103 +163,14 @@ async def talk_to_expert_root(consultation_data: RootExpertConsultation):
 
 @router.post("/find-properties")
 @router.post("/find-properties/")
-async def find_properties_root(search_request: RootPropertySearch):
+async def find_properties_root(
+    search_request: RootPropertySearch,
+    skip: int = Query(0, ge=0, description="Number of ranked matches to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Number of matches to return")
+):
     """Find properties based on budget and loan criteria (Root level endpoint)"""
     try:
-        # Filter properties based on total budget
-        budget_range_min = search_request.total_budget * 0.8  # Allow 20% below budget
-        budget_range_max = search_request.total_budget * 1.1  # Allow 10% above budget
-        
-        filtered_properties = []
-        
-        for property in SAMPLE_PROPERTIES:
-            # Check if property price is within budget range
-            if budget_range_min <= property["price"] <= budget_range_max:
-                # Calculate financing details for this property
-                down_payment_needed = property["price"] - search_request.loan_amount
-                down_payment_percentage = (down_payment_needed / property["price"]) * 100
-                
-                # Calculate affordability score (higher is better)
-                affordability_score = 100
-                if down_payment_needed > search_request.savings:
-                    affordability_score -= 30  # Insufficient down payment
-                if property["price"] > search_request.total_budget:
-                    affordability_score -= 20  # Over budget
-                
-                # Add financing details to property
-                property_with_finance = property.copy()
-                property_with_finance["financing_details"] = {
-                    "property_price": property["price"],
-                    "loan_amount": search_request.loan_amount,
-                    "down_payment_needed": round(down_payment_needed),
-                    "down_payment_percentage": round(down_payment_percentage, 1),
-                    "monthly_emi": search_request.emi,
-                    "loan_tenure": search_request.loan_tenure,
-                    "affordability_score": affordability_score,
-                    "is_affordable": down_payment_needed <= search_request.savings
-                }
-                
-                filtered_properties.append(property_with_finance)
-        
-        # Sort by affordability score (best matches first)
-        filtered_properties.sort(key=lambda x: x["financing_details"]["affordability_score"], reverse=True)
-        
-        # Calculate summary statistics
-        total_properties = len(filtered_properties)
-        affordable_count = len([p for p in filtered_properties if p["financing_details"]["is_affordable"]])
-        
-        if total_properties == 0:
-            return {
-                "success": True,
-                "message": "No properties found within your budget range",
-                "search_criteria": {
-                    "total_budget": search_request.total_budget,
-                    "loan_amount": search_request.loan_amount,
-                    "savings": search_request.savings,
-                    "monthly_emi": search_request.emi
-                },
-                "properties": [],
-                "summary": {
-                    "total_found": 0,
-                    "affordable_count": 0,
-                    "budget_range": f"₹{budget_range_min:,.0f} - ₹{budget_range_max:,.0f}"
-                },
-                "suggestions": [
-                    "Consider increasing your budget",
-                    "Look for properties in different locations",
-                    "Consider a higher loan amount if eligible",
-                    "Explore properties with lower prices"
-                ]
-            }
-        
-        return {
-            "success": True,
-            "message": f"Found {total_properties} properties matching your criteria",
-            "search_criteria": {
-                "total_budget": search_request.total_budget,
-                "loan_amount": search_request.loan_amount,
-                "savings": search_request.savings,
-                "monthly_emi": search_request.emi,
-                "loan_tenure": search_request.loan_tenure
-            },
-            "properties": filtered_properties,
-            "summary": {
-                "total_found": total_properties,
-                "affordable_count": affordable_count,
-                "budget_range": f"₹{budget_range_min:,.0f} - ₹{budget_range_max:,.0f}",
-                "average_price": round(sum(p["price"] for p in filtered_properties) / total_properties),
-                "price_range": {
-                    "min": min(p["price"] for p in filtered_properties),
-                    "max": max(p["price"] for p in filtered_properties)
-                }
-            },
-            "financing_summary": {
-                "average_down_payment": round(sum(p["financing_details"]["down_payment_needed"] for p in filtered_properties) / total_properties),
-                "properties_within_savings": affordable_count,
-                "recommended_property": filtered_properties[0]["title"] if filtered_properties else None
-            }
-        }
-        
+        return find_affordable_properties(search_request, skip, limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error finding properties: {str(e)}")
 
@@ -531,85 +439,10 @@ async def get_property_articles():
         "total_articles": len(articles)
     }
 
-# Loan Eligibility Request Schema
-class LoanEligibilityRequest(BaseModel):
-    age: int
-    occupation: str  # "Salaried" or "Self Employed"
-    income: float
-    existingEmi: float
-    interestRate: float
-    tenure: int
-    borrowers: Optional[str] = "One"  # "One" or "Two"
-
 @router.post("/loan-eligibility")
 async def check_loan_eligibility(request: LoanEligibilityRequest):
     """Check loan eligibility based on income, age, and other factors"""
     try:
-        # Map occupation to employment type
-        employment_type = "salaried" if request.occupation.lower() == "salaried" else "self_employed"
-        
-        # Calculate available income for EMI (50% rule)
-        available_income = request.income * 0.5 - request.existingEmi
-        
-        # Base eligibility multiplier
-        if employment_type == "salaried":
-            multiplier = 60  # 60x monthly income
-        else:
-            multiplier = 55  # 55x monthly income
-        
-        # Age factor (optimal age is 30-45)
-        if 30 <= request.age <= 45:
-            age_factor = 1.0
-        elif 25 <= request.age < 30 or 45 < request.age <= 55:
-            age_factor = 0.95
-        else:
-            age_factor = 0.85
-        
-        # Borrowers factor
-        borrowers_factor = 1.2 if request.borrowers == "Two" else 1.0
-        
-        # Calculate max loan amount
-        max_loan_amount = available_income * multiplier * age_factor * borrowers_factor
-        
-        # Calculate max EMI
-        max_emi = available_income
-        
-        # Calculate property value (assuming 80% LTV)
-        max_property_value = max_loan_amount / 0.8
-        
-        # Eligibility check
-        eligible = available_income > 0 and max_loan_amount > 500000
-        
-        # Calculate sample EMI for the max loan amount
-        monthly_rate = (request.interestRate / 100) / 12
-        tenure_months = request.tenure * 12
-        
-        if monthly_rate == 0:
-            sample_emi = max_loan_amount / tenure_months
-        else:
-            sample_emi = max_loan_amount * (monthly_rate * (1 + monthly_rate) ** tenure_months) / ((1 + monthly_rate) ** tenure_months - 1)
-        
-        return {
-            "eligible": eligible,
-            "maxLoanAmount": round(max_loan_amount, 2),
-            "maxEmi": round(max_emi, 2),
-            "maxPropertyValue": round(max_property_value, 2),
-            "availableIncome": round(available_income, 2),
-            "sampleEmi": round(sample_emi, 2),
-            "factors": {
-                "employmentFactor": multiplier,
-                "ageFactor": age_factor,
-                "borrowersFactor": borrowers_factor,
-                "tenure": request.tenure,
-                "interestRate": request.interestRate
-            },
-            "message": "Eligible for loan" if eligible else "Not eligible - insufficient income",
-            "recommendations": [
-                "Reduce existing EMI to increase eligibility" if request.existingEmi > 0 else "No existing EMI - good for eligibility",
-                "Consider co-borrower to increase loan amount" if request.borrowers == "One" else "Co-borrower already included",
-                "Optimal age range for best rates: 30-45 years" if request.age < 30 or request.age > 45 else "Age is in optimal range"
-            ]
-        }
-        
+        return estimate_eligibility(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error checking loan eligibility: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Query
+from typing import Optional
+from app.database.listing_store import listing_store
+from app.database.search_index import search_index
+
+router = APIRouter()
+
+@router.get("", response_model=dict)
+@router.get("/", response_model=dict)
+async def search_listings(
+    q: str = Query(..., min_length=1, description="Search text, e.g. '3 bhk lajpat nagar'"),
+    tiers: Optional[str] = Query(None, description="Comma separated tiers (listings, plain, basic, platinum, premium)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Results per page")
+):
+    """Ranked full-text search across all listing tiers"""
+    try:
+        tier_list = [tier.strip() for tier in tiers.split(",") if tier.strip()] if tiers else None
+        listing_store.load(tier_list)
+        results, total = search_index.search(q, tiers=tier_list, offset=(page - 1) * size, limit=size)
+
+        return {
+            "success": True,
+            "message": "Search results retrieved successfully",
+            "query": q,
+            "data": [
+                {"tier": tier, "score": round(score, 4), "data": listing}
+                for score, tier, listing in results
+            ],
+            "count": len(results),
+            "total": total,
+            "page": page,
+            "size": size
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Error searching listings: {str(e)}",
+            "data": [],
+            "count": 0
+        }
@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 from enum import Enum
+from app.database.catalog import Catalog
 
 router = APIRouter()
 
@@ -75,219 +76,10 @@ class SubscriptionUsage(BaseModel):
     last_updated: datetime
 
 # Sample subscription plans data
-SUBSCRIPTION_PLANS = [
-    SubscriptionPlan(
-        id=1,
-        name="Basic Starter",
-        type=SubscriptionType.basic,
-        price=999.0,
-        billing_cycle=BillingCycle.monthly,
-        features=[
-            "Up to 5 property listings",
-            "Basic lead management",
-            "50 email campaigns per month",
-            "Standard support",
-            "Basic analytics",
-            "Mobile app access"
-        ],
-        property_limit=5,
-        lead_limit=25,
-        email_limit=50,
-        support_level="Standard",
-        analytics_access=True,
-        api_access=False,
-        custom_branding=False,
-        priority_listing=False,
-        description="Perfect for individual agents starting their real estate journey",
-        is_popular=False
-    ),
-    SubscriptionPlan(
-        id=2,
-        name="Professional",
-        type=SubscriptionType.standard,
-        price=2499.0,
-        billing_cycle=BillingCycle.monthly,
-        features=[
-            "Up to 25 property listings",
-            "Advanced lead management",
-            "200 email campaigns per month",
-            "Priority support",
-            "Advanced analytics & reports",
-            "API access",
-            "Custom email templates",
-            "Lead scoring system"
-        ],
-        property_limit=25,
-        lead_limit=100,
-        email_limit=200,
-        support_level="Priority",
-        analytics_access=True,
-        api_access=True,
-        custom_branding=False,
-        priority_listing=True,
-        description="Ideal for growing real estate professionals and small teams",
-        is_popular=True
-    ),
-    SubscriptionPlan(
-        id=3,
-        name="Business Premium",
-        type=SubscriptionType.premium,
-        price=4999.0,
-        billing_cycle=BillingCycle.monthly,
-        features=[
-            "Up to 100 property listings",
-            "Complete CRM suite",
-            "500 email campaigns per month",
-            "24/7 premium support",
-            "Advanced analytics & AI insights",
-            "Full API access",
-            "Custom branding",
-            "Priority listing placement",
-            "Multi-user team access",
-            "Advanced lead automation"
-        ],
-        property_limit=100,
-        lead_limit=500,
-        email_limit=500,
-        support_level="Premium 24/7",
-        analytics_access=True,
-        api_access=True,
-        custom_branding=True,
-        priority_listing=True,
-        description="Comprehensive solution for established real estate businesses",
-        is_popular=False
-    ),
-    SubscriptionPlan(
-        id=4,
-        name="Enterprise",
-        type=SubscriptionType.enterprise,
-        price=9999.0,
-        billing_cycle=BillingCycle.monthly,
-        features=[
-            "Unlimited property listings",
-            "Enterprise CRM & automation",
-            "Unlimited email campaigns",
-            "Dedicated account manager",
-            "Custom analytics & reporting",
-            "White-label API access",
-            "Complete custom branding",
-            "Featured listing placement",
-            "Unlimited team members",
-            "Custom integrations",
-            "Advanced security features",
-            "Training & onboarding"
-        ],
-        property_limit=999999,
-        lead_limit=999999,
-        email_limit=999999,
-        support_level="Dedicated Manager",
-        analytics_access=True,
-        api_access=True,
-        custom_branding=True,
-        priority_listing=True,
-        description="Ultimate solution for large real estate enterprises and franchises",
-        is_popular=False
-    )
-]
+SUBSCRIPTION_PLANS = Catalog("subscription_plans", lambda plan: SubscriptionPlan(**plan))
 
 # Sample user subscriptions data
-USER_SUBSCRIPTIONS = [
-    UserSubscription(
-        id=1,
-        user_id=1,
-        plan_id=2,
-        plan_name="Professional",
-        status=SubscriptionStatus.active,
-        start_date=datetime(2024, 9, 1),
-        end_date=datetime(2024, 12, 1),
-        auto_renew=True,
-        payment_method="Credit Card",
-        total_amount=2499.0,
-        discount_applied=None,
-        properties_used=18,
-        leads_used=75,
-        emails_used=156,
-        created_at=datetime(2024, 8, 28),
-        last_billing_date=datetime(2024, 9, 1),
-        next_billing_date=datetime(2024, 12, 1)
-    ),
-    UserSubscription(
-        id=2,
-        user_id=2,
-        plan_id=3,
-        plan_name="Business Premium",
-        status=SubscriptionStatus.active,
-        start_date=datetime(2024, 8, 15),
-        end_date=datetime(2025, 2, 15),
-        auto_renew=True,
-        payment_method="Bank Transfer",
-        total_amount=24995.0,
-        discount_applied=2500.0,
-        properties_used=67,
-        leads_used=298,
-        emails_used=387,
-        created_at=datetime(2024, 8, 10),
-        last_billing_date=datetime(2024, 8, 15),
-        next_billing_date=datetime(2025, 2, 15)
-    ),
-    UserSubscription(
-        id=3,
-        user_id=3,
-        plan_id=1,
-        plan_name="Basic Starter",
-        status=SubscriptionStatus.expired,
-        start_date=datetime(2024, 6, 1),
-        end_date=datetime(2024, 9, 1),
-        auto_renew=False,
-        payment_method="Credit Card",
-        total_amount=999.0,
-        discount_applied=None,
-        properties_used=5,
-        leads_used=25,
-        emails_used=42,
-        created_at=datetime(2024, 5, 28),
-        last_billing_date=datetime(2024, 6, 1),
-        next_billing_date=None
-    ),
-    UserSubscription(
-        id=4,
-        user_id=4,
-        plan_id=4,
-        plan_name="Enterprise",
-        status=SubscriptionStatus.active,
-        start_date=datetime(2024, 7, 1),
-        end_date=datetime(2025, 7, 1),
-        auto_renew=True,
-        payment_method="Enterprise Contract",
-        total_amount=99990.0,
-        discount_applied=19998.0,
-        properties_used=435,
-        leads_used=1256,
-        emails_used=2847,
-        created_at=datetime(2024, 6, 15),
-        last_billing_date=datetime(2024, 7, 1),
-        next_billing_date=datetime(2025, 7, 1)
-    ),
-    UserSubscription(
-        id=5,
-        user_id=5,
-        plan_id=2,
-        plan_name="Professional",
-        status=SubscriptionStatus.cancelled,
-        start_date=datetime(2024, 5, 1),
-        end_date=datetime(2024, 8, 1),
-        auto_renew=False,
-        payment_method="Credit Card",
-        total_amount=2499.0,
-        discount_applied=None,
-        properties_used=12,
-        leads_used=45,
-        emails_used=89,
-        created_at=datetime(2024, 4, 25),
-        last_billing_date=datetime(2024, 5, 1),
-        next_billing_date=None
-    )
-]
+USER_SUBSCRIPTIONS = Catalog("user_subscriptions", lambda sub: UserSubscription(**sub))
 
 @router.get("/plans", response_model=List[SubscriptionPlan])
 async def get_subscription_plans(
@@ -51,13 +51,13 @@ def validate_password_strength(password: str) -> bool:
         return False
     return True
 
-# Sample users data
+# Sample users data (password hashes precomputed so importing this module does no hashing)
 USERS = [
     {
         "id": 1,
         "username": "ajay_admin",
         "email": "ajay@99acres.com",
-        "password_hash": hash_password("Ajay@123"),
+        "password_hash": "545e6bef13dfee72dcbf20c2910054577b06d6a90e7ef34241b4f609678972e2",  # Ajay@123
         "full_name": "Ajay Kumar",
         "phone": "+91-9876543210",
         "role": "admin",
@@ -69,7 +69,7 @@ USERS = [
         "id": 2,
         "username": "priya_agent", 
         "email": "priya.sharma@99acres.com",
-        "password_hash": hash_password("Priya@456"),
+        "password_hash": "f060b432989eb45d741857dd316f4253dd08ae018fa0f5501e465bca056d576b",  # Priya@456
         "full_name": "Priya Sharma",
         "phone": "+91-9876543211",
         "role": "agent",
@@ -81,7 +81,7 @@ USERS = [
         "id": 3,
         "username": "rohit_user",
         "email": "rohit.mehta@gmail.com", 
-        "password_hash": hash_password("Rohit@789"),
+        "password_hash": "1d65d2a2405e8538b8c2b0694515ca4e134cc4ba6e679ebeb770ea4185abb732",  # Rohit@789
         "full_name": "Rohit Mehta",
         "phone": "+91-9876543212",
         "role": "client",
@@ -7,7 +7,7 @@ from app.database.schemas.common import SuccessResponse, PaginatedResponse
 from app.database.repositories.user_repository import UserRepository
 from app.database.sqlite_models import User
 from app.utils.dependencies import get_current_active_user, get_admin_user
-from app.utils.auth import verify_password, get_password_hash
+from app.utils.auth import verify_password_async, get_password_hash_async
 
 router = APIRouter()
 
@@ -63,14 +63,14 @@ async def change_password(
 ):
     """Change user password"""
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not await verify_password_async(password_data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
     # Update password
-    new_password_hash = get_password_hash(password_data.new_password)
+    new_password_hash = await get_password_hash_async(password_data.new_password)
     await UserRepository.update_user(
         str(current_user.id),
         {"password_hash": new_password_hash}
@@ -7,10 +7,21 @@ from bson import ObjectId
 from app.config import settings
 from app.database.sqlite_models import User
 from app.database.enums import UserRole
+from app.utils.principal_cache import principal_cache
 
 security = HTTPBearer()
 
 
+async def _load_principal(user_id: str, exp: Optional[int]) -> Optional[User]:
+    """Load the token's user, served from the principal cache when possible"""
+    user = principal_cache.get(user_id, exp, namespace="sql")
+    if user is None:
+        user = await User.get(ObjectId(user_id))
+        if user is not None:
+            principal_cache.set(user_id, exp, user, namespace="sql")
+    return user
+
+
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[User]:
@@ -28,8 +39,7 @@ async def get_current_user_optional(
         if user_id is None:
             return None
             
-        user = await User.get(ObjectId(user_id))
-        return user
+        return await _load_principal(user_id, payload.get("exp"))
     except (JWTError, Exception):
         return None
 
@@ -57,7 +67,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = await User.get(ObjectId(user_id))
+    user = await _load_principal(user_id, payload.get("exp"))
     if user is None:
         raise credentials_exception
     
@@ -0,0 +1,133 @@
+"""Loan math shared by the loan endpoints.
+
+Every function takes scalars or NumPy arrays and broadcasts them, so one
+call prices a single loan or a whole bank x rate x tenure grid without a
+Python loop. Rates are annual percentages, tenures are in months.
+"""
+from typing import Optional
+import numpy as np
+
+FOIR = 0.5  # share of monthly income that may go to EMIs
+MAX_LTV = 0.8  # loan-to-value cap
+MIN_ELIGIBLE_LOAN = 500000
+
+# Loan amount as a multiple of the monthly income available for EMIs
+EMPLOYMENT_MULTIPLIERS = {"salaried": 60, "self_employed": 55}
+DEFAULT_MULTIPLIER = 50
+
+
+def emi(principal, annual_rate, tenure_months) -> np.ndarray:
+    """Equated monthly instalment: P * r * (1 + r)^n / ((1 + r)^n - 1)"""
+    principal = np.asarray(principal, dtype=float)
+    monthly_rate = np.asarray(annual_rate, dtype=float) / 1200
+    months = np.asarray(tenure_months, dtype=float)
+
+    # (1 + r)^n - 1 without losing precision for small rates
+    growth = np.expm1(months * np.log1p(monthly_rate))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amortized = principal * monthly_rate * (growth + 1) / growth
+    return np.where(monthly_rate == 0, principal / months, amortized)
+
+
+def total_payable(principal, annual_rate, tenure_months) -> np.ndarray:
+    return emi(principal, annual_rate, tenure_months) * np.asarray(tenure_months, dtype=float)
+
+
+def total_interest(principal, annual_rate, tenure_months) -> np.ndarray:
+    return total_payable(principal, annual_rate, tenure_months) - np.asarray(principal, dtype=float)
+
+
+def emi_grid(principal: float, bank_rates, rate_shifts, tenure_years) -> np.ndarray:
+    """EMIs for every bank rate + shift and tenure, shaped (banks, shifts, tenures)"""
+    rates = np.add.outer(np.asarray(bank_rates, dtype=float), np.asarray(rate_shifts, dtype=float))
+    months = np.asarray(tenure_years, dtype=float) * 12
+    return emi(principal, rates[:, :, np.newaxis], months[np.newaxis, np.newaxis, :])
+
+
+SCHEDULE_COLUMNS = (
+    "month", "opening_balance", "payment", "interest", "principal",
+    "prepayment", "closing_balance", "cumulative_interest",
+)
+
+
+def amortization_schedule(principal: float, annual_rate: float, tenure_months: int, prepayments=None) -> dict:
+    """Month-by-month split of each instalment into interest and principal.
+
+    ``prepayments`` is an optional array of extra principal paid in each
+    month on top of the EMI; the EMI stays the same and the loan closes
+    early. Uses the closed form of the balance recurrence,
+    ``B_k = (1 + r)^k * (P - sum_{j<=k} (EMI + extra_j) / (1 + r)^j)``,
+    so the whole schedule is a handful of array operations and a cumsum.
+    Returns one array per name in ``SCHEDULE_COLUMNS``.
+    """
+    monthly_rate = annual_rate / 1200
+    payment = float(emi(principal, annual_rate, tenure_months))
+    months = np.arange(1, tenure_months + 1)
+    extra = np.zeros(tenure_months)
+    if prepayments is not None:
+        extra += np.asarray(prepayments, dtype=float)[:tenure_months]
+
+    growth = np.power(1 + monthly_rate, months)
+    closing = growth * (principal - np.cumsum((payment + extra) / growth))
+
+    # The loan closes in the first month whose balance drops to (about) zero
+    paid_off = np.flatnonzero(closing <= 0.005)
+    last = paid_off[0] + 1 if paid_off.size else tenure_months
+    months, extra, closing = months[:last], extra[:last], closing[:last]
+    closing[-1] = 0.0
+
+    opening = np.concatenate(([principal], closing[:-1]))
+    interest = opening * monthly_rate
+    paid = np.full(last, payment)
+    # Final month: only what is still owed
+    due = opening[-1] + interest[-1]
+    paid[-1] = min(payment, due)
+    extra[-1] = due - paid[-1]
+
+    return {
+        "month": months,
+        "opening_balance": opening,
+        "payment": paid,
+        "interest": interest,
+        "principal": paid + extra - interest,
+        "prepayment": extra,
+        "closing_balance": closing,
+        "cumulative_interest": np.cumsum(interest),
+    }
+
+
+def employment_multiplier(employment_type: str, credit_score: Optional[int] = None) -> int:
+    """Income multiple for an employment type, adjusted by credit score"""
+    employment_type = getattr(employment_type, "value", employment_type)
+    multiplier = EMPLOYMENT_MULTIPLIERS.get(employment_type, DEFAULT_MULTIPLIER)
+    if credit_score:
+        if credit_score >= 750:
+            multiplier += 10
+        elif credit_score >= 700:
+            multiplier += 5
+        elif credit_score < 650:
+            multiplier -= 10
+    return multiplier
+
+
+def age_factor(age) -> np.ndarray:
+    """1.0 for ages 30-45, 0.95 for 25-29 and 46-55, 0.85 otherwise"""
+    age = np.asarray(age)
+    return np.select(
+        [(age >= 30) & (age <= 45), ((age >= 25) & (age < 30)) | ((age > 45) & (age <= 55))],
+        [1.0, 0.95],
+        0.85
+    )
+
+
+def available_income(income, existing_emi) -> np.ndarray:
+    """Monthly income left for a new EMI under the FOIR rule"""
+    return np.asarray(income, dtype=float) * FOIR - np.asarray(existing_emi, dtype=float)
+
+
+def max_loan_amount(income, existing_emi, multiplier, factor=1.0) -> np.ndarray:
+    return available_income(income, existing_emi) * multiplier * factor
+
+
+def is_eligible(income, existing_emi, max_loan) -> np.ndarray:
+    return (available_income(income, existing_emi) > 0) & (np.asarray(max_loan) > MIN_ELIGIBLE_LOAN)
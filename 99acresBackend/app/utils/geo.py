@@ -0,0 +1,40 @@
+import math
+from typing import List, Optional
+
+# Longitude spacing of the vertices laid along a viewport's north and south edges
+EDGE_STEP_DEGREES = 0.5
+
+
+def geo_point(latitude: Optional[float], longitude: Optional[float]) -> Optional[dict]:
+    """GeoJSON Point for a coordinate pair, or None if either is missing or out of range"""
+    if latitude is None or longitude is None:
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+    # GeoJSON orders coordinates longitude first
+    return {"type": "Point", "coordinates": [float(longitude), float(latitude)]}
+
+
+def add_location_field(data: dict) -> dict:
+    """Set the GeoJSON ``location`` field from ``latitude``/``longitude`` when both are present"""
+    point = geo_point(data.get("latitude"), data.get("longitude"))
+    if point is not None:
+        data["location"] = point
+    return data
+
+
+def _parallel(latitude: float, from_lng: float, to_lng: float) -> List[list]:
+    """Vertices along a line of latitude, at most EDGE_STEP_DEGREES apart"""
+    steps = max(1, math.ceil(abs(to_lng - from_lng) / EDGE_STEP_DEGREES))
+    return [[from_lng + (to_lng - from_lng) * i / steps, latitude] for i in range(steps + 1)]
+
+
+def bounds_polygon(south: float, west: float, north: float, east: float) -> dict:
+    """GeoJSON Polygon for a map viewport, closed ring in counter-clockwise order.
+
+    Polygon edges are great-circle arcs, which bow away from the north and
+    south lines of latitude; those two edges are densified so the ring
+    follows the parallels closely even for zoomed-out viewports.
+    """
+    ring = _parallel(south, west, east) + _parallel(north, east, west) + [[west, south]]
+    return {"type": "Polygon", "coordinates": [ring]}
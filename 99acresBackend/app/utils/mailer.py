@@ -0,0 +1,154 @@
+import asyncio
+import smtplib
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import List, Optional
+from app.config import settings
+
+
+def build_message(to_email: str, subject: str, body: str, from_email: Optional[str] = None) -> MIMEMultipart:
+    """Build an HTML email message"""
+    msg = MIMEMultipart()
+    msg['From'] = from_email or settings.FROM_EMAIL
+    msg['To'] = to_email
+    msg['Subject'] = subject
+    msg.attach(MIMEText(body, 'html'))
+    return msg
+
+
+class RateLimiter:
+    """Token bucket capping sends at ``rate`` messages per second (0 = unlimited)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self, count: int = 1) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A request larger than the bucket waits for a full bucket, then overdraws
+            needed = min(count, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= count
+                return
+            await asyncio.sleep((needed - self._tokens) / self.rate)
+
+
+class SMTPConnectionPool:
+    """Small pool of long-lived, authenticated SMTP connections.
+
+    smtplib is blocking, so every network call runs in a worker thread via
+    ``asyncio.to_thread``; the event loop never waits on a TLS handshake or
+    a send. Connections are reused across messages and re-opened when the
+    server has dropped them.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        size: int = 3,
+        timeout: float = 30
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self._idle: Optional[asyncio.Queue] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            server.starttls()
+        if self.username:
+            server.login(self.username, self.password)
+        return server
+
+    @staticmethod
+    def _is_alive(server: Optional[smtplib.SMTP]) -> bool:
+        if server is None:
+            return False
+        try:
+            return server.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    def _send(self, server: Optional[smtplib.SMTP], msg: MIMEMultipart) -> smtplib.SMTP:
+        if not self._is_alive(server):
+            self._close(server)
+            server = self._connect()
+        server.sendmail(msg['From'], [msg['To']], msg.as_string())
+        return server
+
+    @staticmethod
+    def _close(server: Optional[smtplib.SMTP]) -> None:
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _slots(self) -> asyncio.Queue:
+        if self._idle is None:
+            # Slots start empty (None) and connect lazily on first use
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(None)
+        return self._idle
+
+    async def send(self, msg: MIMEMultipart) -> None:
+        """Send one message on a pooled connection; raises on failure"""
+        slots = self._slots()
+        server = await slots.get()
+        try:
+            server = await asyncio.to_thread(self._send, server, msg)
+        except Exception:
+            await asyncio.to_thread(self._close, server)
+            server = None
+            raise
+        finally:
+            slots.put_nowait(server)
+
+    async def send_many(self, messages: List[MIMEMultipart]) -> List[Optional[Exception]]:
+        """Send messages concurrently over the pool; returns None or the error for each"""
+        async def attempt(msg: MIMEMultipart) -> Optional[Exception]:
+            try:
+                await self.send(msg)
+                return None
+            except Exception as e:
+                return e
+        return await asyncio.gather(*(attempt(msg) for msg in messages))
+
+    async def close(self) -> None:
+        """Close every idle connection"""
+        if self._idle is None:
+            return
+        while not self._idle.empty():
+            await asyncio.to_thread(self._close, self._idle.get_nowait())
+        self._idle = None
+
+
+smtp_pool = SMTPConnectionPool(
+    settings.SMTP_HOST,
+    settings.SMTP_PORT,
+    settings.SMTP_USERNAME,
+    settings.SMTP_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    size=settings.SMTP_POOL_SIZE
+)
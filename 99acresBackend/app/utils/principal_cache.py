@@ -0,0 +1,71 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+from app.config import settings
+
+CacheKey = Tuple[str, str, Optional[int]]  # (namespace, sub, token exp)
+
+
+class PrincipalCache:
+    """TTL + LRU cache of authenticated users keyed by JWT ``sub`` and expiry.
+
+    An entry never outlives the token it was loaded for, or
+    ``ttl_seconds``, whichever comes first. Anything that changes what a
+    cached user may do (profile update, block/unblock, password change,
+    delete) must call ``invalidate(sub)``; the repositories do this in
+    ``update_user`` and ``delete_user``.
+
+    The cache is per process, so with several workers a change made in one
+    worker is seen by the others within ``ttl_seconds``.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._keys_by_sub: Dict[str, Set[CacheKey]] = {}
+
+    def get(self, sub: str, exp: Optional[int], namespace: str = "mongo") -> Optional[Any]:
+        key = (namespace, str(sub), exp)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if time.time() >= expires_at:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def set(self, sub: str, exp: Optional[int], user: Any, namespace: str = "mongo") -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (namespace, str(sub), exp)
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        self._entries[key] = (expires_at, user)
+        self._entries.move_to_end(key)
+        self._keys_by_sub.setdefault(key[1], set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, sub: Hashable) -> None:
+        """Forget every cached principal of a user (all tokens, all namespaces)"""
+        for key in self._keys_by_sub.pop(str(sub), set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_sub.clear()
+
+    def _drop(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_sub.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_sub[key[1]]
+
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
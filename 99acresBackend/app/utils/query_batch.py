@@ -0,0 +1,74 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, Optional
+from app.config import settings
+
+
+class QueryBatch:
+    """Run independent database calls concurrently and time each one.
+
+    Usage:
+        batch = QueryBatch("admin_dashboard")
+        batch.add("users", UserRepository.get_user_stats())
+        batch.add("properties", PropertyRepository.get_property_stats())
+        results = await batch.run()
+
+    The calls share a semaphore so a single request can't take more than
+    ``max_concurrency`` connections from the pool; with enough headroom the
+    batch finishes in about the time of its slowest query.
+    """
+
+    def __init__(self, name: str, max_concurrency: Optional[int] = None):
+        self.name = name
+        self.max_concurrency = max_concurrency or settings.QUERY_BATCH_CONCURRENCY
+        self.timings: Dict[str, float] = {}  # key -> milliseconds
+        self.elapsed_ms = 0.0
+        self._queries: Dict[str, Awaitable] = {}
+
+    def add(self, key: str, query: Awaitable) -> "QueryBatch":
+        if key in self._queries:
+            raise ValueError(f"Duplicate query key '{key}' in batch '{self.name}'")
+        self._queries[key] = query
+        return self
+
+    async def _timed(self, semaphore: asyncio.Semaphore, key: str, query: Awaitable) -> Any:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                return await query
+            finally:
+                self.timings[key] = (time.perf_counter() - started) * 1000
+
+    async def run(self) -> Dict[str, Any]:
+        """Await every query and return their results by key.
+
+        The first failure is re-raised after the remaining queries finish so
+        no coroutine is left running against the pool.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        keys = list(self._queries)
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self._timed(semaphore, key, self._queries[key]) for key in keys),
+            return_exceptions=True
+        )
+        self.elapsed_ms = (time.perf_counter() - started) * 1000
+        self._queries = {}
+
+        if self.elapsed_ms >= settings.SLOW_QUERY_BATCH_MS:
+            slowest = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+            detail = ", ".join(f"{key}={ms:.1f}ms" for key, ms in slowest)
+            print(f"⚠️ Slow query batch '{self.name}': {self.elapsed_ms:.1f}ms ({detail})")
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return dict(zip(keys, results))
+
+
+async def gather_queries(name: str, max_concurrency: Optional[int] = None, **queries: Awaitable) -> Dict[str, Any]:
+    """Shortcut for a one-off ``QueryBatch`` built from keyword arguments"""
+    batch = QueryBatch(name, max_concurrency)
+    for key, query in queries.items():
+        batch.add(key, query)
+    return await batch.run()
@@ -0,0 +1,106 @@
+import re
+from typing import Iterable, Optional
+
+# Lowercase shadow fields written on every property insert/update so city/state
+# filters are exact matches on an index instead of case-insensitive regexes
+PROPERTY_NORMALIZED_FIELDS = ("city", "state")
+
+# Property fields tokenized into ``search_text`` for the ``$text`` index; the
+# title is listed twice so title matches weigh more than description matches
+PROPERTY_SEARCH_FIELDS = ("title", "title", "address", "city", "state", "description")
+
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """Normalize a string for index-backed matching (trimmed, collapsed whitespace, lowercase)"""
+    if value is None:
+        return None
+    return " ".join(str(value).split()).lower()
+
+
+def prefix_match(value: str) -> dict:
+    """Build an anchored, case-sensitive prefix regex on a normalized field.
+
+    A ``^prefix`` regex without the ``i`` option is answered with an index
+    range scan, unlike the unanchored case-insensitive regex it replaces.
+    """
+    return {"$regex": f"^{re.escape(normalize_text(value))}"}
+
+
+def add_normalized_fields(data: dict, fields: Iterable[str]) -> dict:
+    """Set ``<field>_norm`` shadow fields for every field present in data"""
+    for field in fields:
+        if data.get(field) is not None:
+            data[f"{field}_norm"] = normalize_text(data[field])
+    return data
+
+
+# Spelling variants of city/locality names mapped to one canonical token
+TOKEN_ALIASES = {
+    "gurugram": "gurgaon",
+    "bengaluru": "bangalore",
+    "bombay": "mumbai",
+    "calcutta": "kolkata",
+    "madras": "chennai",
+    "poona": "pune",
+    "sec": "sector",
+    "ext": "extension",
+    "extn": "extension",
+    "rd": "road",
+    "apt": "apartment",
+    "appartment": "apartment",
+    "flat": "apartment",
+}
+
+# Locality suffixes that are written both joined and split
+# ("Lajpat Nagar" / "Lajpatnagar", "Indira Puram" / "Indirapuram")
+LOCALITY_SUFFIXES = {
+    "nagar", "vihar", "puram", "pur", "bagh", "ganj", "abad", "garh",
+    "enclave", "colony", "kunj", "khand", "wadi", "halli", "palya", "pet",
+}
+
+STOPWORDS = {"a", "an", "and", "at", "for", "in", "near", "of", "on", "the", "to", "with"}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> list:
+    """Split text into search tokens that tolerate common Indian locality spellings.
+
+    Besides the plain lowercase words this emits joined forms for
+    "<name> <locality suffix>" ("lajpat nagar" -> "lajpatnagar"),
+    "sector <n>" -> "sector62" and "<n> bhk" -> "3bhk", so both spellings of
+    an address produce a shared token.
+    """
+    if not text:
+        return []
+
+    words = [TOKEN_ALIASES.get(word, word) for word in _TOKEN_RE.findall(str(text).lower().replace("'", ""))]
+    tokens = []
+    for i, word in enumerate(words):
+        if word not in STOPWORDS:
+            tokens.append(word)
+        if i == 0:
+            continue
+        previous = words[i - 1]
+        if word in LOCALITY_SUFFIXES and previous not in STOPWORDS:
+            tokens.append(previous + word)
+        elif previous == "sector" and word.isdigit():
+            tokens.append(previous + word)
+        elif word == "bhk" and previous.isdigit():
+            tokens.append(previous + word)
+    return tokens
+
+
+def build_search_text(data: dict, fields: Iterable[str]) -> str:
+    """Join the tokens of the given fields into one string for a ``$text`` index.
+
+    Storing pre-tokenized text means the locality joins done by ``tokenize``
+    ("lajpatnagar", "sector62") are matched by MongoDB as plain words.
+    """
+    tokens = []
+    for field in fields:
+        value = data.get(field)
+        if isinstance(value, (list, tuple)):
+            value = " ".join(str(v) for v in value)
+        tokens.extend(tokenize(value))
+    return " ".join(tokens)
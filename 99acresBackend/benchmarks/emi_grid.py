@@ -0,0 +1,69 @@
+"""Scalar EMI loop vs the vectorized ``app.utils.finance`` grid.
+
+Prices the same bank x rate shift x tenure grid twice: with the per-bank
+Python loop and ``**`` formula the loan endpoints used to run, and with
+one ``finance.emi_grid`` call. Checks that both agree to the paisa and
+reports the time per grid.
+
+Usage (from 99acresBackend/):
+    python -m benchmarks.emi_grid
+    python -m benchmarks.emi_grid --shifts 41 --tenures 30 --repeat 50
+"""
+import argparse
+import timeit
+import numpy as np
+from app.utils import finance
+
+BANK_RATES = [8.50, 8.65, 8.40, 8.75, 8.55, 8.30]
+AMOUNT = 5_000_000
+
+
+def scalar_grid(amount: float, bank_rates, rate_shifts, tenures) -> list:
+    """The original per-cell formula in nested Python loops"""
+    grid = []
+    for bank_rate in bank_rates:
+        rows = []
+        for shift in rate_shifts:
+            monthly_rate = (bank_rate + shift) / (12 * 100)
+            row = []
+            for tenure in tenures:
+                tenure_months = tenure * 12
+                if monthly_rate > 0:
+                    emi = (amount * monthly_rate * (1 + monthly_rate)**tenure_months) / ((1 + monthly_rate)**tenure_months - 1)
+                else:
+                    emi = amount / tenure_months
+                row.append(emi)
+            rows.append(row)
+        grid.append(rows)
+    return grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shifts", type=int, default=5, help="rate shifts, spread over -1..+1 points")
+    parser.add_argument("--tenures", type=int, default=6, help="tenures, spread over 5..30 years")
+    parser.add_argument("--repeat", type=int, default=200, help="grids priced per measurement")
+    args = parser.parse_args()
+
+    rate_shifts = np.linspace(-1, 1, args.shifts).tolist()
+    tenures = np.linspace(5, 30, args.tenures).round().astype(int).tolist()
+    cells = len(BANK_RATES) * len(rate_shifts) * len(tenures)
+
+    expected = np.array(scalar_grid(AMOUNT, BANK_RATES, rate_shifts, tenures))
+    actual = finance.emi_grid(AMOUNT, BANK_RATES, rate_shifts, tenures)
+    max_diff = float(np.abs(expected - actual).max())
+    assert max_diff < 0.005, f"vectorized EMIs differ by {max_diff}"
+
+    print(f"{len(BANK_RATES)} banks x {len(rate_shifts)} shifts x {len(tenures)} tenures = {cells} EMIs per grid")
+    print(f"{'mode':<12} {'us/grid':>10} {'ns/EMI':>8}")
+    for name, run in (
+        ("scalar", lambda: scalar_grid(AMOUNT, BANK_RATES, rate_shifts, tenures)),
+        ("vectorized", lambda: finance.emi_grid(AMOUNT, BANK_RATES, rate_shifts, tenures)),
+    ):
+        seconds = min(timeit.repeat(run, number=args.repeat, repeat=5)) / args.repeat
+        print(f"{name:<12} {seconds * 1e6:>10.1f} {seconds * 1e9 / cells:>8.1f}")
+    print(f"max difference: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
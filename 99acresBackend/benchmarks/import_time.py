@@ -0,0 +1,88 @@
+"""Cold import cost of the app, measured with ``python -X importtime``.
+
+Imports the target module (``main`` by default) in a fresh interpreter
+several times and reports the median wall time, the peak resident memory
+of the process and the modules with the largest self time, taken from the
+``-X importtime`` log. Run it before and after a change to compare worker
+boot cost.
+
+Usage (from 99acresBackend/):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 10 --top 25 --module app.routes.loans
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+PROBE = """
+import resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(f"{{elapsed * 1000:.1f}} {{rss_kb}}", file=sys.stdout)
+"""
+
+
+def run_once(module: str) -> tuple:
+    """Import ``module`` in a fresh interpreter; returns (ms, rss_kb, {module: self_us})"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    self_times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_times[match.group(4)] = int(match.group(1))
+
+    elapsed_ms, rss_kb = result.stdout.split()[-2:]
+    return float(elapsed_ms), int(rss_kb), self_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main", help="module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to average over")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list")
+    args = parser.parse_args()
+
+    timings, peaks = [], []
+    self_times = defaultdict(list)
+    for _ in range(args.runs):
+        elapsed_ms, rss_kb, modules = run_once(args.module)
+        timings.append(elapsed_ms)
+        peaks.append(rss_kb)
+        for name, micros in modules.items():
+            self_times[name].append(micros)
+
+    print(f"import {args.module}: median {statistics.median(timings):.1f} ms "
+          f"(min {min(timings):.1f}, max {max(timings):.1f}) over {args.runs} runs")
+    print(f"peak RSS: {statistics.median(peaks) / 1024:.1f} MB")
+
+    slowest = sorted(
+        ((statistics.median(values), name) for name, values in self_times.items()),
+        reverse=True
+    )[:args.top]
+    print(f"\n{'self ms':>8}  module")
+    for micros, name in slowest:
+        print(f"{micros / 1000:>8.2f}  {name}")
+
+    app_total = sum(statistics.median(v) for n, v in self_times.items() if n == "main" or n.startswith("app."))
+    print(f"\napp modules self time: {app_total / 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Event-loop latency of unrelated requests during a login storm.
+
+Runs a burst of concurrent password checks on one event loop, once with
+the blocking ``verify_password`` and once with ``verify_password_async``,
+while a probe coroutine plays the role of an unrelated cheap endpoint and
+records how long each of its "requests" takes. With blocking bcrypt the
+probe's p99 grows to the length of the whole storm; with the thread pool
+it stays close to the idle baseline.
+
+Usage (from 99acresBackend/):
+    python -m benchmarks.login_storm
+    python -m benchmarks.login_storm --logins 200 --rounds 12
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import bcrypt
+from app.utils.auth import verify_password, verify_password_async
+
+PROBE_INTERVAL = 0.005  # one unrelated request every 5 ms
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def probe(stop: asyncio.Event, latencies: list) -> None:
+    """A cheap endpoint: its latency is how late the event loop gets to it"""
+    while not stop.is_set():
+        due = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(max(0.0, time.perf_counter() - due) * 1000)
+
+
+async def blocking_login(password: str, hashed: str) -> bool:
+    return verify_password(password, hashed)
+
+
+async def pooled_login(password: str, hashed: str) -> bool:
+    return await verify_password_async(password, hashed)
+
+
+async def run_storm(login, logins: int, password: str, hashed: str) -> dict:
+    latencies = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(stop, latencies))
+    await asyncio.sleep(0.05)  # idle baseline samples
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login(password, hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await prober
+    return {
+        "logins_per_s": logins / elapsed,
+        "probe_p50_ms": statistics.median(latencies),
+        "probe_p99_ms": percentile(latencies, 99),
+        "probe_max_ms": max(latencies),
+        "probe_samples": len(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=100, help="concurrent login attempts")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost of the test hash")
+    args = parser.parse_args()
+
+    password = "Storm@123"
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=args.rounds)).decode("utf-8")
+
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}")
+    print(f"{'mode':<10} {'logins/s':>9} {'p50 ms':>8} {'p99 ms':>9} {'max ms':>9}")
+    for name, login in (("blocking", blocking_login), ("pooled", pooled_login)):
+        result = asyncio.run(run_storm(login, args.logins, password, hashed))
+        print(
+            f"{name:<10} {result['logins_per_s']:>9.1f} {result['probe_p50_ms']:>8.2f} "
+            f"{result['probe_p99_ms']:>9.2f} {result['probe_max_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
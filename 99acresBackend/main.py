@@ -1,7 +1,15 @@
 """Entrypoint for FastAPI app. Exports the FastAPI `app` instance for Uvicorn.
 """
 from app.config import settings
-from app.database.mongodb import connect_to_mongo, close_mongo_connection, create_sample_data
+from app.database.mongodb import mongodb, connect_to_mongo, close_mongo_connection, available_compressors, create_sample_data
+from app.database.counters import run_periodic_rebuild
+from app.database.campaign_rollups import run_periodic_reconcile
+from app.database.counter_buffer import counter_buffer
+from app.database.email_outbox import outbox_worker
+from app.database.campaign_dispatch import campaign_dispatcher
+from app.database.pool_monitor import db_monitor
+from app.database.repositories.loan_repository import LoanRepository
+from app.utils.auth import shutdown_password_hasher
 from app.routes.auth_mongo import router as auth_router  # MongoDB auth
 from app.routes.campaigns import router as campaigns_router  # Campaign management with MongoDB
 from app.routes.properties_simple import router as properties_router  # Simple properties with sample data
@@ -10,6 +18,7 @@ from app.routes.plain_listings import router as plain_listings_router  # Plain s
 from app.routes.basic_listings import router as basic_listings_router  # Basic listings with enhanced features
 from app.routes.platinum_listings import router as platinum_listings_router  # Platinum listings with premium features
 from app.routes.premium_listings import router as premium_listings_router  # Premium listings with ultra-luxury features
+from app.routes.search import router as search_router  # Ranked full-text search across listing tiers
 from app.routes.leads import router as leads_router  # Lead management and CRM
 from app.routes.lead_packages import router as lead_packages_router  # Lead packages and pricing plans
 from app.routes.lead_success_stories import router as lead_success_stories_router  # Success stories and testimonials
@@ -22,18 +31,40 @@ from app.routes.root_endpoints import router as root_router  # Root level endpoi
 # from app.routes.users import router as users_router  # User management and authentication
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
-    await create_sample_data()
     os.makedirs(settings.UPLOAD_DIRECTORY, exist_ok=True)
+    if settings.SEED_SAMPLE_DATA:
+        await create_sample_data()
+        await LoanRepository.seed_sample_applications()
+    counters_task = None
+    if settings.DASHBOARD_COUNTERS_REFRESH_SECONDS > 0:
+        counters_task = asyncio.create_task(run_periodic_rebuild(settings.DASHBOARD_COUNTERS_REFRESH_SECONDS))
+    rollups_task = None
+    if settings.CAMPAIGN_ROLLUPS_RECONCILE_SECONDS > 0:
+        rollups_task = asyncio.create_task(run_periodic_reconcile(settings.CAMPAIGN_ROLLUPS_RECONCILE_SECONDS))
+    flush_task = asyncio.create_task(counter_buffer.run(settings.COUNTER_FLUSH_SECONDS))
+    email_task = dispatch_task = None
+    if settings.EMAIL_WORKER_ENABLED:
+        email_task = asyncio.create_task(outbox_worker.run(settings.EMAIL_POLL_SECONDS))
+        dispatch_task = asyncio.create_task(campaign_dispatcher.run(settings.EMAIL_POLL_SECONDS))
     yield
-    # Shutdown
+    # Shutdown: let every background task finish unwinding before the client closes
+    background = [task for task in (counters_task, rollups_task, dispatch_task, email_task, flush_task) if task]
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await counter_buffer.drain()
+    shutdown_password_hasher()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -50,7 +81,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods
     allow_headers=["*"],  # Allow all headers
-    expose_headers=["*"],
+    # "*" is taken literally for credentialed requests, so name the headers the SPA reads
+    expose_headers=["X-Next-Cursor"],
     max_age=3600,
 )
 
@@ -64,6 +96,7 @@ app.include_router(plain_listings_router, prefix="/api/plain-listings", tags=["P
 app.include_router(basic_listings_router, prefix="/api/basic-listings", tags=["Basic Listings"])
 app.include_router(platinum_listings_router, prefix="/api/platinum-listings", tags=["Platinum Listings"])
 app.include_router(premium_listings_router, prefix="/api/premium-listings", tags=["Premium Listings"])
+app.include_router(search_router, prefix="/api/search", tags=["Search"])
 app.include_router(leads_router, prefix="/api/leads", tags=["Lead Management"])
 app.include_router(lead_packages_router, prefix="/api/lead-packages", tags=["Lead Packages"])
 app.include_router(lead_success_stories_router, prefix="/api/lead-success-stories", tags=["Success Stories"])
@@ -86,3 +119,26 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "allowed_origins": settings.ALLOWED_ORIGINS}
+
+@app.get("/health/db")
+async def database_health():
+    """MongoDB round-trip time plus live connection-pool utilization for this worker"""
+    pool_settings = {
+        "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+        "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+        "wait_queue_timeout_ms": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "compressors": available_compressors(),
+    }
+    started = time.perf_counter()
+    try:
+        await mongodb.client.admin.command("ping")
+    except Exception as e:
+        return JSONResponse(status_code=503, content={
+            "status": "unhealthy", "error": str(e), "pool_settings": pool_settings, **db_monitor.snapshot()
+        })
+    return {
+        "status": "healthy",
+        "ping_ms": round((time.perf_counter() - started) * 1000, 3),
+        "pool_settings": pool_settings,
+        **db_monitor.snapshot()
+    }
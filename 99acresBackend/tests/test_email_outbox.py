@@ -0,0 +1,149 @@
+"""Outbox delivery against an in-process stand-in SMTP server.
+
+Run from 99acresBackend/:
+    python -m pytest tests
+"""
+import asyncio
+import socketserver
+import threading
+import pytest
+from app.database import mongodb as mongodb_module
+from app.database.email_outbox import LOG_COLLECTION, OUTBOX_COLLECTION, OutboxWorker, enqueue_email
+from app.utils.mailer import SMTPConnectionPool
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+REJECTED = "reject@example.com"
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: accepts every message except those to REJECTED"""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.reply("220 stand-in ESMTP")
+        envelope = {"to": []}
+        while True:
+            line = self.rfile.readline().decode().rstrip("\r\n")
+            if not line:
+                return
+            command = line.split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                self.reply("250 stand-in")
+            elif command == "MAIL":
+                envelope = {"to": []}
+                self.reply("250 OK")
+            elif command == "RCPT":
+                recipient = line.split(":", 1)[1].strip(" <>")
+                if recipient == REJECTED:
+                    self.reply("550 mailbox unavailable")
+                else:
+                    envelope["to"].append(recipient)
+                    self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.received.extend(envelope["to"])
+                self.reply("250 queued")
+            elif command in ("NOOP", "RSET"):
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInSMTPHandler)
+        self.received = []
+
+
+@pytest.fixture
+def smtp_server():
+    server = StandInSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def database():
+    mongodb_module.mongodb.database = mongomock_motor.AsyncMongoMockClient()["outbox_test"]
+    yield mongodb_module.mongodb.database
+    mongodb_module.mongodb.database = None
+
+
+def make_worker(server: StandInSMTPServer, max_attempts: int = 3) -> OutboxWorker:
+    pool = SMTPConnectionPool("127.0.0.1", server.server_address[1], use_tls=False, size=2, timeout=5)
+    return OutboxWorker(pool, batch_size=10, max_attempts=max_attempts, retry_base_seconds=0)
+
+
+def test_process_batch_delivers_and_logs(smtp_server, database):
+    async def scenario():
+        worker = make_worker(smtp_server)
+        for address in ("a@example.com", "b@example.com"):
+            await enqueue_email(address, "Hello", "<p>Hi</p>")
+        try:
+            claimed = await worker.process_batch()
+        finally:
+            await worker.pool.close()
+        return claimed
+
+    assert asyncio.run(scenario()) == 2
+    assert sorted(smtp_server.received) == ["a@example.com", "b@example.com"]
+
+    async def stored():
+        outbox = await database[OUTBOX_COLLECTION].find().to_list(length=None)
+        logs = await database[LOG_COLLECTION].find().to_list(length=None)
+        return outbox, logs
+
+    outbox, logs = asyncio.run(stored())
+    assert {doc["status"] for doc in outbox} == {"sent"}
+    assert sorted(log["to_email"] for log in logs) == ["a@example.com", "b@example.com"]
+    assert {log["status"] for log in logs} == {"sent"}
+
+
+def test_rejected_message_is_retried_then_failed(smtp_server, database):
+    async def scenario():
+        worker = make_worker(smtp_server, max_attempts=2)
+        await enqueue_email(REJECTED, "Hello", "<p>Hi</p>")
+        try:
+            await worker.process_batch()
+            first = await database[OUTBOX_COLLECTION].find_one({"to_email": REJECTED})
+            await worker.process_batch()
+            final = await database[OUTBOX_COLLECTION].find_one({"to_email": REJECTED})
+        finally:
+            await worker.pool.close()
+        logs = await database[LOG_COLLECTION].find().to_list(length=None)
+        return first, final, logs
+
+    first, final, logs = asyncio.run(scenario())
+    assert first["status"] == "pending" and first["attempts"] == 1
+    assert final["status"] == "failed" and final["attempts"] == 2
+    assert [log["status"] for log in logs] == ["failed"]
+    assert smtp_server.received == []
+
+
+def test_claims_do_not_overlap(smtp_server, database):
+    async def scenario():
+        first, second = make_worker(smtp_server), make_worker(smtp_server)
+        first.batch_size = second.batch_size = 3
+        for i in range(5):
+            await enqueue_email(f"user{i}@example.com", "Hello", "<p>Hi</p>")
+        return await first._claim(), await second._claim(), await first._claim()
+
+    claimed_first, claimed_second, claimed_again = asyncio.run(scenario())
+    assert len(claimed_first) == 3 and len(claimed_second) == 2 and claimed_again == []
+    emails = [doc["to_email"] for doc in claimed_first + claimed_second]
+    assert sorted(emails) == [f"user{i}@example.com" for i in range(5)]
+    assert all(doc["status"] == "sending" and doc["attempts"] == 1 for doc in claimed_first + claimed_second)